@@ -378,12 +378,7 @@ class CustomEventController(QObject):
         Returns:
             Dictionary representation of the event.
         """
-        return {
-            "name": event.name,
-            "color": event.color,
-            "shortcut": event.shortcut,
-            "description": event.description,
-        }
+        return event.to_dict()
 
     # ─── Shortcut suggestions ───
 
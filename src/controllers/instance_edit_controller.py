@@ -5,7 +5,6 @@ CHANGED: добавлена поддержка undo/redo для сессии р
 
 from __future__ import annotations
 
-import copy
 from typing import Optional, List, Tuple
 
 from PySide6.QtCore import QObject, Signal, QTimer
@@ -31,13 +30,15 @@ class _InstanceEditCommand(Command):
 
     def __init__(self, project, marker_idx: int,
                  old_marker: Marker, new_marker: Marker):
-        event_name = new_marker.event_name or "маркер"
-        super().__init__(f"Редактирование: {event_name}")
+        super().__init__()
         self._project = project
         self._idx = marker_idx
         self._old = old_marker
         self._new = new_marker
 
+    def _make_description(self) -> str:
+        return f"Редактирование: {self._new.event_name or 'маркер'}"
+
     def execute(self) -> None:
         if 0 <= self._idx < len(self._project.markers):
             self._project.update_marker(self._idx, self._new)
@@ -150,7 +151,7 @@ class InstanceEditController(QObject):
         self.current_marker_idx = current_idx
 
         # CHANGED: сохранить оригинальное состояние для undo
-        self._edit_original = copy.deepcopy(marker)
+        self._edit_original = marker.copy()
 
         self.seek_to_frame(marker.start_frame)
         self.timeline_range_changed.emit(marker.start_frame, marker.end_frame)
@@ -164,17 +165,12 @@ class InstanceEditController(QObject):
         """Найти текущий индекс редактируемого маркера в проекте."""
         if self.marker is None:
             return -1
-        markers = self.main_controller.project.markers
-        # Быстрая проверка по ссылке
-        try:
-            return markers.index(self.marker)
-        except ValueError:
-            pass
-        # Fallback: по id
-        for i, m in enumerate(markers):
-            if m.id == self.marker.id:
-                return i
-        return -1
+        project = self.main_controller.project
+        idx = project.index_of(self.marker)
+        if idx >= 0:
+            return idx
+        # Fallback: по id (маркер могли заменить копией)
+        return project.index_of_id(self.marker.id)
 
     def _has_marker_changed(self) -> bool:
         """Проверить, изменился ли маркер с начала сессии."""
@@ -205,7 +201,7 @@ class InstanceEditController(QObject):
             return
 
         # Копия текущего (уже изменённого) состояния
-        new_marker_copy = copy.deepcopy(self.marker)
+        new_marker_copy = self.marker.copy()
 
         cmd = _InstanceEditCommand(
             self.main_controller.project,
@@ -4,7 +4,7 @@ Main Controller - главный контроллер одного окна пр
 
 from __future__ import annotations
 
-from typing import Optional, List
+from typing import Callable, Optional, List, Tuple
 
 from PySide6.QtCore import QObject, Signal
 from PySide6.QtGui import QPixmap
@@ -13,7 +13,7 @@ from models.domain.project import Project
 from models.config.app_settings import AppSettings
 from services.video_engine import VideoService
 from services.history import HistoryManager, get_history_manager
-from services.serialization import ProjectIO
+from services.serialization import ProjectIO, get_project_writer
 
 from views.windows.main_window import MainWindow
 from views.windows.settings_dialog import SettingsDialog
@@ -38,7 +38,6 @@ except ImportError:
     from ..views.dialogs.save_changes_dialog import SaveChangesDialog
 
 
-
 class MainController(QObject):
     markers_changed = Signal()
     playback_time_changed = Signal(int)
@@ -52,12 +51,21 @@ class MainController(QObject):
         self.settings = AppSettings()
 
         # ─── Services ───
-        self.video_service = VideoService()
+        # Кадры сразу копируются в QImage (PlaybackController), поэтому
+        # буферы декодирования можно переиспользовать
+        self.video_service = VideoService(frame_pool_size=2)
         # CHANGED: используем singleton, чтобы main_window и контроллеры
         # разделяли один и тот же экземпляр (сигналы будут работать)
         self.history_manager = get_history_manager()
         self.project_io = ProjectIO()
 
+        # Ручное сохранение: снимок в GUI-потоке, запись архива — в общей
+        # очереди записи .hep (вместе с автосохранением). Последний
+        # отправленный запрос: (project, revision)
+        self._project_writer = get_project_writer()
+        self._project_writer.write_finished.connect(self._on_project_saved)
+        self._last_save_token: Optional[tuple] = None
+
         # ─── View ───
         self.main_window = MainWindow()
 
@@ -127,6 +135,8 @@ class MainController(QObject):
         # CHANGED: передать callback авто-сохранения
         if hasattr(self.main_window, "set_autosave_callback"):
             self.main_window.set_autosave_callback(self.save_project_silent)
+        if hasattr(self.main_window, "set_autosave_prepare_callback"):
+            self.main_window.set_autosave_prepare_callback(self.prepare_autosave)
 
         if self.autosave_manager:
             self.autosave_manager.start()
@@ -260,6 +270,12 @@ class MainController(QObject):
         if self.autosave_manager:
             self.autosave_manager.stop()
 
+        # Дождаться фоновой записи проекта, начатой ручным сохранением
+        if self._last_save_token is not None:
+            self._project_writer.wait_for_done()
+
+        self.playback_controller.cleanup()
+
         if self._instance_edit_controller:
             self._instance_edit_controller.cleanup()
         if self._settings_controller:
@@ -401,15 +417,14 @@ class MainController(QObject):
             self.playback_controller.speed = speed
 
     def get_video_width(self) -> int:
+        # Размеры читаются из VideoCapture один раз при load_video
         if self.video_service and self.video_service.cap:
-            import cv2
-            return int(self.video_service.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            return self.video_service.get_resolution()[0]
         return 0
 
     def get_video_height(self) -> int:
         if self.video_service and self.video_service.cap:
-            import cv2
-            return int(self.video_service.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            return self.video_service.get_resolution()[1]
         return 0
 
     # ─────────────────────────────────────────────────────────────────────────
@@ -513,28 +528,54 @@ class MainController(QObject):
     def _on_save_project(self) -> None:
         from PySide6.QtWidgets import QFileDialog
 
-        success = False
-
-        if getattr(self.project, "file_path", None):
-            success = self.project_controller.save_project(self.project.file_path)
-        else:
+        file_path = getattr(self.project, "file_path", None)
+        if not file_path:
             file_path, _ = QFileDialog.getSaveFileName(
                 self.main_window, "Сохранить проект", "project.hep",
                 "Файлы проекта (*.hep);;Все файлы (*)"
             )
-            if file_path:
-                if not file_path.endswith(".hep"):
-                    file_path += ".hep"
-                success = self.project_controller.save_project(file_path)
-                if success:
-                    self.project.file_path = file_path
+            if not file_path:
+                return
+            if not file_path.endswith(".hep"):
+                file_path += ".hep"
+
+        self._start_background_save(file_path)
+
+    def _start_background_save(self, file_path: str) -> None:
+        """Снять снимок проекта и поставить запись .hep в очередь записи.
+
+        Очередь пишет снимки одного пути строго по порядку, а ещё не
+        начатый старый снимок заменяется новым — более старый снимок
+        (в том числе автосохранения) не перезапишет более новый.
+        """
+        write_job = self.project_controller.prepare_save(file_path)
+        if write_job is None:
+            if hasattr(self.main_window, "show_toast_error"):
+                self.main_window.show_toast_error("Не удалось сохранить проект")
+            return
+
+        token = (self.project, self.project.revision)
+        self._last_save_token = token
+        self._project_writer.submit(file_path, write_job, self, token)
+
+    def _on_project_saved(self, file_path: str, success: bool, owner, token) -> None:
+        # Результат нужен только для последнего запроса этого окна:
+        # более ранние либо заменены им, либо уже перекрыты им на диске
+        if owner is not self or token is not self._last_save_token:
+            return
+        self._last_save_token = None
+        project, revision = token
 
         # CHANGED: toast + mark_saved после сохранения
-        if success:
-            self.history_manager.mark_saved()
+        if success and project is self.project:
+            project.file_path = file_path
+            # Правки, сделанные во время записи, в файл не попали
+            if project.revision == revision:
+                project.is_modified = False
+                self.history_manager.mark_saved()
             if hasattr(self.main_window, "show_toast_success"):
                 self.main_window.show_toast_success("Проект сохранён")
-        elif hasattr(self.main_window, "show_toast_error"):
+        elif not success and hasattr(self.main_window, "show_toast_error"):
             self.main_window.show_toast_error("Не удалось сохранить проект")
 
     def _on_load_project(self) -> None:
@@ -593,10 +634,8 @@ class MainController(QObject):
         self.project = Project(name="Untitled")
         self.project_controller.current_project = self.project
         self.timeline_controller.set_project(self.project)
-        self.playback_controller.pause()
+        self.playback_controller.unload_video()
         self.video_service.cleanup()
-        self.playback_controller.current_frame = 0
-        self.playback_controller.playing = False
         self.main_window.set_video_image(QPixmap())
         # Сбросить progress bar
         progress_bar = self.main_window.get_progress_bar()
@@ -733,6 +772,21 @@ class MainController(QObject):
             print(f"Auto-save error: {e}")
             return False
 
+    def prepare_autosave(self) -> Optional[Tuple[str, Callable[[], bool]]]:
+        """Снимок проекта для фонового авто-сохранения.
+
+        Возвращает (путь, задача записи) или None, если сохранять некуда
+        или в этот файл уже идёт ручное сохранение.
+        """
+        file_path = getattr(self.project, "file_path", None)
+        if not file_path:
+            return None
+        if self._project_writer.is_writing(file_path, self):
+            return None
+        # Автосохранение частое — без сжатия, ручное сохранение сожмёт
+        write_job = self.project_controller.prepare_save(file_path, compress=False)
+        return (file_path, write_job) if write_job is not None else None
+
     # ─────────────────────────────────────────────────────────────────────────
     # App lifecycle
     # ─────────────────────────────────────────────────────────────────────────
@@ -748,4 +802,8 @@ class MainController(QObject):
             if hasattr(self.main_window, "window_closing"):
                 self.main_window.window_closing.disconnect(self._on_window_closing)
         except Exception:
-            pass
\ No newline at end of file
+            pass
+        try:
+            self._project_writer.write_finished.disconnect(self._on_project_saved)
+        except Exception:
+            pass
@@ -1,25 +1,47 @@
 from __future__ import annotations
 
+import time
 from collections import OrderedDict
 from typing import TYPE_CHECKING, Optional
 
-import cv2
 import numpy as np
 
-from PySide6.QtCore import QObject, QTimer, Signal, Qt
+from PySide6.QtCore import QObject, QTimer, QElapsedTimer, Signal, Qt, SIGNAL
 from PySide6.QtGui import QPixmap, QImage
 
+from services.video_engine.seek_worker import FrameSeekWorker
+
 if TYPE_CHECKING:
     from services.video_engine import VideoService
     from views.widgets.player_controls import PlayerControls
 
 
 class PlaybackController(QObject):
-    """Контроллер управления воспроизведением видео."""
+    """Контроллер управления воспроизведением видео.
+
+    Пейсинг воспроизведения: следующий кадр подаётся только после того,
+    как предыдущий был отрисован виджетом (ScalableVideoLabel.frame_presented).
+    Если тик таймера пришёл, пока кадр ещё «в полёте», тик паркуется
+    и выполняется сразу после отрисовки — очередь кадров не копится,
+    задержка ограничена одним кадром.
+    """
 
     frame_changed = Signal(int)
     pixmap_changed = Signal(QPixmap, int)  # pixmap, frame_idx
 
+    # Сколько интервалов ждать отрисовки, прежде чем считать кадр потерянным
+    # (окно свёрнуто / перекрыто и paintEvent не приходит)
+    MAX_FLIGHT_INTERVALS = 4
+
+    # Максимум кадров за один тик при догонянии часов воспроизведения;
+    # при большем отставании точка отсчёта сдвигается (без лавины тиков)
+    MAX_CATCHUP_FRAMES = 4
+
+    # Во время воспроизведения позиция (frame_changed, слайдер, время)
+    # публикуется не чаще частоты обновления экрана: на скоростях 2x-4x
+    # тики идут чаще, чем экран успевает показать перерисовку таймлайна
+    UI_REFRESH_MS = 16
+
     def __init__(self, video_service: "VideoService", player_controls: "PlayerControls", main_window):
         super().__init__()
 
@@ -28,26 +50,64 @@ class PlaybackController(QObject):
         self.main_window = main_window
 
         self.playback_timer = QTimer(self)
+        self.playback_timer.setSingleShot(True)
+        # Точный таймер: грубый (по умолчанию) допускает ошибку до 5%
+        self.playback_timer.setTimerType(Qt.TimerType.PreciseTimer)
         self.playback_timer.timeout.connect(self._on_playback_tick)
+        self._interval_ms = 33
+        # Пейсинг по монотонным часам: тики планируются к дедлайнам,
+        # время декодирования и округление до мс не накапливаются
+        self._interval_s = 0.033
+        self._next_deadline = 0.0
+        # Величины тика, вычисляемые один раз при старте/смене скорости
+        # (а не на каждом тике через video_service)
+        self._frames_per_ms = 0.0
+        self._flight_limit_ms = self._interval_ms * self.MAX_FLIGHT_INTERVALS
+        self._last_frame = -1
+
+        # Пейсинг: кадр отправлен в виджет, но ещё не отрисован
+        self._frame_in_flight = False
+        self._tick_pending = False
+        self._flight_clock = QElapsedTimer()
+
+        # Часы воспроизведения: позиция считается от момента старта
+        # (кадр = start + прошедшее время * fps * speed), поэтому
+        # задержки GUI-потока не теряют кадры, а догоняются
+        self._play_clock = QElapsedTimer()
+        self._play_start_frame = 0
+
+        self._ui_update_timer = QTimer(self)
+        self._ui_update_timer.setSingleShot(True)
+        self._ui_update_timer.timeout.connect(self._flush_ui_update)
 
         self.seek_update_timer = QTimer(self)
         self.seek_update_timer.setSingleShot(True)
         self.seek_update_timer.timeout.connect(self._display_current_frame)
 
+        # Скраббинг на паузе: seek + декодирование в фоновом потоке
+        self._seek_worker = FrameSeekWorker(self)
+        self._seek_worker.frame_ready.connect(self._on_seek_frame_ready)
+
         self.playing = False
         self.current_frame = 0
         self._speed = 1.0
 
-        self._last_pixmap: Optional[QPixmap] = None
-        self._last_pixmap_frame: Optional[int] = None
+        self._last_image: Optional[QImage] = None
+        self._last_image_frame: Optional[int] = None
 
-        # LRU cache: key=(frame_idx, target_width, quality_flag) -> QPixmap
+        # LRU cache: key=(frame_idx, target_width, quality_flag) -> QImage.
+        # Кадры хранятся как QImage и рисуются напрямую; QPixmap создаётся
+        # только для внешних подписчиков (превью, редактор сегмента).
         self.cache_size = 100
-        self.frame_cache: "OrderedDict[tuple, QPixmap]" = OrderedDict()
+        self.frame_cache: "OrderedDict[tuple, QImage]" = OrderedDict()
 
         self.target_width = 800
         self.use_high_quality_scaling = False
 
+        video_label = getattr(self.main_window, "video_label", None)
+        if video_label is not None and hasattr(video_label, "frame_presented"):
+            video_label.frame_presented.connect(self._on_frame_presented)
+
         self.player_controls.playClicked.connect(self._on_play_clicked)
         self.player_controls.speedChanged.connect(self._on_speed_changed)
         self.player_controls.speedStepChanged.connect(self._on_speed_step_changed)
@@ -66,6 +126,7 @@ class PlaybackController(QObject):
 
             self.current_frame = 0
             self._clear_cache()
+            self._seek_worker.set_video(video_path)
             self._display_current_frame()
 
             self.pause()
@@ -80,11 +141,19 @@ class PlaybackController(QObject):
             return
 
         self.playing = True
+        self._set_fast_scaling(True)
         self._restart_timer_for_speed()
 
     def pause(self) -> None:
         self.playing = False
         self.playback_timer.stop()
+        if self._ui_update_timer.isActive():
+            # Последняя позиция воспроизведения не должна потеряться
+            self._ui_update_timer.stop()
+            self._flush_ui_update()
+        self._frame_in_flight = False
+        self._tick_pending = False
+        self._set_fast_scaling(False)
 
     def toggle_play_pause(self) -> None:
         self.pause() if self.playing else self.play()
@@ -98,7 +167,18 @@ class PlaybackController(QObject):
 
         if self.seek_update_timer.isActive():
             self.seek_update_timer.stop()
-        self.seek_update_timer.start(30)
+
+        if self.playing:
+            self._reset_play_clock()
+            self.seek_update_timer.start(30)
+        else:
+            cached = self._get_cached_image(frame_idx)
+            if cached is not None:
+                # Возврат к недавно показанному кадру — без seek и декодирования
+                self._show_image(cached, frame_idx)
+            else:
+                # Декодирование в фоне; промежуточные позиции перезаписываются
+                self._seek_worker.request_seek(frame_idx)
 
         self._update_time_display()  # ← ДОБАВИТЬ
         self.frame_changed.emit(self.current_frame)
@@ -109,21 +189,34 @@ class PlaybackController(QObject):
 
         if self.seek_update_timer.isActive():
             self.seek_update_timer.stop()
+        if self.playing:
+            self._reset_play_clock()
 
         self._display_current_frame()
         self.frame_changed.emit(self.current_frame)
 
-    def get_cached_pixmap(self, frame_idx: int) -> Optional[QPixmap]:
-        if self._last_pixmap_frame == frame_idx and self._last_pixmap is not None:
-            return self._last_pixmap
+    def unload_video(self) -> None:
+        """Сбросить состояние после закрытия видео (например, новый проект).
 
-        # Try cache by any quality mode that matches current settings
-        key = self._cache_key(frame_idx)
-        pix = self.frame_cache.get(key)
-        if pix is not None:
-            # refresh LRU
-            self.frame_cache.move_to_end(key)
-        return pix
+        set_video(None) закрывает захват фонового seek и увеличивает
+        поколение запросов — запоздавший кадр старого видео отбросится;
+        кэш кадров очищается, чтобы перерисовка не показала старое видео.
+        """
+        self.pause()
+        if self.seek_update_timer.isActive():
+            self.seek_update_timer.stop()
+        self._seek_worker.set_video(None)
+        self._clear_cache()
+        self.current_frame = 0
+
+    def cleanup(self) -> None:
+        """Остановить воспроизведение и фоновый поток seek."""
+        self.pause()
+        self._seek_worker.stop()
+
+    def get_cached_pixmap(self, frame_idx: int) -> Optional[QPixmap]:
+        image = self._get_cached_image(frame_idx)
+        return QPixmap.fromImage(image) if image is not None else None
 
     # ─── Internals ───
 
@@ -135,8 +228,47 @@ class PlaybackController(QObject):
 
     def _restart_timer_for_speed(self) -> None:
         fps = self.video_service.get_fps()
-        interval_ms = int(1000 / (fps * self._speed)) if fps > 0 else 33
-        self.playback_timer.start(max(1, interval_ms))
+        self._interval_s = 1.0 / (fps * self._speed) if fps > 0 else 0.033
+        self._interval_ms = max(1, int(self._interval_s * 1000))
+        self._frames_per_ms = fps * self._speed / 1000 if fps > 0 else 0.0
+        self._flight_limit_ms = self._interval_ms * self.MAX_FLIGHT_INTERVALS
+        self._last_frame = self.video_service.get_total_frames() - 1
+        self._next_deadline = time.monotonic()
+        self._reset_play_clock()
+        self._schedule_next_tick()
+
+    def _reset_play_clock(self) -> None:
+        """Новая точка отсчёта: старт, смена скорости, seek."""
+        self._play_clock.start()
+        self._play_start_frame = self.current_frame
+
+    def _frames_due(self) -> int:
+        """Сколько кадров продвинуть на этом тике (1..MAX_CATCHUP_FRAMES)."""
+        if self._frames_per_ms <= 0 or not self._play_clock.isValid():
+            return 1
+        target = self._play_start_frame + int(
+            self._play_clock.elapsed() * self._frames_per_ms
+        )
+        delta = target - self.current_frame
+        if delta > self.MAX_CATCHUP_FRAMES:
+            # Отстали слишком сильно — не гонимся: отсчёт заново
+            # от кадра, на который перейдём сейчас
+            self._reset_play_clock()
+            self._play_start_frame += self.MAX_CATCHUP_FRAMES
+            return self.MAX_CATCHUP_FRAMES
+        return max(1, delta)
+
+    def _schedule_next_tick(self) -> None:
+        """Запланировать тик к следующему дедлайну (next += interval)."""
+        self._next_deadline += self._interval_s
+        now = time.monotonic()
+        dt = self._next_deadline - now
+        if dt > 0.001:
+            self.playback_timer.start(int(dt * 1000))
+        else:
+            # Отстали — не догоняем пачкой тиков, отсчёт с текущего момента
+            self._next_deadline = now
+            self.playback_timer.start(0)
 
     def _on_play_clicked(self) -> None:
         self.toggle_play_pause()
@@ -160,15 +292,37 @@ class PlaybackController(QObject):
         if not self.playing:
             return
 
-        self.current_frame = self._clamp_frame(self.current_frame + 1)
+        # Таймер одноразовый: следующий тик планируем сразу к дедлайну,
+        # чтобы сохранить темп независимо от длительности декодирования
+        self._schedule_next_tick()
 
-        total_frames = self.video_service.get_total_frames()
-        if total_frames > 0 and self.current_frame >= total_frames - 1:
+        if self._frame_in_flight and self._flight_clock.elapsed() < self._flight_limit_ms:
+            # Предыдущий кадр ещё не отрисован — паркуем тик (newest wins)
+            self._tick_pending = True
+            return
+        self._tick_pending = False
+
+        # Сразу на нужный кадр: промежуточные не декодируются
+        # (VideoService пропускает короткий разрыв через grab())
+        frame = self.current_frame + self._frames_due()
+        last_frame = self._last_frame
+        at_end = last_frame >= 0 and frame >= last_frame
+        self.current_frame = last_frame if at_end else frame
+
+        self._display_current_frame()
+        self._schedule_ui_update()
+
+        if at_end:
             self.pause()
 
+    def _schedule_ui_update(self) -> None:
+        """Отложить публикацию позиции до ближайшего обновления экрана."""
+        if not self._ui_update_timer.isActive():
+            self._ui_update_timer.start(self.UI_REFRESH_MS)
+
+    def _flush_ui_update(self) -> None:
         self.player_controls.set_current_frame(self.current_frame)
-        self._display_current_frame()
-        self._update_time_display()  # ← ДОБАВИТЬ
+        self._update_time_display()
         self.frame_changed.emit(self.current_frame)
 
     def _display_current_frame(self) -> None:
@@ -176,63 +330,124 @@ class PlaybackController(QObject):
             frame_idx = self._clamp_frame(self.current_frame)
             self.current_frame = frame_idx
 
-            frame = self.video_service.get_frame(frame_idx)
-            if frame is None:
-                return
-
-            pixmap = self._numpy_to_pixmap(frame, frame_idx)
-
-            self.main_window.set_video_image(pixmap)
+            image = self._get_cached_image(frame_idx)
+            if image is None:
+                frame = self.video_service.get_frame(frame_idx)
+                if frame is None:
+                    return
+                image = self._numpy_to_image(frame, frame_idx)
 
-            self._last_pixmap = pixmap
-            self._last_pixmap_frame = frame_idx
-            self.pixmap_changed.emit(pixmap, frame_idx)
+            self._show_image(image, frame_idx)
 
-            self._update_time_display()  # ← ДОБАВИТЬ
+        except Exception as e:
+            print(f"Error displaying frame: {e}")
 
+    def _on_seek_frame_ready(self) -> None:
+        """Кадр от FrameSeekWorker (GUI-поток)."""
+        result = self._seek_worker.take_frame()
+        if result is None:
+            return
+        frame_idx, frame, generation = result
+        # Устаревший кадр: после него был новый запрос (в т.ч. смена видео),
+        # позиция уже ушла дальше или идёт воспроизведение
+        if (self.playing or frame_idx != self.current_frame
+                or not self._seek_worker.is_current(generation)):
+            return
+        try:
+            self._show_image(self._numpy_to_image(frame, frame_idx), frame_idx)
         except Exception as e:
             print(f"Error displaying frame: {e}")
 
+    def _show_image(self, image: QImage, frame_idx: int) -> None:
+        self.main_window.set_video_image(image)
+        if self.playing:
+            self._frame_in_flight = True
+            self._flight_clock.start()
+
+        self._last_image = image
+        self._last_image_frame = frame_idx
+        if self._has_pixmap_listeners():
+            self.pixmap_changed.emit(QPixmap.fromImage(image), frame_idx)
+
+        # При воспроизведении время обновляет _flush_ui_update()
+        if not self.playing:
+            self._update_time_display()
+
+    def _set_fast_scaling(self, enabled: bool) -> None:
+        """Быстрое масштабирование в виджете на время воспроизведения."""
+        video_label = getattr(self.main_window, "video_label", None)
+        if video_label is not None and hasattr(video_label, "set_fast_scaling"):
+            video_label.set_fast_scaling(enabled)
+
+    def _on_frame_presented(self) -> None:
+        """Кадр отрисован — выполнить отложенный тик, если он был."""
+        if not self._frame_in_flight:
+            return
+        self._frame_in_flight = False
+        if self._tick_pending and self.playing:
+            self._tick_pending = False
+            # Запланированный дедлайн остаётся в силе: внеочередной тик
+            # не должен сдвигать его ещё на интервал
+            self._next_deadline -= self._interval_s
+            self.playback_timer.start(0)
+
     def _cache_key(self, frame_idx: int) -> tuple:
         # include scaling params; if you change target_width or quality, cache must differ
         quality = self.use_high_quality_scaling or self._speed <= 1.0
         return (frame_idx, self.target_width, quality)
 
-    def _numpy_to_pixmap(self, frame: np.ndarray, frame_idx: int) -> QPixmap:
+    def _get_cached_image(self, frame_idx: int) -> Optional[QImage]:
+        if self._last_image_frame == frame_idx and self._last_image is not None:
+            return self._last_image
+
+        # Try cache by any quality mode that matches current settings
+        key = self._cache_key(frame_idx)
+        image = self.frame_cache.get(key)
+        if image is not None:
+            # refresh LRU
+            self.frame_cache.move_to_end(key)
+        return image
+
+    def _has_pixmap_listeners(self) -> bool:
+        """Есть ли подписчики pixmap_changed (иначе QPixmap не создаём)."""
+        return self.receivers(SIGNAL("pixmap_changed(QPixmap,int)")) > 0
+
+    def _numpy_to_image(self, frame: np.ndarray, frame_idx: int) -> QImage:
         key = self._cache_key(frame_idx)
         cached = self.frame_cache.get(key)
         if cached is not None:
             self.frame_cache.move_to_end(key)
             return cached
 
-        # BGR -> RGB
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        h, w, ch = frame_rgb.shape
-        bytes_per_line = ch * w
-
-        # Safe QImage
-        image = QImage(frame_rgb.data, w, h, bytes_per_line, QImage.Format.Format_RGB888).copy()
-        pixmap = QPixmap.fromImage(image)
+        # Qt читает BGR напрямую — без cvtColor и промежуточного буфера.
+        # Обёртка ссылается на память кадра, поэтому ниже делаем копию.
+        h, w = frame.shape[:2]
+        image = QImage(frame.data, w, h, frame.strides[0], QImage.Format.Format_BGR888)
 
         quality_mode = Qt.TransformationMode.SmoothTransformation \
             if (self.use_high_quality_scaling or self._speed <= 1.0) \
             else Qt.TransformationMode.FastTransformation
 
-        pixmap = pixmap.scaledToWidth(self.target_width, quality_mode)
+        # scaledToWidth возвращает независимую копию; при совпадении
+        # ширины Qt отдал бы ссылку на память кадра, поэтому копируем явно
+        if image.width() == self.target_width:
+            scaled = image.copy()
+        else:
+            scaled = image.scaledToWidth(self.target_width, quality_mode)
 
-        self._lru_put(key, pixmap)
-        return pixmap
+        self._lru_put(key, scaled)
+        return scaled
 
-    def _lru_put(self, key: tuple, pixmap: QPixmap) -> None:
-        self.frame_cache[key] = pixmap
+    def _lru_put(self, key: tuple, image: QImage) -> None:
+        self.frame_cache[key] = image
         self.frame_cache.move_to_end(key)
         while len(self.frame_cache) > self.cache_size:
             self.frame_cache.popitem(last=False)
 
     def _clear_cache(self) -> None:
         self.frame_cache.clear()
-        self._last_pixmap = None
-        self._last_pixmap_frame = None
+        self._last_image = None
+        self._last_image_frame = None
 
     def _update_time_display(self) -> None:
         """Обновить отображение времени в PlayerControls."""
@@ -7,7 +7,8 @@ from __future__ import annotations
 
 import os
 import re
-from typing import Optional, List, Set, Tuple, TYPE_CHECKING
+from contextlib import contextmanager
+from typing import Iterator, Optional, List, Set, Tuple, TYPE_CHECKING
 
 from PySide6.QtCore import QObject, Signal, QTimer
 from PySide6.QtGui import QColor, QPixmap
@@ -19,6 +20,9 @@ if TYPE_CHECKING:
     from views.widgets.drawing_overlay import DrawingOverlay
 
 
+_UNSAFE_FILENAME_CHARS = re.compile(r'[\\/:*?"<>|]+')
+
+
 class PreviewController(QObject):
     """Контроллер окна предпросмотра."""
 
@@ -54,6 +58,9 @@ class PreviewController(QObject):
         self.filter_event_types: Set[str] = set()
         self.filter_has_notes: bool = False
         self.filter_notes_search: str = ""
+        # Групповое изменение фильтров: одно filters_changed в конце
+        self._filters_batch_depth = 0
+        self._filters_batch_dirty = False
 
         # ── Drawing ──
         self.drawing_tool: str = "cursor"
@@ -320,24 +327,49 @@ class PreviewController(QObject):
     # ═══════════════════════════════════════════════════════════════════════
 
     def set_event_type_filter(self, event_types: Set[str]) -> None:
+        if self.filter_event_types == event_types:
+            return
         self.filter_event_types = event_types.copy()
-        self.filters_changed.emit()
-        self._emit_counter()
+        self._on_filters_updated()
 
     def set_notes_filter(self, has_notes: bool) -> None:
+        if self.filter_has_notes == has_notes:
+            return
         self.filter_has_notes = has_notes
-        self.filters_changed.emit()
-        self._emit_counter()
+        self._on_filters_updated()
 
     def set_notes_search(self, text: str) -> None:
-        self.filter_notes_search = (text or "").lower().strip()
-        self.filters_changed.emit()
-        self._emit_counter()
+        text = (text or "").lower().strip()
+        if self.filter_notes_search == text:
+            return
+        self.filter_notes_search = text
+        self._on_filters_updated()
 
     def reset_filters(self) -> None:
+        if not (self.filter_event_types or self.filter_has_notes
+                or self.filter_notes_search):
+            return
         self.filter_event_types.clear()
         self.filter_has_notes = False
         self.filter_notes_search = ""
+        self._on_filters_updated()
+
+    @contextmanager
+    def batch_filters(self) -> Iterator["PreviewController"]:
+        """Несколько изменений фильтров — одно обновление списка."""
+        self._filters_batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._filters_batch_depth -= 1
+            if self._filters_batch_depth == 0 and self._filters_batch_dirty:
+                self._filters_batch_dirty = False
+                self._on_filters_updated()
+
+    def _on_filters_updated(self) -> None:
+        if self._filters_batch_depth:
+            self._filters_batch_dirty = True
+            return
         self.filters_changed.emit()
         self._emit_counter()
 
@@ -400,7 +432,7 @@ class PreviewController(QObject):
         """Предложить имя файла для скриншота."""
         marker = self.get_current_marker()
         name = marker.event_name if marker else "frame"
-        name = re.sub(r'[\\/:*?"<>|]+', "_", name)
+        name = _UNSAFE_FILENAME_CHARS.sub("_", name)
         return f"screenshot_{name}_{self.current_frame}.png"
 
     # ═══════════════════════════════════════════════════════════════════════
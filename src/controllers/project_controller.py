@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import Optional
+from functools import partial
+from typing import Callable, Optional
 
 from models.domain.project import Project
-from services.serialization import ProjectIO
+from services.serialization import ProjectIO, get_project_writer
 
 
 class ProjectController:
@@ -23,17 +24,36 @@ class ProjectController:
         if not self.current_project:
             return False
 
-        try:
-            success = self.project_io.save_project(self.current_project, filepath)
-        except Exception as e:
-            print(f"Save project failed: {e}")
+        # Через общую очередь записи: дождаться фоновых сохранений этого
+        # файла, иначе более старый снимок мог бы лечь поверх этого
+        write_job = self.prepare_save(filepath)
+        if write_job is None:
             return False
+        success = get_project_writer().write_now(filepath, write_job)
 
         if success:
             self.current_project.file_path = filepath
             self.current_project.is_modified = False
         return success
 
+    def prepare_save(self, filepath: str,
+                     compress: bool = True) -> Optional[Callable[[], bool]]:
+        """Снять снимок проекта и вернуть задачу записи для фонового потока.
+
+        Сериализация выполняется здесь (в GUI-потоке), задача только
+        пишет готовые байты на диск.
+        """
+        if not self.current_project:
+            return None
+
+        try:
+            payload = self.project_io.snapshot_project(self.current_project)
+        except Exception as e:
+            print(f"Save project failed: {e}")
+            return None
+
+        return partial(self.project_io.write_snapshot, payload, filepath, compress)
+
     def load_project(self, filepath: str) -> Optional[Project]:
         try:
             project = self.project_io.load_project(filepath)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import replace
+from functools import partial
 from typing import Optional, Dict
 
 from PySide6.QtCore import QObject, Signal, Qt
@@ -24,6 +26,22 @@ class ShortcutController(QObject):
         "SPACE", "CTRL+O", "ESCAPE", "CTRL+Z", "CTRL+SHIFT+Z", "LEFT", "RIGHT", "DELETE"
     }
 
+    # (name, key sequence) — порядок регистрации глобальных шорткатов
+    GLOBAL_SHORTCUTS = (
+        # Playback
+        ("PLAY_PAUSE", "Space"),
+        ("OPEN_VIDEO", "Ctrl+O"),
+        ("CANCEL", "Escape"),
+        # Undo/Redo
+        ("UNDO", "Ctrl+Z"),
+        ("REDO", "Ctrl+Shift+Z"),
+        # Seek
+        ("SKIP_LEFT", "Left"),
+        ("SKIP_RIGHT", "Right"),
+        # Delete
+        ("DELETE", "Delete"),
+    )
+
     def __init__(self, parent_window: Optional[QObject] = None) -> None:
         super().__init__(parent_window)
 
@@ -32,25 +50,40 @@ class ShortcutController(QObject):
         self.event_manager = get_custom_event_manager()
 
         self.event_shortcuts: Dict[str, QShortcut] = {}
-
+        # Текущая клавиша по событию — читается при срабатывании, поэтому
+        # смена клавиши не требует пересоздания QShortcut
+        self._event_keys: Dict[str, str] = {}
+        # Точечный сигнал уже перепривязал клавишу — полная пересборка
+        # на следующем events_changed не нужна
+        self._delta_applied = False
+
+        self.event_manager.event_added.connect(self._on_event_added)
+        self.event_manager.event_updated.connect(self._on_event_updated)
+        self.event_manager.event_deleted.connect(self._on_event_deleted)
         self.event_manager.events_changed.connect(self._on_events_changed)
         self._setup_shortcuts()
 
     # ─── Setup ────────────────────────────────────────────────────────────────
 
     def _setup_shortcuts(self) -> None:
+        # Глобальные шорткаты не зависят от событий — создаются один раз,
+        # полная пересборка касается только клавиш событий
         self._clear_event_shortcuts()
-        self._clear_global_shortcuts()
         self._setup_event_shortcuts()
         self._setup_global_shortcuts()
 
     def _clear_event_shortcuts(self) -> None:
         for shortcut in self.event_shortcuts.values():
-            if shortcut:
-                shortcut.setEnabled(False)
-                shortcut.setParent(None)
-                shortcut.deleteLater()
+            self._dispose_shortcut(shortcut)
         self.event_shortcuts.clear()
+        self._event_keys.clear()
+
+    @staticmethod
+    def _dispose_shortcut(shortcut: Optional[QShortcut]) -> None:
+        if shortcut:
+            shortcut.setEnabled(False)
+            shortcut.setParent(None)
+            shortcut.deleteLater()
 
     def _clear_global_shortcuts(self) -> None:
         # depends on ShortcutManager implementation, but typical pattern:
@@ -62,59 +95,70 @@ class ShortcutController(QObject):
         logger.debug("Setting up event shortcuts. Events count=%d", len(all_events))
 
         for event in all_events:
-            if not event.shortcut:
-                continue
+            self._bind_event_shortcut(event)
 
-            event_name = event.name
-            key_seq = event.shortcut.upper()
+    def _bind_event_shortcut(self, event) -> None:
+        if not event.shortcut:
+            return
 
-            # Optional: prevent conflict with reserved globals
-            if key_seq.upper() in self.RESERVED_GLOBALS:
-                logger.warning("Event '%s' uses reserved global shortcut '%s' - skipped", event_name, key_seq)
-                continue
+        event_name = event.name
+        key_seq = event.shortcut_upper
+
+        # Optional: prevent conflict with reserved globals
+        if key_seq in self.RESERVED_GLOBALS:
+            logger.warning("Event '%s' uses reserved global shortcut '%s' - skipped", event_name, key_seq)
+            return
 
+        sc = self.event_shortcuts.get(event_name)
+        if sc is not None:
+            # Та же привязка с новой клавишей — один вызов setKey()
+            sc.setKey(QKeySequence(key_seq))
+        else:
             sc = QShortcut(QKeySequence(key_seq), self.parent_window)
             # If you need application-wide shortcuts, you can change context:
             # sc.setContext(Qt.ApplicationShortcut)
             sc.setContext(Qt.WidgetWithChildrenShortcut)
 
             sc.activated.connect(
-                lambda name=event_name, key=key_seq: self._on_event_shortcut_activated(name, key)
+                partial(self._on_event_shortcut_activated, event_name)
             )
-
             self.event_shortcuts[event_name] = sc
-            logger.debug("Bound event shortcut: %s -> %s", event_name, key_seq)
 
-    def _setup_global_shortcuts(self) -> None:
-        # Playback
-        self.shortcut_manager.register_shortcut("PLAY_PAUSE", "Space",
-            lambda: self._on_global_shortcut_activated("PLAY_PAUSE"))
-        self.shortcut_manager.register_shortcut("OPEN_VIDEO", "Ctrl+O",
-            lambda: self._on_global_shortcut_activated("OPEN_VIDEO"))
-        self.shortcut_manager.register_shortcut("CANCEL", "Escape",
-            lambda: self._on_global_shortcut_activated("CANCEL"))
+        self._event_keys[event_name] = key_seq
+        logger.debug("Bound event shortcut: %s -> %s", event_name, key_seq)
+
+    def _unbind_event_shortcut(self, name: str) -> None:
+        self._dispose_shortcut(self.event_shortcuts.pop(name, None))
+        self._event_keys.pop(name, None)
+
+    def _rebind_event_shortcut(self, old_name: str, new_name: str) -> None:
+        if old_name != new_name:
+            self._unbind_event_shortcut(old_name)
+        event = self.event_manager.get_event(new_name)
+        if event is not None and event.shortcut and \
+                event.shortcut_upper not in self.RESERVED_GLOBALS:
+            # Существующий QShortcut перенастраивается на месте
+            self._bind_event_shortcut(event)
+        else:
+            self._unbind_event_shortcut(new_name)
+        self._delta_applied = True
 
-        # Undo/Redo
-        self.shortcut_manager.register_shortcut("UNDO", "Ctrl+Z",
-            lambda: self._on_global_shortcut_activated("UNDO"))
-        self.shortcut_manager.register_shortcut("REDO", "Ctrl+Shift+Z",
-            lambda: self._on_global_shortcut_activated("REDO"))
-
-        # Seek
-        self.shortcut_manager.register_shortcut("SKIP_LEFT", "Left",
-            lambda: self._on_global_shortcut_activated("SKIP_LEFT"))
-        self.shortcut_manager.register_shortcut("SKIP_RIGHT", "Right",
-            lambda: self._on_global_shortcut_activated("SKIP_RIGHT"))
-
-        # Delete
-        self.shortcut_manager.register_shortcut("DELETE", "Delete",
-            lambda: self._on_global_shortcut_activated("DELETE"))
+    def _setup_global_shortcuts(self) -> None:
+        for name, key_sequence in self.GLOBAL_SHORTCUTS:
+            if self.shortcut_manager.get_shortcut(name) is not None:
+                continue
+            self.shortcut_manager.register_shortcut(
+                name, key_sequence, partial(self._on_global_shortcut_activated, name)
+            )
 
         logger.debug("Global shortcuts set up")
 
     # ─── Handlers ──────────────────────────────────────────────────────────────
 
-    def _on_event_shortcut_activated(self, event_name: str, key: str) -> None:
+    def _on_event_shortcut_activated(self, event_name: str) -> None:
+        key = self._event_keys.get(event_name)
+        if key is None:
+            return
         logger.debug("Event shortcut activated: event=%s key=%s", event_name, key)
         # сохраняем текущее поведение: наружу отдаём key, а не event_name
         self.shortcut_pressed.emit(key)
@@ -123,7 +167,20 @@ class ShortcutController(QObject):
         logger.debug("Global shortcut activated: key=%s", key)
         self.shortcut_pressed.emit(key)
 
+    def _on_event_added(self, name: str) -> None:
+        self._rebind_event_shortcut(name, name)
+
+    def _on_event_updated(self, old_name: str, new_name: str) -> None:
+        self._rebind_event_shortcut(old_name, new_name)
+
+    def _on_event_deleted(self, name: str) -> None:
+        self._rebind_event_shortcut(name, name)
+
     def _on_events_changed(self) -> None:
+        if self._delta_applied:
+            self._delta_applied = False
+            self.shortcuts_updated.emit()
+            return
         logger.debug("Events changed -> rebind shortcuts")
         self._setup_shortcuts()
         self.shortcuts_updated.emit()
@@ -154,12 +211,10 @@ class ShortcutController(QObject):
         if shortcut and shortcut in self.RESERVED_GLOBALS:
             return False
 
-        event.shortcut = shortcut
-        success = self.event_manager.update_event(event_name, event)
-        if success:
-            self._setup_shortcuts()
-            self.shortcuts_updated.emit()
-        return success
+        # CustomEventType неизменяемый; привязку обновят сигналы менеджера
+        return self.event_manager.update_event(
+            event_name, replace(event, shortcut=shortcut)
+        )
 
     def is_shortcut_available(self, shortcut: str, exclude_event: Optional[str] = None) -> bool:
         shortcut = (shortcut or "").upper()
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
-from typing import List, Optional, Set, Tuple, Dict
+import time
+from typing import List, Optional, Set, Tuple
 
-from PySide6.QtCore import Signal, QObject, Qt, QTimer
+from PySide6.QtCore import Signal, QObject, QTimer
 from PySide6.QtWidgets import QGraphicsRectItem
 
 from models.domain.marker import Marker
 from models.domain.project import Project
 from models.config.app_settings import AppSettings
 from services.history import HistoryManager
-from services.history.command_interface import Command
+from services.history.command_interface import BatchCommand, Command
 from views.widgets.segment_list import SegmentListWidget
 from views.widgets.timeline_scene import TimelineWidget
 
@@ -18,31 +19,77 @@ from views.widgets.timeline_scene import TimelineWidget
 # History commands
 # ──────────────────────────────────────────────────────────────────────────────
 
+def _resolve_index(project: Project, index: int, marker: Marker) -> int:
+    """Индекс маркера для команды: сохранённый, если там именно он.
+
+    Иначе (список изменили в обход истории) — поиск через карту id
+    проекта вместо удаления не того маркера.
+    """
+    markers = project.markers
+    if 0 <= index < len(markers) and markers[index] is marker:
+        return index
+    return project.index_of(marker)
+
+
 class AddMarkerCommand(Command):
     def __init__(self, project: Project, marker: Marker):
-        super().__init__(f"Add {marker.event_name} marker")
+        super().__init__()
         self.project = project
         self.marker = marker
         self.index = -1
 
+    def _make_description(self) -> str:
+        return f"Add {self.marker.event_name} marker"
+
     def execute(self) -> None:
         if self.index < 0:
             self.index = len(self.project.markers)
         self.project.add_marker(self.marker, self.index)
 
     def undo(self) -> None:
-        if 0 <= self.index < len(self.project.markers):
-            self.project.remove_marker(self.index)
+        idx = _resolve_index(self.project, self.index, self.marker)
+        if idx >= 0:
+            self.project.remove_marker(idx)
 
 
 class ModifyMarkerCommand(Command):
+    # Хранит ссылки, а не копии: маркеры в проекте заменяются целиком
+    # (update_marker), поэтому old_marker после замены уже не меняется.
+
+    MERGE_ID = 1
+    # Правки одного маркера чаще этого интервала — один шаг undo
+    MERGE_WINDOW_SEC = 0.5
+
     def __init__(self, project: Project, marker_idx: int,
                  old_marker: Marker, new_marker: Marker):
-        super().__init__(f"Modify {new_marker.event_name} marker")
+        super().__init__()
         self.project = project
         self.marker_idx = marker_idx
         self.old_marker = old_marker
         self.new_marker = new_marker
+        self._timestamp = time.monotonic()
+
+    def _make_description(self) -> str:
+        return f"Modify {self.new_marker.event_name} marker"
+
+    def merge_id(self) -> int:
+        return self.MERGE_ID
+
+    def merge_with(self, other: Command) -> bool:
+        if not isinstance(other, ModifyMarkerCommand):
+            return False
+        if other.project is not self.project or other.marker_idx != self.marker_idx:
+            return False
+        if other._timestamp - self._timestamp > self.MERGE_WINDOW_SEC:
+            return False
+        # old_marker остаётся исходным, new_marker — последним
+        self.new_marker = other.new_marker
+        self.description = ""  # подпись пересчитается по new_marker
+        self._timestamp = other._timestamp
+        return True
+
+    def is_noop(self) -> bool:
+        return self.new_marker == self.old_marker
 
     def execute(self) -> None:
         if 0 <= self.marker_idx < len(self.project.markers):
@@ -55,31 +102,97 @@ class ModifyMarkerCommand(Command):
 
 class DeleteMarkerCommand(Command):
     def __init__(self, project: Project, marker_idx: int, marker: Marker):
-        super().__init__(f"Delete {marker.event_name} marker")
+        super().__init__()
         self.project = project
         self.marker_idx = marker_idx
         self.marker = marker
 
+    def _make_description(self) -> str:
+        return f"Delete {self.marker.event_name} marker"
+
     def execute(self) -> None:
-        if 0 <= self.marker_idx < len(self.project.markers):
-            self.project.remove_marker(self.marker_idx)
+        idx = _resolve_index(self.project, self.marker_idx, self.marker)
+        if idx >= 0:
+            self.project.remove_marker(idx)
 
     def undo(self) -> None:
         self.project.add_marker(self.marker, self.marker_idx)
 
 
-class BatchCommand(Command):
-    def __init__(self, description: str, commands: List[Command]):
+class DeleteMarkersCommand(Command):
+    """Удаление группы маркеров одним проходом по списку.
+
+    Хранит только удалённые (индекс, маркер) — не копию всего списка —
+    и восстанавливает их слиянием, без N вставок/удалений из середины.
+    """
+
+    def __init__(self, project: Project, marker_indices: List[int],
+                 description: str = ""):
         super().__init__(description)
-        self.commands = list(commands)
+        self.project = project
+        markers = project.markers
+        self._removed: List[Tuple[int, Marker]] = [
+            (idx, markers[idx])
+            for idx in sorted(set(marker_indices))
+            if 0 <= idx < len(markers)
+        ]
+
+    def __len__(self) -> int:
+        return len(self._removed)
+
+    def _make_description(self) -> str:
+        return f"Delete {len(self._removed)} markers"
 
     def execute(self) -> None:
-        for cmd in self.commands:
-            cmd.execute()
+        # Позиции сверяются по id (как _resolve_index у одиночных команд):
+        # если список изменили в обход истории, не удалить чужие маркеры
+        resolved: List[Tuple[int, Marker]] = []
+        for idx, marker in self._removed:
+            cur = _resolve_index(self.project, idx, marker)
+            if cur < 0:
+                return
+            resolved.append((cur, marker))
+        resolved.sort(key=lambda item: item[0])
+        self._removed = resolved
+
+        drop = {idx for idx, _ in resolved}
+        self.project.set_markers(
+            [m for i, m in enumerate(self.project.markers) if i not in drop],
+            copy=False,
+        )
 
     def undo(self) -> None:
-        for cmd in reversed(self.commands):
-            cmd.undo()
+        # Маркер с тем же id уже в проекте — вставка дала бы дубликат
+        if any(self.project.index_of_id(marker.id) >= 0 for _, marker in self._removed):
+            return
+
+        markers = self.project.markers
+        remaining = iter(markers)
+        left = len(markers)
+        restored: List[Marker] = []
+        for idx, marker in self._removed:
+            while len(restored) < idx and left:
+                restored.append(next(remaining))
+                left -= 1
+            restored.append(marker)
+        restored.extend(remaining)
+        self.project.set_markers(restored, copy=False)
+
+
+class MarkerBatchCommand(BatchCommand):
+    """BatchCommand над маркерами проекта: одно оповещение на всю группу."""
+
+    def __init__(self, project: Project, description: str, commands: List[Command]):
+        super().__init__(description, commands)
+        self.project = project
+
+    def execute(self) -> None:
+        with self.project.batch_changes():
+            super().execute()
+
+    def undo(self) -> None:
+        with self.project.batch_changes():
+            super().undo()
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -156,6 +269,9 @@ class TimelineController(QObject):
         # NOTE: Мы НЕ подключаем markers_changed → _on_markers_changed_internal.
         # Это убирает каскад из 3-4 перестроений. Вместо этого все обновления
         # проходят через _schedule_rebuild → _do_full_ui_update.
+        # Исключение — правки маркеров на месте в обход rebuild (превью:
+        # In/Out, заметка): списку сегментов достаточно перечитать строки
+        self.markers_changed.connect(self._on_markers_changed_in_place)
 
         if self.timeline_widget is not None:
             self._connect_timeline_signals()
@@ -169,6 +285,16 @@ class TimelineController(QObject):
     # FIX: Debounced rebuild
     # ──────────────────────────────────────────────────────────────────────────
 
+    def _on_markers_changed_in_place(self) -> None:
+        """Сбросить кэш строк списка сегментов после правки маркера на месте."""
+        # Из _do_full_ui_update: список только что перестроен
+        if self._updating or not self.segment_list_widget:
+            return
+        try:
+            self.segment_list_widget.refresh_rows()
+        except RuntimeError:
+            pass
+
     def _on_project_changed(self, *args) -> None:
         """Слот для сигналов project: marker_added, markers_cleared, markers_replaced."""
         self._schedule_rebuild()
@@ -359,12 +485,14 @@ class TimelineController(QObject):
 
     def _find_event_by_hotkey(self, hotkey: str) -> Optional[str]:
         if self.custom_event_controller:
-            for event in self.custom_event_controller.get_all_events():
-                if (event.shortcut or "").upper() == hotkey.upper():
-                    return event.name
+            # CustomEventManager — единственный источник событий: он уже
+            # включает стандартные события с учётом переназначенных клавиш
+            event = self.custom_event_controller.event_manager.get_event_by_hotkey(hotkey)
+            return event.name if event else None
 
+        hotkey = hotkey.upper()
         for event in getattr(self.settings, "default_events", []):
-            if (event.shortcut or "").upper() == hotkey.upper():
+            if (event.shortcut or "").upper() == hotkey:
                 return event.name
 
         return None
@@ -468,6 +596,14 @@ class TimelineController(QObject):
             return
 
         old_marker = self.project.markers[marker_idx]
+        if (
+            old_marker.start_frame == new_start
+            and old_marker.end_frame == new_end
+            and (new_event_name is None or new_event_name == old_marker.event_name)
+            and (new_note is None or new_note == old_marker.note)
+        ):
+            return
+
         new_marker = Marker(
             id=old_marker.id,
             start_frame=new_start,
@@ -487,22 +623,14 @@ class TimelineController(QObject):
     # ──────────────────────────────────────────────────────────────────────────
 
     def batch_delete_markers(self, marker_indices: List[int]) -> None:
-        sorted_indices = sorted(marker_indices, reverse=True)
-
-        commands: List[Command] = []
-        for idx in sorted_indices:
-            if 0 <= idx < len(self.project.markers):
-                marker = self.project.markers[idx]
-                commands.append(DeleteMarkerCommand(self.project, idx, marker))
-
-        if not commands:
+        command = DeleteMarkersCommand(self.project, marker_indices)
+        if not len(command):
             return
 
-        batch = BatchCommand(f"Delete {len(commands)} markers", commands)
-        self.history_manager.execute_command(batch)
+        self.history_manager.execute_command(command)
         self.project_modified.emit()
 
-        count = len(commands)
+        count = len(command)
         self._notify(
             f"Удалено: {count} маркеров", "warning", duration_ms=5000,
             action_text="Отмена", action_callback=lambda: self.undo(),
@@ -531,7 +659,9 @@ class TimelineController(QObject):
         if not commands:
             return
 
-        batch = BatchCommand(f"Change {len(commands)} markers to '{new_event_name}'", commands)
+        batch = MarkerBatchCommand(
+            self.project, f"Change {len(commands)} markers to '{new_event_name}'", commands
+        )
         self.history_manager.execute_command(batch)
         self.project_modified.emit()
         self._notify(f"Изменён тип: {len(commands)} → {new_event_name}", "success", duration_ms=2500)
@@ -558,15 +688,13 @@ class TimelineController(QObject):
         if not commands:
             return
 
-        batch = BatchCommand(f"Duplicate {len(commands)} markers", commands)
+        batch = MarkerBatchCommand(self.project, f"Duplicate {len(commands)} markers", commands)
         self.history_manager.execute_command(batch)
         self.project_modified.emit()
         self._notify(f"Дублировано: {len(commands)} маркеров", "success", duration_ms=2500)
 
     def _generate_marker_id(self) -> int:
-        if not self.project.markers:
-            return 1
-        return max(m.id for m in self.project.markers) + 1
+        return self.project.next_marker_id()
 
     # ──────────────────────────────────────────────────────────────────────────
     # Playback sync / seeking
@@ -656,10 +784,13 @@ class TimelineController(QObject):
     def _on_timeline_seek(self, frame: int) -> None:
         self.seek_frame(frame)
 
+    def _find_marker_index(self, marker: Marker) -> int:
+        """Индекс маркера в проекте или -1 (O(1) через карту id проекта)."""
+        return self.project.index_of(marker)
+
     def _on_event_selected(self, marker: Marker) -> None:
-        try:
-            marker_idx = self.project.markers.index(marker)
-        except ValueError:
+        marker_idx = self._find_marker_index(marker)
+        if marker_idx < 0:
             return
 
         self.clear_selection()
@@ -668,9 +799,8 @@ class TimelineController(QObject):
         self.marker_selection_changed.emit()
 
     def _on_event_double_clicked(self, marker: Marker) -> None:
-        try:
-            marker_idx = self.project.markers.index(marker)
-        except ValueError:
+        marker_idx = self._find_marker_index(marker)
+        if marker_idx < 0:
             return
         self.edit_marker_requested(marker_idx)
 
@@ -849,24 +979,9 @@ class TimelineController(QObject):
             return
 
         table = self.segment_list_widget.table
-        model = table.model()
-        if model is None:
-            return
-
         table.blockSignals(True)
         try:
-            table.clearSelection()
-
-            selected_orig = set(self.selected_markers)
-            selection_model = table.selectionModel()
-            if selection_model is None:
-                return
-
-            for row in range(model.rowCount()):
-                index = model.index(row, 0)
-                orig_idx = model.data(index, Qt.ItemDataRole.UserRole)
-                if orig_idx in selected_orig:
-                    table.selectRow(row)
+            self.segment_list_widget.select_original_indices(set(self.selected_markers))
         except RuntimeError:
             pass
         finally:
@@ -890,22 +1005,18 @@ class TimelineController(QObject):
         if not indices_to_remove:
             return
 
-        commands: List[Command] = []
-        for idx in reversed(indices_to_remove):
-            marker = self.project.markers[idx]
-            commands.append(DeleteMarkerCommand(self.project, idx, marker))
-
-        batch = BatchCommand(
-            f"Delete all '{event_name}' markers ({len(commands)})",
-            commands,
+        command = DeleteMarkersCommand(
+            self.project,
+            indices_to_remove,
+            f"Delete all '{event_name}' markers ({len(indices_to_remove)})",
         )
-        self.history_manager.execute_command(batch)
+        self.history_manager.execute_command(command)
 
         self.project_modified.emit()
         self.refresh_view()
 
         self._notify(
-            f"Удалены маркеры: {event_name} ({len(commands)} шт.)",
+            f"Удалены маркеры: {event_name} ({len(command)} шт.)",
             "warning", duration_ms=4000,
             action_text="Отмена",
             action_callback=lambda: self.undo(),
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Any
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Tuple
 from enum import Enum
 
 
@@ -15,7 +16,7 @@ class RecordingMode(Enum):
     FIXED_LENGTH = "fixed_length"
 
 
-@dataclass
+@dataclass(slots=True)
 class EventType:
     name: str
     color: str
@@ -40,40 +41,74 @@ class EventType:
         )
 
 
+# Значения по умолчанию — неизменяемые таблицы уровня модуля; фабрики
+# полей только копируют их, без разбора литералов на каждый AppSettings()
+_DEFAULT_EVENTS: Tuple[Tuple[str, str, str, str], ...] = (
+    ("Goal", "#FF0000", "G", "Goal scored"),
+    ("Shot on Goal", "#FF5722", "H", "Shot on goal"),
+    ("Missed Shot", "#FF9800", "M", "Shot missed the net"),
+    ("Blocked Shot", "#795548", "B", "Shot blocked"),
+    ("Zone Entry", "#2196F3", "Z", "Entry into offensive zone"),
+    ("Zone Exit", "#03A9F4", "X", "Exit from defensive zone"),
+    ("Dump In", "#00BCD4", "D", "Dump puck into zone"),
+    ("Turnover", "#607D8B", "T", "Loss of puck possession"),
+    ("Takeaway", "#4CAF50", "A", "Puck possession gained"),
+    ("Faceoff Win", "#8BC34A", "F", "Faceoff won"),
+    ("Faceoff Loss", "#558B2F", "L", "Faceoff lost"),
+    ("Defensive Block", "#3F51B5", "K", "Shot blocked in defense"),
+    ("Penalty", "#9C27B0", "P", "Penalty called"),
+)
+
+_DEFAULT_HOTKEYS: Mapping[str, str] = MappingProxyType({
+    "ATTACK": "A", "DEFENSE": "D", "SHIFT": "S"
+})
+
+_DEFAULT_TRACK_COLORS: Mapping[str, str] = MappingProxyType({
+    "ATTACK": "#8b0000",
+    "DEFENSE": "#000080",
+    "SHIFT": "#006400",
+})
+
+
+def _typed(data: Dict[str, Any], key: str, type_: type, default: Any) -> Any:
+    """Значение нужного типа: как есть, приведённое или default.
+
+    JSON уже хранит числа и bool в нужном типе — конструктор вызывается
+    только для несовпадающих значений, а None/мусор не роняет загрузку.
+    """
+    value = data.get(key, default)
+    if type(value) is type_:
+        return value
+    try:
+        return type_(value)
+    except (TypeError, ValueError):
+        return default
+
+
+_RECORDING_MODES = frozenset(m.value for m in RecordingMode)
+_THEMES = frozenset(t.value for t in Theme)
+_EXPORT_CODECS = frozenset(("libx264", "libx265", "mpeg4", "copy"))
+_EXPORT_RESOLUTIONS = frozenset(("source", "2160p", "1080p", "720p", "480p", "360p"))
+
+
 @dataclass
 class AppSettings:
     """Application settings model."""
 
-    default_events: List[EventType] = field(default_factory=lambda: [
-        EventType(name="Goal", color="#FF0000", shortcut="G", description="Goal scored"),
-        EventType(name="Shot on Goal", color="#FF5722", shortcut="H", description="Shot on goal"),
-        EventType(name="Missed Shot", color="#FF9800", shortcut="M", description="Shot missed the net"),
-        EventType(name="Blocked Shot", color="#795548", shortcut="B", description="Shot blocked"),
-        EventType(name="Zone Entry", color="#2196F3", shortcut="Z", description="Entry into offensive zone"),
-        EventType(name="Zone Exit", color="#03A9F4", shortcut="X", description="Exit from defensive zone"),
-        EventType(name="Dump In", color="#00BCD4", shortcut="D", description="Dump puck into zone"),
-        EventType(name="Turnover", color="#607D8B", shortcut="T", description="Loss of puck possession"),
-        EventType(name="Takeaway", color="#4CAF50", shortcut="A", description="Puck possession gained"),
-        EventType(name="Faceoff Win", color="#8BC34A", shortcut="F", description="Faceoff won"),
-        EventType(name="Faceoff Loss", color="#558B2F", shortcut="L", description="Faceoff lost"),
-        EventType(name="Defensive Block", color="#3F51B5", shortcut="K", description="Shot blocked in defense"),
-        EventType(name="Penalty", color="#9C27B0", shortcut="P", description="Penalty called"),
-    ])
-
-    hotkeys: Dict[str, str] = field(default_factory=lambda: {
-        "ATTACK": "A", "DEFENSE": "D", "SHIFT": "S"
-    })
+    default_events: List[EventType] = field(
+        default_factory=lambda: [EventType(*e) for e in _DEFAULT_EVENTS]
+    )
+
+    hotkeys: Dict[str, str] = field(default_factory=lambda: dict(_DEFAULT_HOTKEYS))
 
     recording_mode: str = RecordingMode.FIXED_LENGTH.value
     fixed_duration_sec: int = 10
     pre_roll_sec: float = 3.0
     post_roll_sec: float = 0.0
 
-    track_colors: Dict[str, str] = field(default_factory=lambda: {
-        "ATTACK": "#8b0000",
-        "DEFENSE": "#000080",
-        "SHIFT": "#006400",
-    })
+    track_colors: Dict[str, str] = field(
+        default_factory=lambda: dict(_DEFAULT_TRACK_COLORS)
+    )
 
     window_x: int = 0
     window_y: int = 0
@@ -139,12 +174,12 @@ class AppSettings:
     def from_dict(cls, data: Dict[str, Any]) -> "AppSettings":
         default = cls()
 
-        rec = str(data.get("recording_mode", default.recording_mode))
-        if rec not in (RecordingMode.DYNAMIC.value, RecordingMode.FIXED_LENGTH.value):
+        rec = _typed(data, "recording_mode", str, default.recording_mode)
+        if rec not in _RECORDING_MODES:
             rec = default.recording_mode
 
-        theme = str(data.get("theme", default.theme))
-        if theme not in (Theme.DARK.value, Theme.LIGHT.value):
+        theme = _typed(data, "theme", str, default.theme)
+        if theme not in _THEMES:
             theme = default.theme
 
         default_events_data = data.get("default_events")
@@ -155,42 +190,42 @@ class AppSettings:
         else:
             default_events = default.default_events
 
-        export_codec = str(data.get("export_codec", default.export_codec))
-        if export_codec not in ("libx264", "libx265", "mpeg4", "copy"):
+        export_codec = _typed(data, "export_codec", str, default.export_codec)
+        if export_codec not in _EXPORT_CODECS:
             export_codec = default.export_codec
 
-        export_resolution = str(data.get("export_resolution", default.export_resolution))
-        if export_resolution not in ("source", "2160p", "1080p", "720p", "480p", "360p"):
+        export_resolution = _typed(data, "export_resolution", str, default.export_resolution)
+        if export_resolution not in _EXPORT_RESOLUTIONS:
             export_resolution = default.export_resolution
 
         return cls(
             default_events=default_events,
             hotkeys=dict(data.get("hotkeys", default.hotkeys)),
             recording_mode=rec,
-            fixed_duration_sec=int(data.get("fixed_duration_sec", default.fixed_duration_sec)),
-            pre_roll_sec=float(data.get("pre_roll_sec", default.pre_roll_sec)),
-            post_roll_sec=float(data.get("post_roll_sec", default.post_roll_sec)),
+            fixed_duration_sec=_typed(data, "fixed_duration_sec", int, default.fixed_duration_sec),
+            pre_roll_sec=_typed(data, "pre_roll_sec", float, default.pre_roll_sec),
+            post_roll_sec=_typed(data, "post_roll_sec", float, default.post_roll_sec),
             track_colors=dict(data.get("track_colors", default.track_colors)),
-            window_x=int(data.get("window_x", default.window_x)),
-            window_y=int(data.get("window_y", default.window_y)),
-            window_width=int(data.get("window_width", default.window_width)),
-            window_height=int(data.get("window_height", default.window_height)),
-            autosave_enabled=bool(data.get("autosave_enabled", default.autosave_enabled)),
-            autosave_interval_minutes=int(data.get("autosave_interval_minutes", default.autosave_interval_minutes)),
+            window_x=_typed(data, "window_x", int, default.window_x),
+            window_y=_typed(data, "window_y", int, default.window_y),
+            window_width=_typed(data, "window_width", int, default.window_width),
+            window_height=_typed(data, "window_height", int, default.window_height),
+            autosave_enabled=_typed(data, "autosave_enabled", bool, default.autosave_enabled),
+            autosave_interval_minutes=_typed(data, "autosave_interval_minutes", int, default.autosave_interval_minutes),
             recent_projects=list(data.get("recent_projects", default.recent_projects)),
             custom_events=list(data.get("custom_events", default.custom_events)),
-            language=str(data.get("language", default.language)),
-            playback_speed=float(data.get("playback_speed", default.playback_speed)),
+            language=_typed(data, "language", str, default.language),
+            playback_speed=_typed(data, "playback_speed", float, default.playback_speed),
             theme=theme,
             # Export
-            export_default_dir=str(data.get("export_default_dir", default.export_default_dir)),
+            export_default_dir=_typed(data, "export_default_dir", str, default.export_default_dir),
             export_codec=export_codec,
-            export_quality_crf=max(0, min(51, int(data.get("export_quality_crf", default.export_quality_crf)))),
+            export_quality_crf=max(0, min(51, _typed(data, "export_quality_crf", int, default.export_quality_crf))),
             export_resolution=export_resolution,
-            export_include_audio=bool(data.get("export_include_audio", default.export_include_audio)),
-            export_merge_segments=bool(data.get("export_merge_segments", default.export_merge_segments)),
-            export_file_template=str(data.get("export_file_template", default.export_file_template)),
-            export_padding_before=max(0.0, float(data.get("export_padding_before", default.export_padding_before))),
-            export_padding_after=max(0.0, float(data.get("export_padding_after", default.export_padding_after))),
-            export_auto_open=bool(data.get("export_auto_open", default.export_auto_open)),
+            export_include_audio=_typed(data, "export_include_audio", bool, default.export_include_audio),
+            export_merge_segments=_typed(data, "export_merge_segments", bool, default.export_merge_segments),
+            export_file_template=_typed(data, "export_file_template", str, default.export_file_template),
+            export_padding_before=max(0.0, _typed(data, "export_padding_before", float, default.export_padding_before)),
+            export_padding_after=max(0.0, _typed(data, "export_padding_after", float, default.export_padding_after)),
+            export_auto_open=_typed(data, "export_auto_open", bool, default.export_auto_open),
         )
\ No newline at end of file
@@ -1,8 +1,44 @@
 from dataclasses import dataclass
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 
 
-@dataclass
+# Хардкод русские переводы для стандартных событий: неизменяемые таблицы,
+# построенные один раз при импорте, а не на каждый вызов get_localized_*()
+_RU_NAMES: Mapping[str, str] = MappingProxyType({
+    'Goal': 'Гол',
+    'Shot on Goal': 'Бросок в створ',
+    'Missed Shot': 'Бросок мимо',
+    'Blocked Shot': 'Заблокированный бросок',
+    'Zone Entry': 'Вход в зону',
+    'Zone Exit': 'Выход из зоны',
+    'Dump In': 'Вброс',
+    'Turnover': 'Потеря',
+    'Takeaway': 'Перехват',
+    'Faceoff Win': 'Вбрасывание: Победа',
+    'Faceoff Loss': 'Вбрасывание: Поражение',
+    'Defensive Block': 'Блокшот в обороне',
+    'Penalty': 'Удаление'
+})
+
+_RU_DESCRIPTIONS: Mapping[str, str] = MappingProxyType({
+    'Goal': 'Забитый гол',
+    'Shot on Goal': 'Бросок в створ ворот',
+    'Missed Shot': 'Бросок мимо ворот',
+    'Blocked Shot': 'Бросок заблокирован',
+    'Zone Entry': 'Вход в зону атаки',
+    'Zone Exit': 'Выход из зоны защиты',
+    'Dump In': 'Вброс шайбы в зону',
+    'Turnover': 'Потеря владения шайбой',
+    'Takeaway': 'Перехват шайбы',
+    'Faceoff Win': 'Выигранное вбрасывание',
+    'Faceoff Loss': 'Проигранное вбрасывание',
+    'Defensive Block': 'Блокшот в обороне',
+    'Penalty': 'Назначенное удаление'
+})
+
+
+@dataclass(slots=True)
 class EventType:
     """Модель типа события."""
 
@@ -32,39 +68,8 @@ class EventType:
 
     def get_localized_name(self) -> str:
         """Получить локализованное имя события."""
-        # Хардкод русские переводы для стандартных событий
-        name_map = {
-            'Goal': 'Гол',
-            'Shot on Goal': 'Бросок в створ',
-            'Missed Shot': 'Бросок мимо',
-            'Blocked Shot': 'Заблокированный бросок',
-            'Zone Entry': 'Вход в зону',
-            'Zone Exit': 'Выход из зоны',
-            'Dump In': 'Вброс',
-            'Turnover': 'Потеря',
-            'Takeaway': 'Перехват',
-            'Faceoff Win': 'Вбрасывание: Победа',
-            'Faceoff Loss': 'Вбрасывание: Поражение',
-            'Defensive Block': 'Блокшот в обороне',
-            'Penalty': 'Удаление'
-        }
-        return name_map.get(self.name, self.name)
+        return _RU_NAMES.get(self.name, self.name)
 
     def get_localized_description(self) -> str:
         """Получить локализованное описание события."""
-        desc_map = {
-            'Goal': 'Забитый гол',
-            'Shot on Goal': 'Бросок в створ ворот',
-            'Missed Shot': 'Бросок мимо ворот',
-            'Blocked Shot': 'Бросок заблокирован',
-            'Zone Entry': 'Вход в зону атаки',
-            'Zone Exit': 'Выход из зоны защиты',
-            'Dump In': 'Вброс шайбы в зону',
-            'Turnover': 'Потеря владения шайбой',
-            'Takeaway': 'Перехват шайбы',
-            'Faceoff Win': 'Выигранное вбрасывание',
-            'Faceoff Loss': 'Проигранное вбрасывание',
-            'Defensive Block': 'Блокшот в обороне',
-            'Penalty': 'Назначенное удаление'
-        }
-        return desc_map.get(self.name, self.description)
+        return _RU_DESCRIPTIONS.get(self.name, self.description)
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from typing import Dict, Any
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Tuple
+
+
+# Сериализуемые поля (порядок ключей в to_dict())
+_FIELDS: Tuple[str, ...] = ("id", "start_frame", "end_frame", "event_name", "note")
+_GET_FIELDS = attrgetter(*_FIELDS)
 
 
 class Marker:
@@ -14,6 +20,10 @@ class Marker:
     Duration in frames: end_frame - start_frame
     """
 
+    # Без __dict__ на экземпляр: в проекте десятки тысяч маркеров,
+    # и каждая команда истории держит свои копии
+    __slots__ = _FIELDS
+
     def __init__(
         self,
         id: int,
@@ -64,13 +74,13 @@ class Marker:
     # ──────────────────────────────────────────────────────────────────────
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "id": self.id,
-            "start_frame": self.start_frame,
-            "end_frame": self.end_frame,
-            "event_name": self.event_name,
-            "note": self.note,
-        }
+        return dict(zip(_FIELDS, _GET_FIELDS(self)))
+
+    @staticmethod
+    def to_dicts(markers: Iterable["Marker"]) -> List[Dict[str, Any]]:
+        """Сериализовать список маркеров (одно обращение attrgetter на маркер)."""
+        fields, get = _FIELDS, _GET_FIELDS
+        return [dict(zip(fields, get(m))) for m in markers]
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Marker":
@@ -82,6 +92,17 @@ class Marker:
             note=data.get("note", ""),
         )
 
+    def copy(self) -> "Marker":
+        """Независимая копия.
+
+        Все поля — неизменяемые скаляры, поэтому поверхностной копии
+        достаточно: без memo-словаря и обхода объекта, как в deepcopy().
+        """
+        clone = Marker.__new__(Marker)
+        (clone.id, clone.start_frame, clone.end_frame,
+         clone.event_name, clone.note) = _GET_FIELDS(self)
+        return clone
+
     # ──────────────────────────────────────────────────────────────────────
     # Misc
     # ──────────────────────────────────────────────────────────────────────
@@ -93,12 +114,16 @@ class Marker:
         )
 
     def __eq__(self, other: object) -> bool:
+        if other is self:
+            return True
         if not isinstance(other, Marker):
             return False
-        return (
-            self.id == other.id
-            and self.start_frame == other.start_frame
-            and self.end_frame == other.end_frame
-            and self.event_name == other.event_name
-            and self.note == other.note
-        )
\ No newline at end of file
+        # Сначала границы (целые) — различающиеся маркеры почти всегда
+        # отличаются уже ими, без сборки кортежей всех полей
+        if self.start_frame != other.start_frame or self.end_frame != other.end_frame:
+            return False
+        return _GET_FIELDS(self) == _GET_FIELDS(other)
+
+    # Маркер изменяемый (правка и перетаскивание меняют его на месте),
+    # поэтому нехешируемый: индексы строятся по id, а не по объекту
+    __hash__ = None
\ No newline at end of file
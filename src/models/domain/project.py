@@ -1,13 +1,26 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
+import time
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 
 from PySide6.QtCore import QObject, Signal
 
 from .marker import Marker
 
 
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def _iso_to_ms(value: Any, default: int) -> int:
+    try:
+        return int(datetime.fromisoformat(str(value)).timestamp() * 1000)
+    except (TypeError, ValueError, OverflowError, OSError):
+        return default
+
+
 class Project(QObject):
     """Project model with Qt reactivity (signals)."""
 
@@ -24,14 +37,32 @@ class Project(QObject):
         self._fps = fps
 
         self._markers: List[Marker] = []
-
-        now = datetime.now().isoformat()
-        self._created_at = now
-        self._modified_at = now
+        # id маркера -> индекс в _markers (лениво; None — пересобрать).
+        # Добавление в конец, удаление последнего и замена поддерживают
+        # карту за O(1), вставка/удаление из середины её сбрасывают.
+        self._index_by_id: Optional[Dict[int, int]] = None
+        self._max_id: Optional[int] = None
+
+        # Групповое изменение: сигналы и отметка modified — один раз в конце
+        self._batch_depth = 0
+        # Отложенные в batch_changes() отметка modified и сигнал
+        self._batch_modified = False
+        self._batch_emit = False
+
+        # Время — epoch ms; ISO-строка форматируется лениво при чтении
+        # или сериализации (None — ещё не форматировалась)
+        now = _now_ms()
+        self._created_ms = now
+        self._modified_ms = now
+        self._created_iso: Optional[str] = None
+        self._modified_iso: Optional[str] = None
         self._version = "1.0"
 
         self._file_path = ""
         self._is_modified = False
+        # Счётчик изменений: позволяет понять, менялся ли проект
+        # после снятия снимка для фоновой записи
+        self._revision = 0
 
     # ──────────────────────────────────────────────────────────────────────
     # Properties
@@ -90,17 +121,45 @@ class Project(QObject):
             return self._markers[index]
         return None
 
+    def index_of_id(self, marker_id: int) -> int:
+        """Индекс маркера с данным id или -1 (O(1) после первого вызова)."""
+        if self._index_by_id is None:
+            self._index_by_id = {m.id: i for i, m in enumerate(self._markers)}
+        return self._index_by_id.get(marker_id, -1)
+
+    def index_of(self, marker: Marker) -> int:
+        """Индекс именно этого объекта маркера или -1."""
+        idx = self.index_of_id(marker.id)
+        if idx >= 0 and self._markers[idx] is marker:
+            return idx
+        # Дубликаты id (старые проекты) — линейный поиск по ссылке
+        for i, m in enumerate(self._markers):
+            if m is marker:
+                return i
+        return -1
+
+    def next_marker_id(self) -> int:
+        """Свободный id для нового маркера (max(id) + 1)."""
+        if self._max_id is None:
+            self._max_id = max((m.id for m in self._markers), default=0)
+        return self._max_id + 1
+
     @property
     def created_at(self) -> str:
-        return self._created_at
+        if self._created_iso is None:
+            self._created_iso = datetime.fromtimestamp(self._created_ms / 1000).isoformat()
+        return self._created_iso
 
     @created_at.setter
     def created_at(self, value: str) -> None:
-        self._created_at = value
+        self._created_ms = _iso_to_ms(value, self._created_ms)
+        self._created_iso = str(value)
 
     @property
     def modified_at(self) -> str:
-        return self._modified_at
+        if self._modified_iso is None:
+            self._modified_iso = datetime.fromtimestamp(self._modified_ms / 1000).isoformat()
+        return self._modified_iso
 
     @property
     def version(self) -> str:
@@ -110,6 +169,10 @@ class Project(QObject):
     def version(self, value: str) -> None:
         self._version = value
 
+    @property
+    def revision(self) -> int:
+        return self._revision
+
     @property
     def file_path(self) -> str:
         return self._file_path
@@ -139,8 +202,19 @@ class Project(QObject):
         if index < 0:
             index = 0
 
+        if index == len(self._markers):
+            if self._index_by_id is not None:
+                self._index_by_id.setdefault(marker.id, index)
+        else:
+            self._index_by_id = None
+        if self._max_id is not None and marker.id > self._max_id:
+            self._max_id = marker.id
         self._markers.insert(index, marker)
 
+        if self._batch_depth:
+            self._defer_batch(emit_signal, mark_modified)
+            return
+
         if mark_modified:
             self._touch_modified()
 
@@ -150,7 +224,18 @@ class Project(QObject):
     def remove_marker(self, index: int, *,
                       emit_signal: bool = True, mark_modified: bool = True) -> None:
         if 0 <= index < len(self._markers):
-            self._markers.pop(index)
+            removed = self._markers.pop(index)
+            if index == len(self._markers) and self._index_by_id is not None \
+                    and self._index_by_id.get(removed.id) == index:
+                del self._index_by_id[removed.id]
+            else:
+                self._index_by_id = None
+            if removed.id == self._max_id:
+                self._max_id = None
+
+            if self._batch_depth:
+                self._defer_batch(emit_signal, mark_modified)
+                return
 
             if mark_modified:
                 self._touch_modified()
@@ -164,7 +249,14 @@ class Project(QObject):
         if not (0 <= index < len(self._markers)):
             return False
 
+        old_marker = self._markers[index]
         self._markers[index] = new_marker
+        if old_marker.id != new_marker.id:
+            self._reset_id_cache()
+
+        if self._batch_depth:
+            self._defer_batch(emit_signal, mark_modified)
+            return True
 
         if mark_modified:
             self._touch_modified()
@@ -174,11 +266,32 @@ class Project(QObject):
 
         return True
 
+    @contextmanager
+    def batch_changes(self) -> Iterator["Project"]:
+        """Групповое изменение маркеров (add/remove/update).
+
+        Вместо сигнала на каждый маркер — один markers_replaced и одна
+        отметка modified при выходе из внешнего блока.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                modified, self._batch_modified = self._batch_modified, False
+                emit, self._batch_emit = self._batch_emit, False
+                if modified:
+                    self._touch_modified()
+                if emit:
+                    self.markers_replaced.emit()
+
     def clear_markers(self, *, emit_signal: bool = True, mark_modified: bool = True) -> None:
         if not self._markers:
             return
 
         self._markers.clear()
+        self._reset_id_cache()
 
         if mark_modified:
             self._touch_modified()
@@ -187,8 +300,16 @@ class Project(QObject):
             self.markers_cleared.emit()
 
     def set_markers(self, markers: List[Marker], *,
-                    emit_signal: bool = True, mark_modified: bool = True) -> None:
-        self._markers = list(markers)
+                    emit_signal: bool = True, mark_modified: bool = True,
+                    copy: bool = True) -> None:
+        """Заменить список маркеров.
+
+        copy=False — список передаётся во владение проекту без копии
+        (только для свежесобранных списков, которые вызывающий больше
+        не использует).
+        """
+        self._markers = list(markers) if copy else markers
+        self._reset_id_cache()
 
         if mark_modified:
             self._touch_modified()
@@ -200,8 +321,20 @@ class Project(QObject):
     # Internal helpers
     # ──────────────────────────────────────────────────────────────────────
 
+    def _defer_batch(self, emit_signal: bool, mark_modified: bool) -> None:
+        # Флаги вызова сохраняются до выхода из batch_changes(): правка
+        # с mark_modified=False не должна пометить проект изменённым
+        self._batch_modified |= mark_modified
+        self._batch_emit |= emit_signal
+
+    def _reset_id_cache(self) -> None:
+        self._index_by_id = None
+        self._max_id = None
+
     def _touch_modified(self) -> None:
-        self._modified_at = datetime.now().isoformat()
+        self._revision += 1
+        self._modified_ms = _now_ms()
+        self._modified_iso = None
         self.is_modified = True
 
     # ──────────────────────────────────────────────────────────────────────
@@ -214,9 +347,9 @@ class Project(QObject):
             "video_path": self._video_path,
             "fps": self._fps,
             "version": self._version,
-            "created_at": self._created_at,
-            "modified_at": self._modified_at,
-            "markers": [m.to_dict() for m in self._markers],
+            "created_at": self.created_at,
+            "modified_at": self.modified_at,
+            "markers": Marker.to_dicts(self._markers),
         }
 
     @classmethod
@@ -227,12 +360,17 @@ class Project(QObject):
             fps=data.get("fps", 30.0),
         )
 
-        project._created_at = data.get("created_at", project._created_at)
-        project._modified_at = data.get("modified_at", project._modified_at)
+        # Строки из файла сохраняются как есть — повторная запись
+        # без правок даёт тот же манифест
+        if "created_at" in data:
+            project.created_at = data["created_at"]
+        if "modified_at" in data:
+            project._modified_ms = _iso_to_ms(data["modified_at"], project._modified_ms)
+            project._modified_iso = str(data["modified_at"])
         project._version = data.get("version", project._version)
 
         markers = [Marker.from_dict(m) for m in data.get("markers", [])]
-        project.set_markers(markers, emit_signal=False, mark_modified=False)
+        project.set_markers(markers, emit_signal=False, mark_modified=False, copy=False)
         project.is_modified = False
 
         return project
\ No newline at end of file
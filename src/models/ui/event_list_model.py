@@ -6,7 +6,8 @@ Event List Model - модели данных для отображения ма
 - SegmentTableModel: табличная модель для QTableView (новая, виртуализированная)
 """
 
-from typing import List, Tuple, Optional
+from functools import lru_cache
+from typing import Iterable, List, Tuple, Optional
 from PySide6.QtCore import QAbstractListModel, QAbstractTableModel, Qt, QModelIndex, Signal
 from PySide6.QtGui import QColor, QFont
 
@@ -14,6 +15,9 @@ from models.domain.marker import Marker
 from services.events.custom_event_manager import get_custom_event_manager
 
 
+# Цвет названия для неизвестного события — один общий экземпляр
+_NO_EVENT_COLOR = QColor("#ffffff")
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Legacy list model (kept for backward compatibility)
 # ──────────────────────────────────────────────────────────────────────────────
@@ -140,6 +144,8 @@ class SegmentTableModel(QAbstractTableModel):
         super().__init__(parent)
         self._segments: List[Tuple[int, Marker]] = []
         self._fps: float = 30.0
+        # 1/fps: data() умножает вместо деления на каждую ячейку времени
+        self._inv_fps: float = 1.0 / self._fps
         self._event_manager = get_custom_event_manager()
 
         # Кэш шрифтов (создаются один раз)
@@ -148,6 +154,22 @@ class SegmentTableModel(QAbstractTableModel):
         self._bold_font.setBold(True)
         self._mono_font = QFont("Consolas", 9)
 
+        # Шрифт и выравнивание по номеру колонки
+        right = int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        self._col_fonts = (self._compact_font, self._bold_font,
+                           self._mono_font, self._mono_font, self._mono_font)
+        self._col_alignment = (int(Qt.AlignmentFlag.AlignCenter), None,
+                               right, right, right)
+
+        # Тексты ячеек — по списку на колонку (структура массивов) и цвета
+        # названий: строка форматируется при первом показе, дальше data()
+        # только индексирует список. None — ещё не вычислено; кэш
+        # сбрасывается при смене сегментов, FPS и типов событий.
+        self._col_text: List[List[Optional[str]]] = [[] for _ in self.COLUMNS]
+        self._name_colors: List[Optional[QColor]] = []
+
+        self._event_manager.events_changed.connect(self._on_events_changed)
+
     # ──────────────── QAbstractTableModel interface ──────────────────
 
     def rowCount(self, parent=QModelIndex()) -> int:
@@ -170,54 +192,79 @@ class SegmentTableModel(QAbstractTableModel):
         if row < 0 or row >= len(self._segments):
             return None
 
-        original_idx, marker = self._segments[row]
+        if col < 0 or col >= len(self.COLUMNS):
+            return None
 
         # ─── Display role: текст ячейки ───
         if role == Qt.ItemDataRole.DisplayRole:
-            if col == self.COL_ID:
-                return str(row + 1)
-            elif col == self.COL_NAME:
-                event = self._event_manager.get_event(marker.event_name)
-                return event.get_localized_name() if event else marker.event_name
-            elif col == self.COL_START:
-                return self._format_time(marker.start_frame / self._fps)
-            elif col == self.COL_END:
-                return self._format_time(marker.end_frame / self._fps)
-            elif col == self.COL_DURATION:
-                duration_frames = max(0, marker.end_frame - marker.start_frame)
-                return self._format_time(duration_frames / self._fps)
+            text = self._col_text[col][row]
+            if text is None:
+                self._fill_row_text(row)
+                text = self._col_text[col][row]
+            return text
 
         # ─── Foreground role: цвет текста ───
         elif role == Qt.ItemDataRole.ForegroundRole:
             if col == self.COL_NAME:
-                event = self._event_manager.get_event(marker.event_name)
-                if event:
-                    return event.get_qcolor()
-                return QColor("#ffffff")
+                color = self._name_colors[row]
+                if color is None:
+                    # get_qcolor() — разобранный цвет, общий для всех строк события
+                    event = self._event_manager.get_event(self._segments[row][1].event_name)
+                    color = event.get_qcolor() if event else _NO_EVENT_COLOR
+                    self._name_colors[row] = color
+                return color
 
         # ─── Font role ───
         elif role == Qt.ItemDataRole.FontRole:
-            if col == self.COL_NAME:
-                return self._bold_font
-            elif col in (self.COL_START, self.COL_END, self.COL_DURATION):
-                return self._mono_font
-            return self._compact_font
+            return self._col_fonts[col]
 
         # ─── Alignment role ───
         elif role == Qt.ItemDataRole.TextAlignmentRole:
-            if col == self.COL_ID:
-                return int(Qt.AlignmentFlag.AlignCenter)
-            elif col in (self.COL_START, self.COL_END, self.COL_DURATION):
-                return int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            return self._col_alignment[col]
 
         # ─── Custom roles: original_idx и marker ───
         elif role == Qt.ItemDataRole.UserRole:
-            return original_idx
+            return self._segments[row][0]
         elif role == Qt.ItemDataRole.UserRole + 1:
-            return marker
+            return self._segments[row][1]
 
         return None
 
+    def _fill_row_text(self, row: int) -> None:
+        """Отформатировать все колонки строки за один проход."""
+        marker = self._segments[row][1]
+        inv_fps = self._inv_fps
+        texts = self._col_text
+        texts[self.COL_ID][row] = str(row + 1)
+        texts[self.COL_NAME][row] = self._event_manager.get_display_name(marker.event_name)
+        texts[self.COL_START][row] = _mmss(max(0, int(marker.start_frame * inv_fps)))
+        texts[self.COL_END][row] = _mmss(max(0, int(marker.end_frame * inv_fps)))
+        duration_frames = max(0, marker.end_frame - marker.start_frame)
+        texts[self.COL_DURATION][row] = _mmss(int(duration_frames * inv_fps))
+
+    def _reset_row_cache(self) -> None:
+        n = len(self._segments)
+        self._col_text = [[None] * n for _ in self.COLUMNS]
+        self._name_colors = [None] * n
+
+    def _on_events_changed(self) -> None:
+        """Имена и цвета событий могли измениться — перечитать их."""
+        self._reset_row_cache()
+        if self._segments:
+            last_row = len(self._segments) - 1
+            self.dataChanged.emit(self.index(0, self.COL_NAME),
+                                  self.index(last_row, self.COL_NAME))
+
+    def refresh_rows(self) -> None:
+        """Маркеры изменены на месте (без set_segments) — сбросить кэш
+        текстов и перечитать все ячейки."""
+        self._reset_row_cache()
+        if self._segments:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self._segments) - 1, len(self.COLUMNS) - 1),
+            )
+
     def headerData(self, section: int, orientation: Qt.Orientation,
                    role=Qt.ItemDataRole.DisplayRole):
         if role == Qt.ItemDataRole.DisplayRole:
@@ -235,18 +282,80 @@ class SegmentTableModel(QAbstractTableModel):
     def set_segments(self, segments: List[Tuple[int, Marker]]) -> None:
         """Заменить все данные модели.
 
+        Типичная правка (изменение, добавление или удаление одного
+        маркера) не сбрасывает модель: представление получает вставку или
+        удаление одной строки и dataChanged, сохраняя выделение и прокрутку.
+        Остальные изменения — полный сброс.
+
         Args:
             segments: List of (original_idx, marker) tuples.
         """
-        self.beginResetModel()
-        self._segments = list(segments)
-        self.endResetModel()
+        new_segments = list(segments)
+        old_segments = self._segments
+        delta = len(new_segments) - len(old_segments)
+
+        row = None
+        if old_segments and new_segments and -1 <= delta <= 1:
+            row = self._single_change_row(old_segments, new_segments, delta)
+
+        if row is None:
+            self.beginResetModel()
+            self._segments = new_segments
+            self._reset_row_cache()
+            self.endResetModel()
+            return
+
+        if delta > 0:
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._segments = new_segments
+            self._reset_row_cache()
+            self.endInsertRows()
+        elif delta < 0:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            self._segments = new_segments
+            self._reset_row_cache()
+            self.endRemoveRows()
+        else:
+            self._segments = new_segments
+            self._reset_row_cache()
+
+        # Маркеры меняются на месте, а номера строк и оригинальные индексы
+        # сдвигаются — перечитать все ячейки (рисуются только видимые)
+        self.dataChanged.emit(
+            self.index(0, 0),
+            self.index(len(new_segments) - 1, len(self.COLUMNS) - 1),
+        )
+
+    @staticmethod
+    def _single_change_row(old: List[Tuple[int, Marker]],
+                           new: List[Tuple[int, Marker]],
+                           delta: int) -> Optional[int]:
+        """Строка единственной вставки/удаления (delta=±1) или 0 (delta=0).
+
+        Маркеры сравниваются по идентичности; None — изменения сложнее
+        (перестановка, замена объектов), нужен полный сброс.
+        """
+        shorter = min(len(old), len(new))
+        pos = 0
+        while pos < shorter and old[pos][1] is new[pos][1]:
+            pos += 1
+
+        if delta == 0:
+            return 0 if pos == shorter else None
+
+        longer, other = (new, old) if delta > 0 else (old, new)
+        for i in range(pos, len(other)):
+            if longer[i + 1][1] is not other[i][1]:
+                return None
+        return pos
 
     def set_fps(self, fps: float) -> None:
         """Установить FPS для расчёта времени."""
         old_fps = self._fps
         self._fps = fps if fps > 0 else 30.0
+        self._inv_fps = 1.0 / self._fps
         if old_fps != self._fps and self._segments:
+            self._reset_row_cache()
             # Обновить колонки времени
             top_left = self.index(0, self.COL_START)
             bottom_right = self.index(len(self._segments) - 1, self.COL_DURATION)
@@ -271,6 +380,14 @@ class SegmentTableModel(QAbstractTableModel):
                 return row
         return -1
 
+    def rows_for_original_indices(self, original_indices: Iterable[int]) -> List[int]:
+        """Строки (по возрастанию) для набора оригинальных индексов."""
+        wanted = original_indices if isinstance(original_indices, (set, frozenset)) \
+            else set(original_indices)
+        if not wanted:
+            return []
+        return [row for row, (orig_idx, _) in enumerate(self._segments) if orig_idx in wanted]
+
     def get_all_segments(self) -> List[Tuple[int, Marker]]:
         """Получить копию всех сегментов."""
         return list(self._segments)
@@ -285,8 +402,12 @@ class SegmentTableModel(QAbstractTableModel):
     @staticmethod
     def _format_time(seconds: float) -> str:
         """Форматировать секунды в MM:SS."""
-        if seconds < 0:
-            seconds = 0
-        minutes = int(seconds) // 60
-        secs = int(seconds) % 60
-        return f"{minutes:02d}:{secs:02d}"
\ No newline at end of file
+        return _mmss(int(seconds) if seconds > 0 else 0)
+
+
+# data() вызывается на каждую ячейку при каждой перерисовке — строки
+# "MM:SS" форматируются один раз на целую секунду и переиспользуются
+@lru_cache(maxsize=4096)
+def _mmss(total_seconds: int) -> str:
+    minutes, secs = divmod(total_seconds, 60)
+    return f"{minutes:02d}:{secs:02d}"
\ No newline at end of file
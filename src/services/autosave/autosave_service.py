@@ -6,12 +6,13 @@ Auto-save service — периодическое автосохранение п
 from __future__ import annotations
 
 import shutil
-from datetime import datetime
 from pathlib import Path
-from typing import Optional, Callable, List
+from typing import Optional, Callable, List, Tuple
 
 from PySide6.QtCore import QObject, QTimer, Signal
 
+from services.serialization import get_project_writer
+
 
 class AutoSaveService(QObject):
     """
@@ -21,6 +22,9 @@ class AutoSaveService(QObject):
     - Хранит N последних авто-копий (ротация)
     - Не сохраняет, если проект не менялся (dirty flag)
     - Уведомление через сигналы
+    - Запись на диск в общей очереди записи проекта, если задан
+      prepare_callback: снимок делается в GUI-потоке, запись — в фоне,
+      строго по порядку с ручными сохранениями того же файла
     """
 
     auto_saved = Signal(str)         # путь к сохранённому файлу
@@ -41,6 +45,10 @@ class AutoSaveService(QObject):
         super().__init__(parent)
 
         self._save_callback = save_callback
+        self._prepare_callback: Optional[
+            Callable[[], Optional[Tuple[str, Callable[[], bool]]]]
+        ] = None
+        self._write_in_flight = False
         self._project_dir = project_dir or "."
         self._interval_ms = interval_ms
         self._max_backups = max_backups
@@ -50,6 +58,10 @@ class AutoSaveService(QObject):
         self._timer = QTimer(self)
         self._timer.timeout.connect(self._on_timer)
 
+        # Результат записи приходит в GUI-поток из очереди записи
+        self._writer = get_project_writer()
+        self._writer.write_finished.connect(self._on_write_finished)
+
     # ─── Properties ──────────────────────────────────────────────────────
 
     @property
@@ -85,6 +97,14 @@ class AutoSaveService(QObject):
     def set_save_callback(self, callback: Callable[[], bool]) -> None:
         self._save_callback = callback
 
+    def set_prepare_callback(
+        self, callback: Optional[Callable[[], Optional[Tuple[str, Callable[[], bool]]]]]
+    ) -> None:
+        """Callback снимка: вызывается в GUI-потоке и возвращает
+        (путь, задача записи) для очереди записи проекта или None,
+        если сохранять нечего."""
+        self._prepare_callback = callback
+
     def mark_dirty(self) -> None:
         """Пометить проект как изменённый."""
         self._dirty = True
@@ -132,6 +152,9 @@ class AutoSaveService(QObject):
 
     def _do_autosave(self) -> bool:
         """Выполнить автосохранение."""
+        if self._prepare_callback:
+            return self._submit_background_save()
+
         if not self._save_callback:
             return False
 
@@ -152,6 +175,42 @@ class AutoSaveService(QObject):
             self.auto_save_failed.emit(str(e))
             return False
 
+    def _submit_background_save(self) -> bool:
+        """Снять снимок в GUI-потоке и поставить запись в очередь."""
+        if self._write_in_flight:
+            # Предыдущая запись ещё идёт — следующий тик попробует снова
+            return False
+
+        try:
+            prepared = self._prepare_callback()
+        except Exception as e:
+            self.auto_save_failed.emit(str(e))
+            return False
+
+        if prepared is None:
+            # Тихий пропуск: например, проект ещё не имеет file_path
+            # или в файл сейчас пишет ручное сохранение
+            return False
+        file_path, write_job = prepared
+
+        # Снимок уже снят: правки, сделанные во время записи, снова
+        # пометят проект «грязным»
+        self._dirty = False
+        self._write_in_flight = True
+        self._writer.submit(file_path, write_job, self)
+        return True
+
+    def _on_write_finished(self, file_path: str, success: bool, owner, token) -> None:
+        if owner is not self:
+            return
+        self._write_in_flight = False
+        if success:
+            self.auto_saved.emit("")
+            return
+
+        self._dirty = True
+        self.auto_save_failed.emit("не удалось записать файл проекта")
+
     def _rotate_backups(self, autosave_dir: Path) -> None:
         files = sorted(autosave_dir.glob("autosave_*.json"), reverse=True)
         while len(files) > self._max_backups:
@@ -1,19 +1,37 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Set
-
-from PySide6.QtCore import Signal, QObject
+from contextlib import contextmanager
+from functools import partial
+from types import MappingProxyType
+from typing import Callable, Dict, FrozenSet, Iterator, List, Mapping, Optional, Tuple
+
+from PySide6.QtCore import (
+    Signal, QObject, QTimer, QCoreApplication,
+)
 from PySide6.QtGui import QColor
 
 from services.serialization.settings_manager import get_settings_manager
-from .custom_event_type import CustomEventType
+from .custom_event_type import CustomEventType, _FALLBACK_COLOR
 
 
 class CustomEventManager(QObject):
-    """Manages event types with persistence for custom events."""
+    """Manages event types with persistence for custom events.
+
+    events_changed fires after every effective change. Single add/update/
+    delete calls additionally emit a granular signal right before it, so
+    listeners can update one entry instead of rebuilding; batch() and
+    reset_to_defaults() emit only events_changed.
+    """
     events_changed = Signal()
+    event_added = Signal(str)            # name
+    event_updated = Signal(str, str)     # old_name, new_name
+    event_deleted = Signal(str)          # name
+
+    # Запись в config.json откладывается и склеивается: серия правок
+    # подряд (импорт, сброс, переназначение клавиш) даёт одну запись
+    SAVE_DELAY_MS = 500
 
-    DEFAULT_EVENTS: List[CustomEventType] = [
+    DEFAULT_EVENTS: Tuple[CustomEventType, ...] = (
         CustomEventType(name="Goal", color="#FF0000", shortcut="G", description="Забитый гол"),
         CustomEventType(name="Shot on Goal", color="#FF5722", shortcut="H", description="Бросок в створ ворот"),
         CustomEventType(name="Missed Shot", color="#FF9800", shortcut="M", description="Бросок мимо ворот"),
@@ -30,7 +48,13 @@ class CustomEventManager(QObject):
 
         CustomEventType(name="Defensive Block", color="#3F51B5", shortcut="K", description="Блокшот в обороне"),
         CustomEventType(name="Penalty", color="#9C27B0", shortcut="P", description="Удаление"),
-    ]
+    )
+
+    # Индекс и имена стандартных событий — вычисляются один раз при импорте
+    _DEFAULT_MAP: Mapping[str, CustomEventType] = MappingProxyType(
+        {e.name: e for e in DEFAULT_EVENTS}
+    )
+    _DEFAULT_NAMES: FrozenSet[str] = frozenset(_DEFAULT_MAP)
 
     def __init__(self):
         super().__init__()
@@ -41,14 +65,36 @@ class CustomEventManager(QObject):
         # Stored separately so defaults are never lost, but can be customized
         self._default_overrides: Dict[str, CustomEventType] = {}
 
-        self._load_custom_events()
+        # Последнее сохранённое (или запланированное к записи) состояние
+        self._last_state: List[Dict] = []
+
+        # Отсортированный результат get_all_events(); None — устарел
+        self._all_events_cache: Optional[Tuple[CustomEventType, ...]] = None
+
+        # name -> отображаемое (локализованное) имя, заполняется по запросу
+        self._display_names: Dict[str, str] = {}
+
+        # shortcut.upper() -> события с этой клавишей (в порядке get_all_events);
+        # None — индекс устарел и будет перестроен при следующем запросе
+        self._shortcut_index: Optional[Dict[str, Tuple[CustomEventType, ...]]] = None
+
+        # batch(): сохранение и events_changed откладываются до выхода
+        self._batch_depth = 0
+        self._batch_dirty = False
+
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(self.SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self._flush_save)
 
-    @property
-    def _default_names(self) -> Set[str]:
-        return {e.name for e in self.DEFAULT_EVENTS}
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush)
+
+        self._load_custom_events()
 
     def is_default_event(self, name: str) -> bool:
-        return name in self._default_names
+        return name in self._DEFAULT_NAMES
 
     def get_default_events(self) -> List[CustomEventType]:
         return list(self.DEFAULT_EVENTS)
@@ -65,7 +111,7 @@ class CustomEventManager(QObject):
             if not ev.get_qcolor().isValid():
                 continue
 
-            if ev.name in self._default_names:
+            if ev.name in self._DEFAULT_NAMES:
                 # FIX: This is an override for a default event (e.g. rebound shortcut)
                 overrides[ev.name] = ev
             else:
@@ -73,18 +119,86 @@ class CustomEventManager(QObject):
 
         self._custom_events = custom
         self._default_overrides = overrides
+        self._invalidate_caches()
+        self._last_state = self._serialize_events()
+
+    def _invalidate_caches(self) -> None:
+        self._all_events_cache = None
+        self._shortcut_index = None
+        self._display_names.clear()
 
-    def _save_custom_events(self) -> None:
+    def _serialize_events(self) -> List[Dict]:
         # FIX: Save both custom events AND default overrides
         all_to_save = list(self.get_custom_events()) + list(self._default_overrides.values())
-        data = [e.to_dict() for e in all_to_save]
-        self.settings.save_custom_events(data)
+        return [e.to_dict() for e in all_to_save]
+
+    def _save_custom_events(self) -> bool:
+        """Запланировать запись (таймер перезапускается при каждой правке).
+
+        Возвращает False, если состояние не изменилось — тогда ни записи,
+        ни events_changed не нужно.
+        """
+        state = self._serialize_events()
+        if state == self._last_state:
+            return False
+        self._last_state = state
+        self._save_timer.start()
+        return True
+
+    def _notify_changed(self, delta: Optional[Callable[[], None]] = None) -> None:
+        """Сохранить и оповестить — или отложить до конца batch().
+
+        delta — эмиссия точечного сигнала; внутри batch() не вызывается.
+        """
+        self._invalidate_caches()
+        if self._batch_depth:
+            self._batch_dirty = True
+            return
+        if self._save_custom_events():
+            if delta is not None:
+                delta()
+            self.events_changed.emit()
+
+    @contextmanager
+    def batch(self) -> Iterator["CustomEventManager"]:
+        """Групповое изменение: одно сохранение и один events_changed.
+
+        Пример::
+
+            with manager.batch():
+                manager.update_event(a.name, cleared_a)
+                manager.update_event(b.name, updated_b)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_dirty:
+                self._batch_dirty = False
+                self._notify_changed()
+
+    def flush(self) -> None:
+        """Немедленно записать отложенные изменения."""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._flush_save()
+
+    def _flush_save(self) -> None:
+        # Только кэш настроек в памяти — на диск его пишет
+        # SettingsManager.commit(), поэтому фоновый поток не нужен
+        self.settings.save_custom_events(self._last_state)
 
     def get_custom_events(self) -> List[CustomEventType]:
         return sorted(self._custom_events.values(), key=lambda e: e.name)
 
     def get_all_events(self) -> List[CustomEventType]:
-        merged: Dict[str, CustomEventType] = {e.name: e for e in self.DEFAULT_EVENTS}
+        if self._all_events_cache is None:
+            self._all_events_cache = tuple(self._build_all_events())
+        return list(self._all_events_cache)
+
+    def _build_all_events(self) -> List[CustomEventType]:
+        merged: Dict[str, CustomEventType] = dict(self._DEFAULT_MAP)
         # Apply overrides for default events
         merged.update(self._default_overrides)
         merged.update(self._custom_events)
@@ -116,25 +230,27 @@ class CustomEventManager(QObject):
         # FIX: Check overrides before raw defaults
         if name in self._default_overrides:
             return self._default_overrides[name]
-        for e in self.DEFAULT_EVENTS:
-            if e.name == name:
-                return e
-        return None
+        return self._DEFAULT_MAP.get(name)
+
+    def _get_shortcut_index(self) -> Dict[str, Tuple[CustomEventType, ...]]:
+        if self._shortcut_index is None:
+            index: Dict[str, List[CustomEventType]] = {}
+            for ev in self.get_all_events():
+                index.setdefault(ev.shortcut_upper, []).append(ev)
+            self._shortcut_index = {k: tuple(v) for k, v in index.items()}
+        return self._shortcut_index
 
     def is_shortcut_available(self, shortcut: str, exclude_event: str = "") -> bool:
         sc = (shortcut or "").upper().strip()
         if not sc:
             return True
-        for ev in self.get_all_events():
-            if ev.name != exclude_event and (ev.shortcut or "").upper() == sc:
-                return False
-        return True
+        return all(ev.name == exclude_event for ev in self._get_shortcut_index().get(sc, ()))
 
     def _is_shortcut_available(self, shortcut: str, exclude_event: str = "") -> bool:
         return self.is_shortcut_available(shortcut, exclude_event)
 
     def add_event(self, event: CustomEventType) -> bool:
-        if not event.name or event.name in self._default_names or event.name in self._custom_events:
+        if not event.name or event.name in self._DEFAULT_NAMES or event.name in self._custom_events:
             return False
         if not event.get_qcolor().isValid():
             return False
@@ -142,10 +258,14 @@ class CustomEventManager(QObject):
             return False
 
         self._custom_events[event.name] = event
-        self._save_custom_events()
-        self.events_changed.emit()
+        self._notify_changed(partial(self.event_added.emit, event.name))
         return True
 
+    def add_events(self, events: List[CustomEventType]) -> List[bool]:
+        """Add several events with a single save; returns per-event results."""
+        with self.batch():
+            return [self.add_event(event) for event in events]
+
     def update_event(self, old_name: str, new_event: CustomEventType) -> bool:
         """Update an event (custom or default).
 
@@ -164,14 +284,13 @@ class CustomEventManager(QObject):
             return False
 
         # ─── Case 1: Default event override ───
-        if old_name in self._default_names:
+        if old_name in self._DEFAULT_NAMES:
             # Default events cannot be renamed
             if new_event.name != old_name:
                 return False
 
             self._default_overrides[old_name] = new_event
-            self._save_custom_events()
-            self.events_changed.emit()
+            self._notify_changed(partial(self.event_updated.emit, old_name, old_name))
             return True
 
         # ─── Case 2: Custom event update ───
@@ -180,28 +299,31 @@ class CustomEventManager(QObject):
 
         # Rename check
         if new_event.name != old_name:
-            if new_event.name in self._default_names or new_event.name in self._custom_events:
+            if new_event.name in self._DEFAULT_NAMES or new_event.name in self._custom_events:
                 return False
             del self._custom_events[old_name]
 
         self._custom_events[new_event.name] = new_event
-        self._save_custom_events()
-        self.events_changed.emit()
+        self._notify_changed(partial(self.event_updated.emit, old_name, new_event.name))
         return True
 
+    def update_events(self, changes: List[Tuple[str, CustomEventType]]) -> List[bool]:
+        """Apply several (old_name, new_event) updates with a single save."""
+        with self.batch():
+            return [self.update_event(old_name, new_event) for old_name, new_event in changes]
+
     def delete_event(self, name: str) -> bool:
         # FIX: Allow removing overrides (restores default)
         if name in self._default_overrides:
             del self._default_overrides[name]
-            self._save_custom_events()
-            self.events_changed.emit()
+            # Стандартное событие не удаляется — возвращается к исходному виду
+            self._notify_changed(partial(self.event_updated.emit, name, name))
             return True
 
         if name not in self._custom_events:
             return False
         del self._custom_events[name]
-        self._save_custom_events()
-        self.events_changed.emit()
+        self._notify_changed(partial(self.event_deleted.emit, name))
         return True
 
     def reset_to_defaults(self) -> None:
@@ -209,19 +331,28 @@ class CustomEventManager(QObject):
             return
         self._custom_events.clear()
         self._default_overrides.clear()
-        self._save_custom_events()
-        self.events_changed.emit()
+        self._notify_changed()
 
     def get_event_by_hotkey(self, hotkey: str) -> Optional[CustomEventType]:
-        hk = (hotkey or "").upper()
-        for ev in self.get_all_events():
-            if (ev.shortcut or "").upper() == hk:
-                return ev
-        return None
+        events = self._get_shortcut_index().get((hotkey or "").upper())
+        return events[0] if events else None
+
+    def get_display_name(self, name: str) -> str:
+        """Локализованное имя события (или само имя, если события нет).
+
+        Кэшируется до следующего изменения набора событий — вызывается
+        из data()/paint() на каждую строку.
+        """
+        display = self._display_names.get(name)
+        if display is None:
+            ev = self.get_event(name)
+            display = ev.get_localized_name() if ev else name
+            self._display_names[name] = display
+        return display
 
     def get_event_color(self, name: str) -> QColor:
         ev = self.get_event(name)
-        return ev.get_qcolor() if ev else QColor("#CCCCCC")
+        return ev.get_qcolor() if ev else _FALLBACK_COLOR
 
     def get_event_hotkey(self, name: str) -> str:
         ev = self.get_event(name)
@@ -1,12 +1,58 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict
+from dataclasses import dataclass, field
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
 
 from PySide6.QtGui import QColor
 
 
-@dataclass(frozen=True)
+# Сериализуемые поля (порядок ключей в to_dict())
+_FIELDS: Tuple[str, ...] = ("name", "color", "shortcut", "description")
+_GET_FIELDS = attrgetter(*_FIELDS)
+
+
+# Цвет по умолчанию для некорректных значений — один общий экземпляр
+_FALLBACK_COLOR = QColor("#CCCCCC")
+
+# Разобранные цвета по строке: события с одинаковым цветом (импорт,
+# переопределения стандартных) разбирают hex один раз
+_COLOR_CACHE: Dict[str, QColor] = {}
+_COLOR_CACHE_LIMIT = 1024
+
+
+# Русские (название, описание) стандартных событий: одна неизменяемая
+# таблица, построенная при импорте — один поиск на вызов get_localized_*()
+_RU_EVENT_TEXT: Mapping[str, Tuple[str, str]] = MappingProxyType({
+    "Goal":            ("Гол", "Забитый гол"),
+    "Shot on Goal":    ("Бросок в створ", "Бросок в створ ворот"),
+    "Missed Shot":     ("Бросок мимо", "Бросок мимо ворот"),
+    "Blocked Shot":    ("Заблокированный бросок", "Бросок заблокирован"),
+    "Zone Entry":      ("Вход в зону", "Вход в зону атаки"),
+    "Zone Exit":       ("Выход из зоны", "Выход из зоны защиты"),
+    "Dump In":         ("Вброс", "Вброс шайбы в зону"),
+    "Turnover":        ("Потеря", "Потеря владения шайбой"),
+    "Takeaway":        ("Перехват", "Перехват шайбы"),
+    "Faceoff Win":     ("Вбрасывание: Победа", "Выигранное вбрасывание"),
+    "Faceoff Loss":    ("Вбрасывание: Поражение", "Проигранное вбрасывание"),
+    "Defensive Block": ("Блокшот в обороне", "Блокшот в обороне"),
+    "Penalty":         ("Удаление", "Назначенное удаление"),
+})
+
+
+def _parse_color(value: str) -> QColor:
+    color = _COLOR_CACHE.get(value)
+    if color is None:
+        parsed = QColor(value)
+        color = parsed if parsed.isValid() else _FALLBACK_COLOR
+        if len(_COLOR_CACHE) >= _COLOR_CACHE_LIMIT:
+            _COLOR_CACHE.clear()
+        _COLOR_CACHE[value] = color
+    return color
+
+
+@dataclass(frozen=True, slots=True)
 class CustomEventType:
     """Represents an event type with metadata."""
 
@@ -15,13 +61,18 @@ class CustomEventType:
     shortcut: str = ""           # e.g. "A", "Ctrl+X"
     description: str = ""
 
+    # Клавиша в верхнем регистре — для сравнений без .upper() на каждый поиск
+    shortcut_upper: str = field(default="", init=False, repr=False, compare=False)
+
+    # Разобранный цвет (лениво). Экземпляр неизменяемый — цвет меняется
+    # только заменой целого CustomEventType, поэтому инвалидация не нужна.
+    _qcolor: Optional[QColor] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "shortcut_upper", (self.shortcut or "").upper())
+
     def to_dict(self) -> Dict:
-        return {
-            "name": self.name,
-            "color": self.color,
-            "shortcut": self.shortcut,
-            "description": self.description,
-        }
+        return dict(zip(_FIELDS, _GET_FIELDS(self)))
 
     @classmethod
     def from_dict(cls, data: Dict) -> "CustomEventType":
@@ -33,41 +84,15 @@ class CustomEventType:
         )
 
     def get_qcolor(self) -> QColor:
-        c = QColor(self.color)
-        return c if c.isValid() else QColor("#CCCCCC")
+        """Цвет события. Общий экземпляр — перед изменением копируйте."""
+        if self._qcolor is None:
+            object.__setattr__(self, "_qcolor", _parse_color(self.color))
+        return self._qcolor
 
     def get_localized_name(self) -> str:
-        name_map = {
-            "Goal": "Гол",
-            "Shot on Goal": "Бросок в створ",
-            "Missed Shot": "Бросок мимо",
-            "Blocked Shot": "Заблокированный бросок",
-            "Zone Entry": "Вход в зону",
-            "Zone Exit": "Выход из зоны",
-            "Dump In": "Вброс",
-            "Turnover": "Потеря",
-            "Takeaway": "Перехват",
-            "Faceoff Win": "Вбрасывание: Победа",
-            "Faceoff Loss": "Вбрасывание: Поражение",
-            "Defensive Block": "Блокшот в обороне",
-            "Penalty": "Удаление",
-        }
-        return name_map.get(self.name, self.name)
+        text = _RU_EVENT_TEXT.get(self.name)
+        return text[0] if text else self.name
 
     def get_localized_description(self) -> str:
-        desc_map = {
-            "Goal": "Забитый гол",
-            "Shot on Goal": "Бросок в створ ворот",
-            "Missed Shot": "Бросок мимо ворот",
-            "Blocked Shot": "Бросок заблокирован",
-            "Zone Entry": "Вход в зону атаки",
-            "Zone Exit": "Выход из зоны защиты",
-            "Dump In": "Вброс шайбы в зону",
-            "Turnover": "Потеря владения шайбой",
-            "Takeaway": "Перехват шайбы",
-            "Faceoff Win": "Выигранное вбрасывание",
-            "Faceoff Loss": "Проигранное вбрасывание",
-            "Defensive Block": "Блокшот в обороне",
-            "Penalty": "Назначенное удаление",
-        }
-        return desc_map.get(self.name, self.description)
\ No newline at end of file
+        text = _RU_EVENT_TEXT.get(self.name)
+        return text[1] if text else self.description
@@ -13,6 +13,10 @@ from models.domain.marker import Marker
 ProgressCallback = Optional[Callable[[int], None]]
 CancelCheck = Optional[Callable[[], bool]]
 
+# Компилируются один раз: _sanitize_filename вызывается на каждый клип
+_UNSAFE_FILENAME_CHARS = re.compile(r'[\\/:*?"<>|]+')
+_WHITESPACE_RUN = re.compile(r"\s+")
+
 
 class VideoExporter:
     """Сервис экспорта видеосегментов.
@@ -335,8 +339,8 @@ class VideoExporter:
         text = (text or "").strip()
         if not text:
             return "событие"
-        text = re.sub(r'[\\/:*?"<>|]+', "_", text)
-        text = re.sub(r"\s+", " ", text).strip()
+        text = _UNSAFE_FILENAME_CHARS.sub("_", text)
+        text = _WHITESPACE_RUN.sub(" ", text).strip()
         return text[:80]
 
     @staticmethod
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import List
 
 
 class Command(ABC):
@@ -18,8 +19,18 @@ class Command(ABC):
     @property
     def name(self) -> str:
         """Human-readable command name for UI/logs."""
+        if not self.description:
+            self.description = self._make_description()
         return self.description or self.__class__.__name__
 
+    def _make_description(self) -> str:
+        """Build the description on first use.
+
+        Subcommands of a batch are never shown, so commands with a
+        formatted label can pass no description and override this.
+        """
+        return ""
+
     @abstractmethod
     def execute(self) -> None:
         pass
@@ -28,7 +39,47 @@ class Command(ABC):
     def undo(self) -> None:
         pass
 
+    def merge_id(self) -> int:
+        """Merge key (like QUndoCommand.id()); -1 means never merge."""
+        return -1
+
+    def merge_with(self, other: "Command") -> bool:
+        """Absorb a newer command with the same merge_id().
+
+        Return True if merged — the newer command is then not pushed.
+        """
+        return False
+
+    def is_noop(self) -> bool:
+        """True if the command no longer changes anything (e.g. after
+        merging an edit and its reversal) and can be dropped from history."""
+        return False
+
     def dispose(self) -> None:
         """Optional cleanup when command is dropped from history."""
         # Override if command holds large buffers/resources
-        pass
\ No newline at end of file
+        pass
+
+
+class BatchCommand(Command):
+    """Compound command — atomic execute/undo of multiple sub-commands.
+
+    The list is kept as passed (not copied): callers hand over a
+    freshly built list.
+    """
+
+    def __init__(self, description: str, commands: List[Command]):
+        super().__init__(description)
+        self.commands = commands
+
+    def execute(self) -> None:
+        for cmd in self.commands:
+            cmd.execute()
+
+    def undo(self) -> None:
+        for cmd in reversed(self.commands):
+            cmd.undo()
+
+    def dispose(self) -> None:
+        for cmd in self.commands:
+            cmd.dispose()
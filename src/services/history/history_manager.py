@@ -11,10 +11,14 @@ New API (aliases + extras):
 
 from __future__ import annotations
 
-from typing import Optional, List, TYPE_CHECKING
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Iterator, Optional, List, TYPE_CHECKING
 
 from PySide6.QtCore import QObject, Signal
 
+from services.history.command_interface import BatchCommand
+
 if TYPE_CHECKING:
     from services.history.command_interface import Command
 
@@ -53,9 +57,10 @@ class HistoryManager(QObject):
         parent: Optional[QObject] = None,
     ):
         super().__init__(parent)
-        self._undo_stack: List[Command] = []
-        self._redo_stack: List[Command] = []
-        self._max_history = max_history
+        # Кольцевой буфер: deque(maxlen) сам вытесняет самую старую
+        # команду за O(1), без ручного подсчёта длины
+        self._undo_stack: Deque[Command] = deque(maxlen=max(1, max_history))
+        self._redo_stack: Deque[Command] = deque()
         self._batch_depth = 0
         self._batch_commands: List[Command] = []
         self._batch_description = ""
@@ -88,6 +93,18 @@ class HistoryManager(QObject):
     def redo_history(self) -> List[str]:
         return [cmd.name for cmd in reversed(self._redo_stack)]
 
+    @property
+    def redo_count(self) -> int:
+        return len(self._redo_stack)
+
+    def undo_text_at(self, depth: int) -> str:
+        """Описание команды undo-стека: depth=0 — самая новая."""
+        return self._undo_stack[-1 - depth].name
+
+    def redo_text_at(self, index: int) -> str:
+        """Описание команды redo-стека: index=0 — самая дальняя."""
+        return self._redo_stack[index].name
+
     @property
     def is_modified(self) -> bool:
         return self._modified_since_save
@@ -106,7 +123,8 @@ class HistoryManager(QObject):
             self._batch_commands.append(command)
             return
 
-        self._push_undo(command)
+        if not self._try_merge(command):
+            self._push_undo(command)
         self._clear_redo()
 
         self._modified_since_save = True
@@ -126,7 +144,8 @@ class HistoryManager(QObject):
             self._batch_commands.append(command)
             return
 
-        self._push_undo(command)
+        if not self._try_merge(command):
+            self._push_undo(command)
         self._clear_redo()
 
         self._modified_since_save = True
@@ -205,51 +224,62 @@ class HistoryManager(QObject):
         self._batch_depth -= 1
 
         if self._batch_depth == 0 and self._batch_commands:
-            batch = _BatchCommand(
-                self._batch_commands.copy(),
-                self._batch_description,
-            )
+            # Передаём список команде целиком (без копии) и начинаем новый
+            batch = BatchCommand(self._batch_description, self._batch_commands)
+            self._batch_commands = []
             self._push_undo(batch)
             self._clear_redo()
-            self._batch_commands.clear()
 
             self._modified_since_save = True
             self.command_executed.emit(batch.name)
             self.state_changed.emit()
 
+    @contextmanager
+    def batch(self, description: str = "Batch operation") -> Iterator["HistoryManager"]:
+        """begin_batch()/end_batch() as a context manager.
+
+        Commands executed inside produce no per-command signals — one
+        command_executed/state_changed pair is emitted on exit.
+        """
+        self.begin_batch(description)
+        try:
+            yield self
+        finally:
+            self.end_batch()
+
     # ─── Internals ───────────────────────────────────────────────────────
 
+    def _try_merge(self, command) -> bool:
+        """Слить команду с вершиной стека (серия правок — один шаг undo).
+
+        Не сливаем через точку сохранения и после undo: иначе шаг
+        включил бы уже сохранённое или отменённое состояние.
+        """
+        if not self._undo_stack or self._redo_stack or not self._modified_since_save:
+            return False
+        merge_id = getattr(command, "merge_id", None)
+        if merge_id is None or merge_id() == -1:
+            return False
+        top = self._undo_stack[-1]
+        if getattr(top, "merge_id", lambda: -1)() != merge_id():
+            return False
+        if top.merge_with(command):
+            command.dispose()
+            # Правка и её отмена слились — шаг истории больше не нужен
+            if top.is_noop():
+                self._undo_stack.pop()
+                top.dispose()
+            return True
+        return False
+
     def _push_undo(self, command) -> None:
+        if len(self._undo_stack) == self._undo_stack.maxlen:
+            # Будет вытеснена append'ом — освободить ресурсы заранее
+            self._undo_stack[0].dispose()
         self._undo_stack.append(command)
-        while len(self._undo_stack) > self._max_history:
-            old = self._undo_stack.pop(0)
-            old.dispose()
 
     def _clear_redo(self) -> None:
         for cmd in self._redo_stack:
             cmd.dispose()
         self._redo_stack.clear()
 
-
-class _BatchCommand:
-    """Compound command — atomic execute/undo of multiple sub-commands."""
-
-    def __init__(self, commands: list, description: str):
-        self._commands = commands
-        self.description = description
-
-    @property
-    def name(self) -> str:
-        return self.description
-
-    def execute(self) -> None:
-        for cmd in self._commands:
-            cmd.execute()
-
-    def undo(self) -> None:
-        for cmd in reversed(self._commands):
-            cmd.undo()
-
-    def dispose(self) -> None:
-        for cmd in self._commands:
-            cmd.dispose()
\ No newline at end of file
@@ -2,5 +2,6 @@
 
 from .project_io import ProjectIO
 from .settings_manager import SettingsManager
+from .project_writer import ProjectWriter, get_project_writer
 
-__all__ = ['ProjectIO', 'SettingsManager']
+__all__ = ['ProjectIO', 'SettingsManager', 'ProjectWriter', 'get_project_writer']
@@ -1,22 +1,95 @@
 from __future__ import annotations
 
+import hashlib
+import itertools
 import json
+import os
 import zipfile
 from pathlib import Path
-from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson не обязателен — откат на stdlib json
+    orjson = None
 
 from models.domain.project import Project
 
 
+def _dumps(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _digest(payload: bytes) -> bytes:
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def _file_stamp(file_path: Path) -> Optional[Tuple[int, int]]:
+    """(размер, mtime в нс) файла или None, если его нет."""
+    try:
+        st = file_path.stat()
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
 class ProjectIO:
     """Service for saving/loading .hep projects (ZIP archive)."""
 
     HEP_VERSION = "1.0"
     MANIFEST_FILE = "project.json"
+    # Манифест — небольшой JSON: уровень 1 сжимает почти как 6 (по
+    # умолчанию), но в несколько раз быстрее
+    COMPRESS_LEVEL = 1
+
+    # Что лежит в файле по пути: (хеш манифеста, сжат ли он, stamp файла) —
+    # повторное сохранение без изменений не переписывает архив, если файл
+    # с тех пор не трогали извне и он сжат не слабее запрошенного.
+    # Хранится хеш, а не сам манифест.
+    _last_saved: Dict[str, Tuple[bytes, bool, Tuple[int, int]]] = {}
+
+    # Уникальные имена временных файлов: ручное и фоновое сохранение
+    # могут писать один и тот же проект одновременно
+    _tmp_counter = itertools.count()
 
     @staticmethod
     def save_project(project: Project, filepath: str) -> bool:
+        try:
+            payload = ProjectIO.snapshot_project(project)
+        except Exception as e:
+            print(f"Error saving project: {e}")
+            return False
+        return ProjectIO.write_snapshot(payload, filepath)
+
+    @staticmethod
+    def snapshot_project(project: Project) -> bytes:
+        """Сериализовать проект в манифест (вызывать из GUI-потока).
+
+        Результат — неизменяемые байты, их можно передать в
+        write_snapshot() в другом потоке без гонок с правками проекта.
+        """
+        # modified_at обновляет сам Project при каждом изменении
+        manifest = {
+            "version": ProjectIO.HEP_VERSION,
+            "project": project.to_dict(),
+        }
+        return _dumps(manifest)
+
+    @staticmethod
+    def write_snapshot(payload: bytes, filepath: str, compress: bool = True) -> bool:
+        """Записать готовый манифест в .hep (безопасно вне GUI-потока).
+
+        compress=False пишет манифест без сжатия (ZIP_STORED) — для
+        частых фоновых автосохранений; файл остаётся обычным .hep.
+        """
         try:
             file_path = Path(filepath)
             if file_path.suffix.lower() != ".hep":
@@ -24,23 +97,36 @@ class ProjectIO:
 
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Update modification timestamp only (dirty flag is handled by ProjectController)
+            key = str(file_path.resolve())
+            digest = _digest(payload)
+            saved = ProjectIO._last_saved.get(key)
+            if (saved is not None and saved[0] == digest
+                    and (saved[1] or not compress)
+                    and saved[2] == _file_stamp(file_path)):
+                return True
+
+            # Пишем во временный файл и атомарно подменяем: сбой посреди
+            # записи не оставит повреждённый .hep
+            tmp_path = file_path.with_name(
+                f"{file_path.name}.{os.getpid()}.{next(ProjectIO._tmp_counter)}.tmp"
+            )
             try:
-                project.modified_at = datetime.now().isoformat()
-            except Exception:
-                # If modified_at becomes read-only later, don't crash
-                pass
-
-            manifest = {
-                "version": ProjectIO.HEP_VERSION,
-                "project": project.to_dict(),
-            }
-
-            with zipfile.ZipFile(file_path, "w", zipfile.ZIP_DEFLATED) as hep:
-                hep.writestr(
-                    ProjectIO.MANIFEST_FILE,
-                    json.dumps(manifest, indent=2, ensure_ascii=False).encode("utf-8"),
-                )
+                if compress:
+                    hep_file = zipfile.ZipFile(
+                        tmp_path, "w", zipfile.ZIP_DEFLATED,
+                        compresslevel=ProjectIO.COMPRESS_LEVEL,
+                    )
+                else:
+                    hep_file = zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_STORED)
+                with hep_file as hep:
+                    hep.writestr(ProjectIO.MANIFEST_FILE, payload)
+                os.replace(tmp_path, file_path)
+                stamp = _file_stamp(file_path)
+                if stamp is not None:
+                    ProjectIO._last_saved[key] = (digest, compress, stamp)
+            finally:
+                if tmp_path.exists():
+                    tmp_path.unlink()
 
             return True
 
@@ -58,12 +144,14 @@ class ProjectIO:
             with zipfile.ZipFile(file_path, "r") as hep:
                 try:
                     manifest_bytes = hep.read(ProjectIO.MANIFEST_FILE)
+                    compressed = (hep.getinfo(ProjectIO.MANIFEST_FILE).compress_type
+                                  != zipfile.ZIP_STORED)
                 except KeyError:
                     raise ValueError(f"Invalid .hep file: missing {ProjectIO.MANIFEST_FILE}")
 
             # Parse JSON
             try:
-                manifest = json.loads(manifest_bytes.decode("utf-8"))
+                manifest = _loads(manifest_bytes)
             except Exception as e:
                 raise ValueError(f"Invalid project manifest JSON: {e}")
 
@@ -73,6 +161,14 @@ class ProjectIO:
 
             project_data = manifest.get("project", {})
             project = Project.from_dict(project_data)
+
+            # Только что прочитанный файл совпадает с манифестом — первое
+            # сохранение без правок можно пропустить
+            stamp = _file_stamp(file_path)
+            if stamp is not None:
+                ProjectIO._last_saved[str(file_path.resolve())] = (
+                    _digest(manifest_bytes), compressed, stamp
+                )
             return project
 
         except Exception as e:
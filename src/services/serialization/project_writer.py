@@ -0,0 +1,152 @@
+"""
+Project Writer — единая очередь записи файлов проекта (.hep).
+
+Ручное сохранение и автосохранение пишут один и тот же файл. Все записи
+идут через один рабочий поток: на каждый путь не больше одной записи в
+работе и одной в ожидании. Новый снимок заменяет ещё не начатый старый,
+поэтому более старый снимок не может перезаписать более новый.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+# (owner, token) — кто запросил запись и его данные для обработчика
+_Requester = Tuple[Any, Any]
+# (filepath, write_job, requesters)
+_Entry = Tuple[str, Callable[[], bool], List[_Requester]]
+
+
+_project_writer: Optional["ProjectWriter"] = None
+
+
+def get_project_writer() -> "ProjectWriter":
+    global _project_writer
+    if _project_writer is None:
+        _project_writer = ProjectWriter()
+    return _project_writer
+
+
+def _path_key(filepath: str) -> str:
+    return os.path.normcase(os.path.abspath(filepath))
+
+
+class _WriterSignals(QObject):
+    """Сигналы рабочего потока (QRunnable не является QObject)."""
+
+    done = Signal(str, bool, object)   # filepath, success, requesters
+
+
+class _DrainTask(QRunnable):
+    """Пишет снимки одного пути, пока для него есть ожидающие."""
+
+    def __init__(self, writer: "ProjectWriter", key: str):
+        super().__init__()
+        self._writer = writer
+        self._key = key
+
+    def run(self) -> None:
+        self._writer._drain(self._key)
+
+
+class ProjectWriter(QObject):
+    """Последовательная запись снимков проекта в фоне.
+
+    submit() вызывается из GUI-потока; write_finished приходит туда же
+    по одному разу на каждый запрос — в том числе на заменённые более
+    новым снимком (с результатом записи этого снимка).
+    """
+
+    write_finished = Signal(str, bool, object, object)   # filepath, success, owner, token
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._pending: Dict[str, _Entry] = {}
+        # Путь с активной задачей → запросы записи, которая сейчас идёт
+        self._in_flight: Dict[str, List[_Requester]] = {}
+
+        # Один поток — записи строго последовательны
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+
+        self._signals = _WriterSignals(self)
+        self._signals.done.connect(self._on_done)
+
+    # ─── Public API ──────────────────────────────────────────────────────
+
+    def submit(self, filepath: str, write_job: Callable[[], bool],
+               owner: Any, token: Any = None) -> None:
+        """Поставить снимок в очередь записи пути filepath."""
+        key = _path_key(filepath)
+        with self._lock:
+            entry = self._pending.get(key)
+            requesters = entry[2] if entry is not None else []
+            requesters.append((owner, token))
+            self._pending[key] = (filepath, write_job, requesters)
+            if key in self._in_flight:
+                return
+            self._in_flight[key] = []
+        self._pool.start(_DrainTask(self, key))
+
+    def write_now(self, filepath: str, write_job: Callable[[], bool]) -> bool:
+        """Синхронная запись (GUI-поток): дождаться фоновых записей,
+        отменить ожидающий более старый снимок этого пути и записать."""
+        key = _path_key(filepath)
+        with self._lock:
+            superseded = self._pending.pop(key, None)
+        self._pool.waitForDone()
+
+        try:
+            success = bool(write_job())
+        except Exception as e:
+            print(f"Save project failed: {e}")
+            success = False
+
+        if superseded is not None:
+            self._on_done(filepath, success, superseded[2])
+        return success
+
+    def is_writing(self, filepath: str, owner: Any = None) -> bool:
+        """Есть ли запись пути в работе или в очереди (от owner, если задан)."""
+        key = _path_key(filepath)
+        with self._lock:
+            entry = self._pending.get(key)
+            if key not in self._in_flight and entry is None:
+                return False
+            if owner is None:
+                return True
+            requesters = list(self._in_flight.get(key, ()))
+            if entry is not None:
+                requesters.extend(entry[2])
+        return any(o is owner for o, _ in requesters)
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        return self._pool.waitForDone(msecs)
+
+    # ─── Internals ───────────────────────────────────────────────────────
+
+    def _drain(self, key: str) -> None:
+        while True:
+            with self._lock:
+                entry = self._pending.pop(key, None)
+                if entry is None:
+                    del self._in_flight[key]
+                    return
+                self._in_flight[key] = entry[2]
+
+            filepath, write_job, requesters = entry
+            try:
+                success = bool(write_job())
+            except Exception as e:
+                print(f"Save project failed: {e}")
+                success = False
+            self._signals.done.emit(filepath, success, requesters)
+
+    def _on_done(self, filepath: str, success: bool, requesters: List[_Requester]) -> None:
+        for owner, token in requesters:
+            self.write_finished.emit(filepath, success, owner, token)
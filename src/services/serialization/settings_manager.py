@@ -6,46 +6,166 @@ Settings Manager - loads/saves app settings to JSON.
 
 from __future__ import annotations
 
+import atexit
+import copy
 import json
 import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 
+try:
+    import orjson
+except ImportError:  # orjson не обязателен — откат на stdlib json
+    orjson = None
+
 from models.config.app_settings import AppSettings
 
 _settings_manager: Optional["SettingsManager"] = None
+_settings_manager_lock = threading.Lock()
 
 
 def get_settings_manager() -> "SettingsManager":
     global _settings_manager
+    # Двойная проверка: менеджер используется и из фоновых потоков
+    # записи, второй экземпляр разошёлся бы с кэшем первого
     if _settings_manager is None:
-        _settings_manager = SettingsManager()
+        with _settings_manager_lock:
+            if _settings_manager is None:
+                _settings_manager = SettingsManager()
     return _settings_manager
 
 
 class SettingsManager:
+    """config.json с кэшем в памяти и отложенной записью.
+
+    save_* меняют только кэш и помечают его «грязным»; на диск всё
+    записывается одним проходом в commit() — по таймеру окна, при его
+    закрытии и при выходе из процесса. Сама запись файла идёт в фоновом
+    потоке, GUI-поток только сериализует снимок. save_settings() (явное
+    действие пользователя) фиксирует изменения сразу и синхронно.
+    """
+
     def __init__(self, config_path: str = "config.json"):
         self.config_path = config_path
+        # commit() (GUI-поток) и _write_file() (поток settings-writer)
+        # разделяют _dirty и _raw_cache — доступ к ним только под блокировкой
+        self._io_lock = threading.RLock()
+        # Содержимое config.json в памяти: файл читается один раз,
+        # дальше геттеры работают без диска; запись обновляет кэш
+        self._raw_cache: Optional[Dict[str, Any]] = None
+        self._dirty = False
+        # Недавние проекты (лениво из кэша): вставка без пересборки списка
+        self._recent: Optional[deque] = None
+
+        # Один поток записи — снимки пишутся строго в порядке commit()
+        self._writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="settings-writer"
+        )
+        self._write_lock = threading.Lock()
+        self._commit_seq = 0
+        self._written_seq = 0
+
+        atexit.register(self.commit, wait=True)
 
     # ─── Raw I/O ───────────────────────────────────────────────────────────
 
+    def invalidate(self) -> None:
+        """Сбросить кэш (если config.json изменён извне).
+
+        Незафиксированные изменения теряются — при необходимости
+        сначала вызовите commit().
+        """
+        with self._io_lock:
+            self._raw_cache = None
+            self._recent = None
+            self._dirty = False
+
+    def commit(self, wait: bool = False) -> bool:
+        """Записать накопленные изменения в config.json одним проходом.
+
+        По умолчанию запись уходит в фоновый поток и метод сразу
+        возвращает True; wait=True пишет синхронно и возвращает результат.
+        """
+        with self._io_lock:
+            if not self._dirty or self._raw_cache is None:
+                return True
+            try:
+                payload = json.dumps(self._raw_cache, indent=4, ensure_ascii=False)
+            except Exception as e:
+                print(f"Error saving settings: {e}")
+                return False
+            self._dirty = False
+            self._commit_seq += 1
+            seq = self._commit_seq
+
+        if wait:
+            return self._write_file(seq, payload)
+        try:
+            self._writer.submit(self._write_file, seq, payload)
+        except RuntimeError:
+            # Пул уже остановлен (завершение интерпретатора) — пишем сами
+            return self._write_file(seq, payload)
+        return True
+
+    def _write_file(self, seq: int, payload: str) -> bool:
+        with self._write_lock:
+            # Уже записан более свежий снимок — этот устарел
+            if seq <= self._written_seq:
+                return True
+            try:
+                with open(self.config_path, "w", encoding="utf-8") as f:
+                    f.write(payload)
+                self._written_seq = seq
+                return True
+            except Exception as e:
+                print(f"Error saving settings: {e}")
+                with self._io_lock:
+                    # Повторим при следующем commit()
+                    self._dirty = True
+                return False
+
+    def _ensure_loaded(self) -> Dict[str, Any]:
+        if self._raw_cache is None:
+            self._raw_cache = self._read_file()
+        return self._raw_cache
+
     def _load_raw(self) -> Dict[str, Any]:
+        with self._io_lock:
+            # Копия: вызывающий код может изменять результат
+            return copy.deepcopy(self._ensure_loaded())
+
+    def _load_section(self, key: str, default: Any = None) -> Any:
+        """Копия одного раздела — без глубокого копирования всего файла."""
+        with self._io_lock:
+            return copy.deepcopy(self._ensure_loaded().get(key, default))
+
+    def _read_file(self) -> Dict[str, Any]:
         if not os.path.exists(self.config_path):
             return {}
         try:
+            if orjson is not None:
+                with open(self.config_path, "rb") as f:
+                    return orjson.loads(f.read()) or {}
             with open(self.config_path, "r", encoding="utf-8") as f:
                 return json.load(f) or {}
         except Exception as e:
             print(f"Error loading settings: {e}")
             return {}
 
-    def _save_raw(self, data: Dict[str, Any]) -> bool:
-        try:
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
-            return True
-        except Exception as e:
-            print(f"Error saving settings: {e}")
-            return False
+    def _save_raw(self, data: Dict[str, Any]) -> None:
+        """Заменить содержимое целиком (запись — в commit())."""
+        with self._io_lock:
+            self._raw_cache = copy.deepcopy(data)
+            self._recent = None
+            self._dirty = True
+
+    def _update_section(self, key: str, value: Any) -> None:
+        """Заменить один раздел config.json (запись — в commit())."""
+        with self._io_lock:
+            self._ensure_loaded()[key] = copy.deepcopy(value)
+            self._dirty = True
 
     # ─── AppSettings ───────────────────────────────────────────────────────
 
@@ -61,10 +181,11 @@ class SettingsManager:
 
     def save_settings(self, settings: AppSettings) -> bool:
         try:
-            return self._save_raw(settings.to_dict())
+            self._save_raw(settings.to_dict())
         except Exception as e:
             print(f"Error saving settings: {e}")
             return False
+        return self.commit(wait=True)
 
     def export_settings(self, settings: AppSettings, file_path: str) -> bool:
         try:
@@ -87,14 +208,11 @@ class SettingsManager:
     # ─── Custom events persistence ─────────────────────────────────────────
 
     def load_custom_events(self) -> List[Dict]:
-        raw = self._load_raw()
-        events = raw.get("custom_events", [])
+        events = self._load_section("custom_events", [])
         return events if isinstance(events, list) else []
 
     def save_custom_events(self, events_data: List[Dict]) -> None:
-        raw = self._load_raw()
-        raw["custom_events"] = events_data
-        self._save_raw(raw)
+        self._update_section("custom_events", events_data)
 
     # ─── Auto-save settings (НОВОЕ) ────────────────────────────────────────
 
@@ -107,13 +225,12 @@ class SettingsManager:
                 "max_backups": int,
             }
         """
-        raw = self._load_raw()
         defaults = {
             "enabled": True,
             "interval_minutes": 5,
             "max_backups": 5,
         }
-        saved = raw.get("autosave", {})
+        saved = self._load_section("autosave", {})
         if not isinstance(saved, dict):
             return defaults
         for key, default_val in defaults.items():
@@ -127,41 +244,45 @@ class SettingsManager:
         interval_minutes: int = 5,
         max_backups: int = 5,
     ) -> None:
-        raw = self._load_raw()
-        raw["autosave"] = {
+        self._update_section("autosave", {
             "enabled": enabled,
             "interval_minutes": interval_minutes,
             "max_backups": max_backups,
-        }
-        self._save_raw(raw)
+        })
 
     # ─── Window geometry persistence (НОВОЕ) ───────────────────────────────
 
     def save_window_geometry(self, geometry_data: Dict[str, Any]) -> None:
         """Сохранить геометрию окна и сплиттеров."""
-        raw = self._load_raw()
-        raw["window_geometry"] = geometry_data
-        self._save_raw(raw)
+        self._update_section("window_geometry", geometry_data)
 
     def load_window_geometry(self) -> Optional[Dict[str, Any]]:
-        raw = self._load_raw()
-        return raw.get("window_geometry")
+        return self._load_section("window_geometry")
 
     # ─── Recent projects (НОВОЕ) ───────────────────────────────────────────
 
+    def _recent_deque(self, max_recent: int) -> deque:
+        if self._recent is None or self._recent.maxlen != max_recent:
+            recent = self._ensure_loaded().get("recent_projects", [])
+            if not isinstance(recent, list):
+                recent = []
+            self._recent = deque(recent, maxlen=max_recent)
+        return self._recent
+
     def get_recent_projects(self) -> List[str]:
-        raw = self._load_raw()
-        recent = raw.get("recent_projects", [])
-        return recent if isinstance(recent, list) else []
+        with self._io_lock:
+            recent = self._recent
+            if recent is None:
+                recent = self._recent_deque(10)
+            return list(recent)
 
     def add_recent_project(self, path: str, max_recent: int = 10) -> None:
-        raw = self._load_raw()
-        recent = raw.get("recent_projects", [])
-        if not isinstance(recent, list):
-            recent = []
-        if path in recent:
-            recent.remove(path)
-        recent.insert(0, path)
-        recent = recent[:max_recent]
-        raw["recent_projects"] = recent
-        self._save_raw(raw)
\ No newline at end of file
+        with self._io_lock:
+            recent = self._recent_deque(max_recent)
+            # Уже первый в списке — ничего не изменилось, запись не нужна
+            if recent and recent[0] == path:
+                return
+            if path in recent:
+                recent.remove(path)
+            recent.appendleft(path)
+            self._update_section("recent_projects", list(recent))
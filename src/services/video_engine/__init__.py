@@ -1,5 +1,6 @@
 """Video Engine - работа с видео через OpenCV."""
 
 from .cv2_wrapper import VideoService
+from .seek_worker import FrameSeekWorker
 
-__all__ = ['VideoService']
+__all__ = ['VideoService', 'FrameSeekWorker']
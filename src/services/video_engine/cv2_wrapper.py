@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import os
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 import cv2
 import numpy as np
@@ -13,9 +13,16 @@ class VideoService:
     Notes:
     - Not thread-safe. Use one VideoCapture per thread/process.
     - Frames returned are BGR np.ndarray.
+    - With frame_pool_size > 0 frames are decoded into a ring of reused
+      buffers: a returned frame stays valid only for the next
+      frame_pool_size - 1 reads, so callers must copy what they keep.
     """
 
-    def __init__(self):
+    # Short forward jumps are served by grab() (demux only, no decode or
+    # BGR conversion) of the skipped frames instead of a keyframe seek
+    MAX_GRAB_SKIP = 8
+
+    def __init__(self, frame_pool_size: int = 0):
         self.cap: Optional[cv2.VideoCapture] = None
         self.video_path: Optional[str] = None
 
@@ -27,6 +34,11 @@ class VideoService:
         # Internal cursor tracking (next frame index that cap.read() would read)
         self._next_read_index: Optional[int] = None
 
+        # Decode-buffer ring (empty = allocate a new array per frame).
+        # Slots are filled by the first reads and reused afterwards.
+        self._frame_pool: List[Optional[np.ndarray]] = [None] * max(0, frame_pool_size)
+        self._pool_idx = 0
+
     # ──────────────────────────────────────────────────────────────────────
     # State
     # ──────────────────────────────────────────────────────────────────────
@@ -78,6 +90,23 @@ class VideoService:
             raise RuntimeError(f"Failed to read frame {frame_index}")
         return frame
 
+    def _read(self) -> Optional[np.ndarray]:
+        """cap.read() into the next pool buffer when pooling is enabled."""
+        assert self.cap is not None
+        if not self._frame_pool:
+            ret, frame = self.cap.read()
+            return frame if ret else None
+
+        buf = self._frame_pool[self._pool_idx]
+        ret, frame = self.cap.read(buf) if buf is not None else self.cap.read()
+        if not ret:
+            return None
+        # OpenCV reallocates if the buffer doesn't fit (first read,
+        # resolution change) — keep whatever array it returned
+        self._frame_pool[self._pool_idx] = frame
+        self._pool_idx = (self._pool_idx + 1) % len(self._frame_pool)
+        return frame
+
     def try_get_frame(self, frame_index: int) -> Optional[np.ndarray]:
         """Get a frame by index. Returns None on errors."""
         if not self.is_loaded:
@@ -89,8 +118,23 @@ class VideoService:
 
         # Fast path: sequential read if we're exactly at expected next index
         if self._next_read_index is not None and frame_index == self._next_read_index:
-            ret, frame = self.cap.read()
-            if not ret:
+            frame = self._read()
+            if frame is None:
+                return None
+            self._next_read_index = frame_index + 1
+            return frame
+
+        # Slightly ahead of the cursor: skip frames without decoding them
+        if (self._next_read_index is not None
+                and 0 < frame_index - self._next_read_index <= self.MAX_GRAB_SKIP):
+            while self._next_read_index < frame_index:
+                if not self.cap.grab():
+                    self._next_read_index = None
+                    return None
+                self._next_read_index += 1
+            frame = self._read()
+            if frame is None:
+                self._next_read_index = None
                 return None
             self._next_read_index = frame_index + 1
             return frame
@@ -98,8 +142,8 @@ class VideoService:
         # Otherwise do a seek
         ok = self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
         # Some backends return False but still seek; we proceed regardless.
-        ret, frame = self.cap.read()
-        if not ret:
+        frame = self._read()
+        if frame is None:
             # after failed read, cursor position is unknown
             self._next_read_index = None
             return None
@@ -149,6 +193,8 @@ class VideoService:
         self.frame_width = 0
         self.frame_height = 0
         self._next_read_index = None
+        self._frame_pool = [None] * len(self._frame_pool)
+        self._pool_idx = 0
 
     def __del__(self):
         self.cleanup()
\ No newline at end of file
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from PySide6.QtCore import QThread, QMutex, QWaitCondition, Signal
+
+from .cv2_wrapper import VideoService
+
+
+class FrameSeekWorker(QThread):
+    """Background seek + decode for slider scrubbing.
+
+    Owns its own VideoService (VideoCapture is not thread-safe), so
+    the GUI-thread service used for playback is never touched.
+
+    Requests go through a single-slot mailbox: request_seek() overwrites
+    the pending frame index, so while one frame is being decoded only the
+    newest request survives and intermediate positions are dropped.
+
+    Every request bumps a seek generation. A frame is published only if no
+    newer request arrived while it was decoding, and it carries its
+    generation so the receiver can drop it if it went stale (is_current()).
+
+    Results go through a single-slot outbox as well: the worker overwrites
+    the slot and frame_ready is emitted only when the slot was empty, so the
+    event queue never holds frames — the receiver calls take_frame().
+    """
+
+    frame_ready = Signal()  # a result is waiting in take_frame()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._mutex = QMutex()
+        self._wake = QWaitCondition()
+
+        self._video_path: Optional[str] = None
+        self._video_changed = False
+        self._pending_seek: Optional[int] = None
+        self._stopping = False
+        # Increments on every request; int reads/writes are atomic under the GIL
+        self._generation = 0
+        # Latest decoded result not yet taken: (frame_idx, BGR frame, generation)
+        self._result: Optional[Tuple[int, np.ndarray, int]] = None
+
+    # ──────────────────────────────────────────────────────────────────────
+    # Public API (GUI thread)
+    # ──────────────────────────────────────────────────────────────────────
+
+    def set_video(self, video_path: Optional[str]) -> None:
+        """Switch the worker to another video (or close it with None)."""
+        self._mutex.lock()
+        try:
+            self._video_path = video_path
+            self._video_changed = True
+            self._pending_seek = None
+            self._result = None
+            self._generation += 1
+            self._wake.wakeOne()
+        finally:
+            self._mutex.unlock()
+        self._ensure_running()
+
+    def request_seek(self, frame_idx: int) -> None:
+        """Ask for a frame; replaces any request not yet picked up."""
+        self._mutex.lock()
+        try:
+            self._pending_seek = int(frame_idx)
+            self._generation += 1
+            self._wake.wakeOne()
+        finally:
+            self._mutex.unlock()
+        self._ensure_running()
+
+    def take_frame(self) -> Optional[Tuple[int, np.ndarray, int]]:
+        """Take the latest result (frame_idx, frame, generation), if any."""
+        self._mutex.lock()
+        try:
+            result, self._result = self._result, None
+        finally:
+            self._mutex.unlock()
+        return result
+
+    def is_current(self, generation: int) -> bool:
+        """True if no request was made after the one with this generation."""
+        return generation == self._generation
+
+    def stop(self) -> None:
+        """Stop the thread and wait for it to finish."""
+        self._mutex.lock()
+        try:
+            self._stopping = True
+            self._wake.wakeOne()
+        finally:
+            self._mutex.unlock()
+        if self.isRunning():
+            self.wait()
+
+    # ──────────────────────────────────────────────────────────────────────
+    # Worker loop
+    # ──────────────────────────────────────────────────────────────────────
+
+    def _ensure_running(self) -> None:
+        if not self.isRunning() and not self._stopping:
+            self.start()
+
+    def run(self) -> None:
+        service = VideoService()
+        try:
+            while True:
+                self._mutex.lock()
+                try:
+                    while (not self._stopping
+                           and self._pending_seek is None
+                           and not self._video_changed):
+                        self._wake.wait(self._mutex)
+                    if self._stopping:
+                        return
+
+                    video_changed = self._video_changed
+                    video_path = self._video_path
+                    self._video_changed = False
+
+                    frame_idx = self._pending_seek
+                    self._pending_seek = None
+                    generation = self._generation
+                finally:
+                    self._mutex.unlock()
+
+                if video_changed:
+                    service.cleanup()
+                    if video_path:
+                        try:
+                            service.load_video(video_path)
+                        except Exception as e:
+                            print(f"[FrameSeekWorker] Failed to open video: {e}")
+
+                if frame_idx is None:
+                    continue
+
+                frame = service.try_get_frame(frame_idx)
+                # A newer seek arrived during decoding — this frame is stale
+                if frame is not None and self.is_current(generation):
+                    self._publish((frame_idx, frame, generation))
+        finally:
+            service.cleanup()
+
+    def _publish(self, result: Tuple[int, np.ndarray, int]) -> None:
+        self._mutex.lock()
+        try:
+            notify = self._result is None
+            self._result = result
+        finally:
+            self._mutex.unlock()
+        # Slot was already full: the pending notification will pick this up
+        if notify:
+            self.frame_ready.emit()
@@ -1,3 +1,9 @@
+import re
+
+# HH:MM:SS[.mmm] — все поля за один проход, без промежуточных списков
+_TIME_PARSE = re.compile(r"(\d+):(\d+):(\d+)(?:\.(\d+))?")
+
+
 def frames_to_time(frames: int, fps: float) -> str:
     """Convert frame count to time string (HH:MM:SS.mmm)."""
     if fps <= 0:
@@ -13,19 +19,13 @@ def frames_to_time(frames: int, fps: float) -> str:
 
 def time_to_frames(time_str: str, fps: float) -> int:
     """Convert time string (HH:MM:SS.mmm) to frame count."""
-    try:
-        parts = time_str.split(':')
-        if len(parts) != 3:
-            return 0
-        
-        hours = int(parts[0])
-        minutes = int(parts[1])
-        
-        seconds_parts = parts[2].split('.')
-        seconds = int(seconds_parts[0])
-        milliseconds = int(seconds_parts[1]) if len(seconds_parts) > 1 else 0
-        
-        total_seconds = hours * 3600 + minutes * 60 + seconds + milliseconds / 1000.0
-        return int(total_seconds * fps)
-    except (ValueError, IndexError):
+    m = _TIME_PARSE.fullmatch(time_str.strip())
+    if m is None:
         return 0
+
+    hours, minutes, seconds, milliseconds = m.groups("0")
+    total_seconds = (
+        int(hours) * 3600 + int(minutes) * 60 + int(seconds)
+        + int(milliseconds) / 1000.0
+    )
+    return int(total_seconds * fps)
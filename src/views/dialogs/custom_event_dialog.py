@@ -2,7 +2,7 @@
 Диалог управления пользовательскими типами событий.
 """
 
-from typing import Optional
+from typing import Dict, Optional
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QListWidget, QListWidgetItem,
     QPushButton, QMessageBox, QInputDialog, QColorDialog, QFormLayout,
@@ -16,6 +16,10 @@ from services.events.custom_event_manager import CustomEventManager, get_custom_
 from services.events.custom_event_type import CustomEventType
 
 
+# Цвет текста стандартных событий — один общий экземпляр
+_DEFAULT_EVENT_FOREGROUND = QColor("#aaaaaa")
+
+
 class CustomEventDialog(QDialog):
     """Диалог добавления/редактирования типа события."""
 
@@ -121,6 +125,9 @@ class CustomEventManagerDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.manager: CustomEventManager = get_custom_event_manager()
+        # Иконки-образцы цвета: рисуются один раз на цвет, а не при
+        # каждом перестроении списка
+        self._color_icons: Dict[str, QIcon] = {}
 
         self.setWindowTitle('Управление типами событий')
         self.setModal(True)
@@ -179,10 +186,6 @@ class CustomEventManagerDialog(QDialog):
         for event in self.manager.get_all_events():
             item = QListWidgetItem()
 
-            pixmap = QPixmap(20, 20)
-            pixmap.fill(event.get_qcolor())
-            icon = QIcon(pixmap)
-
             localized = event.get_localized_name()
             text = f"{localized}"
             if event.shortcut:
@@ -194,17 +197,25 @@ class CustomEventManagerDialog(QDialog):
             if localized != event.name:
                 text += f"  ({event.name})"
 
-            item.setIcon(icon)
+            item.setIcon(self._color_icon(event))
             item.setText(text)
             item.setData(Qt.UserRole, event.name)
 
             # Пометить стандартные события серым
             is_default = self.manager.is_default_event(event.name)
             if is_default:
-                item.setForeground(QColor("#aaaaaa"))
+                item.setForeground(_DEFAULT_EVENT_FOREGROUND)
 
             self.event_list.addItem(item)
 
+    def _color_icon(self, event: CustomEventType) -> QIcon:
+        icon = self._color_icons.get(event.color)
+        if icon is None:
+            pixmap = QPixmap(20, 20)
+            pixmap.fill(event.get_qcolor())
+            icon = self._color_icons[event.color] = QIcon(pixmap)
+        return icon
+
     def _on_selection_changed(self) -> None:
         selected = self.event_list.selectedItems()
         has_selection = len(selected) > 0
@@ -212,13 +223,11 @@ class CustomEventManagerDialog(QDialog):
         self.edit_btn.setEnabled(has_selection)
 
         if has_selection:
+            # UserRole элемента — и есть имя события: отдельный get_event()
+            # не нужен, проверка по кэшированному множеству стандартных имён
             event_name = selected[0].data(Qt.UserRole)
-            event = self.manager.get_event(event_name)
-            if event is None:
-                self.delete_btn.setEnabled(False)
-                return
-            is_default = self.manager.is_default_event(event.name)
-            self.delete_btn.setEnabled(not is_default)
+            is_default = self.manager.is_default_event(event_name)
+            self.delete_btn.setEnabled(bool(event_name) and not is_default)
         else:
             self.delete_btn.setEnabled(False)
 
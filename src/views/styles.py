@@ -3,6 +3,7 @@ Styles module for Hockey Editor application.
 Provides color constants and application-wide stylesheet.
 """
 
+from functools import lru_cache
 from typing import Dict
 
 
@@ -59,9 +60,23 @@ class AppColors:
     BORDER_FOCUS = "#1a4d7a"
 
 
+def set_style_sheet(widget, stylesheet: str) -> None:
+    """Apply a stylesheet only if it differs from the current one.
+
+    setStyleSheet() re-parses the QSS and repolishes the widget even for
+    an identical string, so callers that restyle on every update should
+    go through this helper.
+    """
+    if widget.styleSheet() != stylesheet:
+        widget.setStyleSheet(stylesheet)
+
+
+@lru_cache(maxsize=1)
 def get_application_stylesheet() -> str:
     """Return the global application stylesheet.
 
+    The palette is static, so the QSS is built once and reused.
+
     Returns:
         QString containing the complete QSS stylesheet
     """
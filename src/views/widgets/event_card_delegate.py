@@ -40,6 +40,8 @@ class EventCardDelegate(QStyledItemDelegate):
         self._info_font.setFamily("Monospace")
 
     def set_fps(self, fps: float):
+        """FPS для подписей времени — задаёт владелец вместе с моделью
+        (не запрашивается у модели при каждой отрисовке строки)."""
         self._fps = fps if fps > 0 else 30.0
 
     def paint(self, painter: QPainter, option: QStyleOptionViewItem, index):
@@ -57,11 +59,6 @@ class EventCardDelegate(QStyledItemDelegate):
             if marker is None:
                 return
 
-            # FIX: Получить FPS из модели (если делегату не установили)
-            model_fps = index.data(Qt.ItemDataRole.UserRole + 1)
-            if model_fps and isinstance(model_fps, (int, float)) and model_fps > 0:
-                self._fps = float(model_fps)
-
             rect = option.rect
             is_selected = bool(option.state & QStyle.StateFlag.State_Selected)
             is_hovered = (self._hovered_row == index.row())
@@ -258,9 +255,7 @@ class EventCardDelegate(QStyledItemDelegate):
     def _get_event_display_name(self, event_name: str) -> str:
         event_manager = get_custom_event_manager()
         if event_manager:
-            event = event_manager.get_event(event_name)
-            if event:
-                return event.get_localized_name()
+            return event_manager.get_display_name(event_name)
         return event_name
 
     def _format_time(self, seconds: float) -> str:
@@ -83,7 +83,7 @@ class EventShortcutListWidget(QWidget):
 
         for event in self.event_manager.get_all_events():
             localized = event.get_localized_name()
-            shortcut = (event.shortcut or "").upper()
+            shortcut = event.shortcut_upper
 
             if shortcut:
                 text = f"  [{shortcut}]  {localized}"
@@ -162,7 +162,7 @@ class EventShortcutListWidget(QWidget):
         ):
             conflicting = None
             for e in self.event_manager.get_all_events():
-                if e.name != event_name and (e.shortcut or "").upper() == new_shortcut:
+                if e.name != event_name and e.shortcut_upper == new_shortcut:
                     conflicting = e
                     break
 
@@ -177,10 +177,12 @@ class EventShortcutListWidget(QWidget):
                 )
                 if reply == QMessageBox.Yes:
                     cleared_conf = replace(conflicting, shortcut="")
-                    self.event_manager.update_event(conflicting.name, cleared_conf)
-
                     updated = replace(event, shortcut=new_shortcut)
-                    if self.event_manager.update_event(event_name, updated):
+                    _, ok = self.event_manager.update_events([
+                        (conflicting.name, cleared_conf),
+                        (event_name, updated),
+                    ])
+                    if ok:
                         QMessageBox.information(
                             self, "Успех",
                             f"Клавиша «{new_shortcut}» переназначена "
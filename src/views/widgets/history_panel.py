@@ -7,16 +7,87 @@ from __future__ import annotations
 
 from typing import Optional
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QListWidget, QListWidgetItem, QFrame,
+    QPushButton, QListView, QFrame,
 )
 from PySide6.QtGui import QColor
 
 from services.history.history_manager import HistoryManager, get_history_manager
 
 
+# Цвета строк — общие экземпляры вместо нового QColor на каждую строку
+_REDO_COLOR = QColor("#666666")
+_UNDO_COLOR = QColor("#cccccc")
+_SEPARATOR_COLOR = QColor("#00cc88")
+_SEPARATOR_TEXT = "── текущее состояние ──"
+
+
+class _HistoryListModel(QAbstractListModel):
+    """Строки панели поверх стеков HistoryManager.
+
+    Хранит только ссылку на менеджер: строки не создаются заранее,
+    представление запрашивает текст лишь видимых элементов, а изменение
+    истории — это один сброс модели вместо пересоздания всех элементов.
+    """
+
+    def __init__(self, history: HistoryManager, parent=None):
+        super().__init__(parent)
+        self._history = history
+        self._redo_count = 0
+        self._undo_count = 0
+        self._has_separator = False
+
+    def refresh(self) -> None:
+        self.beginResetModel()
+        self._redo_count = self._history.redo_count
+        self._undo_count = self._history.history_count
+        self._has_separator = bool(self._redo_count or self._undo_count)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return self._redo_count + self._has_separator + self._undo_count
+
+    def _row_kind(self, row: int) -> Optional[str]:
+        if row < self._redo_count:
+            return "redo"
+        if self._has_separator and row == self._redo_count:
+            return None
+        return "undo"
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        kind = self._row_kind(row)
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if kind == "redo":
+                # Сверху — самые дальние redo, у разделителя — ближайшая
+                return f"  ↪ {self._history.redo_text_at(row)}"
+            if kind == "undo":
+                depth = row - self._redo_count - self._has_separator
+                return f"  ↩ {self._history.undo_text_at(depth)}"
+            return _SEPARATOR_TEXT
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if kind == "redo":
+                return _REDO_COLOR
+            if kind == "undo":
+                return _UNDO_COLOR
+            return _SEPARATOR_COLOR
+        if role == Qt.ItemDataRole.UserRole:
+            return kind
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid() or self._row_kind(index.row()) is None:
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+
 class HistoryPanel(QWidget):
     """
     Виджет панели истории.
@@ -82,27 +153,30 @@ class HistoryPanel(QWidget):
         layout.addWidget(line)
 
         # ── Command list (без ограничения высоты) ──
-        self._list = QListWidget()
+        self._model = _HistoryListModel(self._history, self)
+        self._list = QListView()
+        self._list.setModel(self._model)
+        self._list.setUniformItemSizes(True)
         self._list.setStyleSheet("""
-            QListWidget {
+            QListView {
                 background-color: #1a1a1a;
                 border: 1px solid #333333;
                 border-radius: 4px;
                 font-size: 11px;
             }
-            QListWidget::item {
+            QListView::item {
                 padding: 3px 6px;
                 border-bottom: 1px solid #2a2a2a;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: #0d47a1;
                 color: white;
             }
-            QListWidget::item:hover {
+            QListView::item:hover {
                 background-color: #333333;
             }
         """)
-        self._list.itemClicked.connect(self._on_item_clicked)
+        self._list.clicked.connect(self._on_item_clicked)
         layout.addWidget(self._list, 1)
 
     def _style_button(self, btn: QPushButton) -> None:
@@ -135,7 +209,7 @@ class HistoryPanel(QWidget):
         self._history.state_changed.connect(self._refresh)
 
     def _refresh(self) -> None:
-        """Перестроить список и обновить кнопки."""
+        """Обновить список и кнопки."""
         self._undo_btn.setEnabled(self._history.can_undo)
         self._redo_btn.setEnabled(self._history.can_redo)
         self._clear_btn.setEnabled(
@@ -158,37 +232,11 @@ class HistoryPanel(QWidget):
             self._redo_btn.setToolTip("Нечего повторять")
 
         # Counter
-        total = self._history.history_count + len(self._history.redo_history)
+        total = self._history.history_count + self._history.redo_count
         self._count_label.setText(f"{total} команд" if total else "")
 
-        # ── Rebuild list ──
-        self._list.blockSignals(True)
-        self._list.clear()
-
-        # Redo items (сверху, тусклые)
-        redo_names = list(reversed(self._history.redo_history))
-        for name in redo_names:
-            item = QListWidgetItem(f"  ↪ {name}")
-            item.setForeground(QColor("#666666"))
-            item.setData(Qt.ItemDataRole.UserRole, "redo")
-            self._list.addItem(item)
-
-        # Separator: текущая позиция
-        if self._history.can_undo or self._history.can_redo:
-            sep_item = QListWidgetItem("── текущее состояние ──")
-            sep_item.setForeground(QColor("#00cc88"))
-            sep_item.setFlags(Qt.ItemFlag.NoItemFlags)
-            self._list.addItem(sep_item)
-
-        # Undo items (снизу, яркие)
-        undo_names = self._history.undo_history  # от новых к старым
-        for name in undo_names:
-            item = QListWidgetItem(f"  ↩ {name}")
-            item.setForeground(QColor("#cccccc"))
-            item.setData(Qt.ItemDataRole.UserRole, "undo")
-            self._list.addItem(item)
-
-        self._list.blockSignals(False)
+        # ── List: модель читает стеки истории напрямую ──
+        self._model.refresh()
 
     def _on_undo(self) -> None:
         self._history.undo()
@@ -199,7 +247,7 @@ class HistoryPanel(QWidget):
     def _on_clear(self) -> None:
         self._history.clear()
 
-    def _on_item_clicked(self, item: QListWidgetItem) -> None:
+    def _on_item_clicked(self, index: QModelIndex) -> None:
         """Клик по элементу — множественный undo/redo до этой позиции.
 
         FIX: blockSignals на history_manager во время batch-операции.
@@ -209,12 +257,12 @@ class HistoryPanel(QWidget):
         - N перестроений списка (state_changed → _refresh)
         - Бесконечный цикл в ToastManager._show
         """
-        role = item.data(Qt.ItemDataRole.UserRole)
+        role = index.data(Qt.ItemDataRole.UserRole)
         if role is None:
             return
 
-        row = self._list.row(item)
-        redo_count = len(self._history.redo_history)
+        row = index.row()
+        redo_count = self._history.redo_count
 
         # === FIX: Блокировать ВСЕ сигналы history_manager на время batch ===
         self._history.blockSignals(True)
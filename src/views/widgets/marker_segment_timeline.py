@@ -195,7 +195,7 @@ class MarkerSegmentTimelineWidget(QGraphicsView):
             if event_manager:
                 event = event_manager.get_event(marker.event_name)
                 if event:
-                    marker_color = QColor(event.color)
+                    marker_color = event.get_qcolor()
 
             # Draw vertical line for marker
             line = self.scene.addLine(x_pos, marker_y_start, x_pos, marker_y_end,
@@ -237,7 +237,8 @@ class MarkerSegmentTimelineWidget(QGraphicsView):
             if event_manager:
                 event = event_manager.get_event(event_name)
                 if event:
-                    segment_color = QColor(event.color)
+                    # Копия: ниже меняется альфа
+                    segment_color = QColor(event.get_qcolor())
 
             # Semi-transparent fill
             segment_color.setAlpha(180)
@@ -114,10 +114,10 @@ class PlayerControls(QWidget):
             self.speed_combo.setCurrentText(closest)
 
     def update_time_label(self, current_sec: float, total_sec: float) -> None:
-        """Обновить отображение времени."""
-        self.time_label.setText(
-            f"{self._fmt(current_sec)} / {self._fmt(total_sec)}"
-        )
+        """Обновить отображение времени (без setText, если текст тот же)."""
+        text = f"{self._fmt(current_sec)} / {self._fmt(total_sec)}"
+        if text != self.time_label.text():
+            self.time_label.setText(text)
 
     def set_duration(self, total_frames: int) -> None:
         pass
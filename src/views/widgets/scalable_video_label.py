@@ -13,10 +13,9 @@ from PySide6.QtGui import (
     QPainter, QPixmap, QImage, QPaintEvent, QResizeEvent,
     QColor, QPen, QFont, QFontMetrics, QLinearGradient, QBrush
 )
-from PySide6.QtCore import Qt, QRect, QRectF, QSize, QTimer, QPointF
+from PySide6.QtCore import Qt, QRect, QRectF, QSize, QTimer, QPointF, Signal
 from typing import Optional
 import math
-import cv2
 import numpy as np
 
 
@@ -26,8 +25,14 @@ class ScalableVideoLabel(QWidget):
 
     При отсутствии видео показывает анимированную заглушку
     с пунктирной рамкой и подсказкой «Перетащите видеофайл сюда».
+
+    Signals:
+        frame_presented — кадр отрисован (используется для пейсинга
+                          воспроизведения в PlaybackController)
     """
 
+    frame_presented = Signal()
+
     # ── Цвета заглушки ──
     COLOR_BG_TOP = QColor("#1a1a1a")
     COLOR_BG_BOTTOM = QColor("#111111")
@@ -44,12 +49,21 @@ class ScalableVideoLabel(QWidget):
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
 
-        # Текущий кадр
+        # Текущий кадр: либо QImage (рисуется напрямую), либо QPixmap
+        self._current_image: Optional[QImage] = None
         self._current_pixmap: Optional[QPixmap] = None
-        self._scaled_pixmap: Optional[QPixmap] = None
         self._pixmap_rect: Optional[QRect] = None
         self._needs_scaling_update: bool = True
 
+        # Быстрое масштабирование (во время воспроизведения / ресайза);
+        # сглаженное — после паузы или когда ресайз «устоялся»
+        self._fast_scaling: bool = False
+        self._resizing: bool = False
+        self._resize_settle_timer = QTimer(self)
+        self._resize_settle_timer.setSingleShot(True)
+        self._resize_settle_timer.setInterval(200)
+        self._resize_settle_timer.timeout.connect(self._on_resize_settled)
+
         # Состояние заглушки
         self._is_drag_hovering: bool = False
 
@@ -77,57 +91,75 @@ class ScalableVideoLabel(QWidget):
 
     def set_frame(self, frame) -> None:
         if frame is None:
-            self._current_pixmap = None
-            self._scaled_pixmap = None
-            self._pixmap_rect = None
-            self._needs_scaling_update = True
-            self._start_animation_if_needed()
-            self.update()
+            self.clear()
             return
 
         try:
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            h, w, ch = frame_rgb.shape
-            bytes_per_line = ch * w
-            qt_image = QImage(frame_rgb.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-            self._current_pixmap = QPixmap.fromImage(qt_image)
-            self._needs_scaling_update = True
-            self._stop_animation()
-            self.update()
+            h, w = frame.shape[:2]
+            # BGR888: Qt читает кадр OpenCV как есть, без cvtColor;
+            # copy(): QImage не должен ссылаться на numpy-буфер
+            qt_image = QImage(frame.data, w, h, frame.strides[0], QImage.Format.Format_BGR888)
+            self.set_image(qt_image.copy())
         except Exception:
-            self._current_pixmap = None
-            self._scaled_pixmap = None
-            self._pixmap_rect = None
-            self._needs_scaling_update = True
-            self._start_animation_if_needed()
-            self.update()
+            self.clear()
+
+    def set_image(self, image: QImage) -> None:
+        """Показать кадр как QImage — рисуется напрямую, без QPixmap."""
+        if image is None or image.isNull():
+            self._set_source(None, None)
+        else:
+            self._set_source(image, None)
 
     def setPixmap(self, pixmap: QPixmap) -> None:
         if pixmap is None or pixmap.isNull():
-            self._current_pixmap = None
-            self._scaled_pixmap = None
-            self._pixmap_rect = None
-            self._needs_scaling_update = True
-            self._start_animation_if_needed()
+            self._set_source(None, None)
         else:
-            self._current_pixmap = pixmap
-            self._needs_scaling_update = True
-            self._stop_animation()
-        self.update()
+            self._set_source(None, pixmap)
 
     def pixmap(self) -> Optional[QPixmap]:
+        if self._current_image is not None:
+            return QPixmap.fromImage(self._current_image)
         return self._current_pixmap
 
     def clear(self) -> None:
-        self._current_pixmap = None
-        self._scaled_pixmap = None
-        self._pixmap_rect = None
-        self._needs_scaling_update = True
-        self._start_animation_if_needed()
-        self.update()
+        self._set_source(None, None)
 
     def has_video(self) -> bool:
-        return self._current_pixmap is not None and not self._current_pixmap.isNull()
+        return self._current_image is not None or self._current_pixmap is not None
+
+    def _source(self):
+        """Текущий источник кадра (QImage или QPixmap) или None."""
+        if self._current_image is not None:
+            return self._current_image
+        return self._current_pixmap
+
+    def _set_source(self, image: Optional[QImage], pixmap: Optional[QPixmap]) -> None:
+        old = self._source()
+        self._current_image = image
+        self._current_pixmap = pixmap
+        new = self._source()
+
+        if new is None:
+            self._pixmap_rect = None
+            self._needs_scaling_update = True
+            self._start_animation_if_needed()
+        else:
+            if old is None or old.size() != new.size():
+                self._needs_scaling_update = True
+            self._stop_animation()
+        self.update()
+
+    def set_fast_scaling(self, enabled: bool) -> None:
+        """Включить быстрое (nearest) масштабирование.
+
+        При выключении текущий кадр один раз перерисовывается
+        со сглаживанием.
+        """
+        if self._fast_scaling == enabled:
+            return
+        self._fast_scaling = enabled
+        if not enabled:
+            self.update()
 
     # ══════════════════════════════════════════════════════════════════
     #  Drag & Drop visual feedback
@@ -162,9 +194,15 @@ class ScalableVideoLabel(QWidget):
 
     def resizeEvent(self, event: QResizeEvent) -> None:
         super().resizeEvent(event)
+        self._resizing = True
+        self._resize_settle_timer.start()
         self._needs_scaling_update = True
         self.update()
 
+    def _on_resize_settled(self) -> None:
+        self._resizing = False
+        self.update()
+
     def paintEvent(self, event: QPaintEvent) -> None:
         super().paintEvent(event)
         painter = QPainter(self)
@@ -188,19 +226,34 @@ class ScalableVideoLabel(QWidget):
 
         painter.fillRect(self.rect(), Qt.GlobalColor.black)
 
-        if self._scaled_pixmap and not self._scaled_pixmap.isNull() and self._pixmap_rect:
-            painter.drawPixmap(self._pixmap_rect, self._scaled_pixmap)
+        if self._pixmap_rect:
+            # Масштабируем при отрисовке, без промежуточной уменьшенной копии
+            painter.setRenderHint(
+                QPainter.RenderHint.SmoothPixmapTransform,
+                not (self._fast_scaling or self._resizing),
+            )
+            if self._current_image is not None:
+                painter.drawImage(
+                    self._pixmap_rect, self._current_image, self._current_image.rect()
+                )
+            else:
+                painter.drawPixmap(
+                    self._pixmap_rect, self._current_pixmap, self._current_pixmap.rect()
+                )
+
+        self.frame_presented.emit()
 
     def _update_scaling(self) -> None:
-        if not self._current_pixmap or self._current_pixmap.isNull():
-            self._scaled_pixmap = None
+        """Пересчитать прямоугольник вписывания кадра в виджет."""
+        source = self._source()
+        if source is None:
             self._pixmap_rect = None
             return
 
         widget_w = self.width()
         widget_h = self.height()
-        pix_w = self._current_pixmap.width()
-        pix_h = self._current_pixmap.height()
+        pix_w = source.width()
+        pix_h = source.height()
 
         scale = min(widget_w / pix_w, widget_h / pix_h)
         scaled_w = int(pix_w * scale)
@@ -208,11 +261,6 @@ class ScalableVideoLabel(QWidget):
         x = (widget_w - scaled_w) // 2
         y = (widget_h - scaled_h) // 2
 
-        self._scaled_pixmap = self._current_pixmap.scaled(
-            scaled_w, scaled_h,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
         self._pixmap_rect = QRect(x, y, scaled_w, scaled_h)
 
     # ══════════════════════════════════════════════════════════════════
@@ -341,8 +389,9 @@ class ScalableVideoLabel(QWidget):
     # ══════════════════════════════════════════════════════════════════
 
     def sizeHint(self) -> QSize:
-        if self._current_pixmap and not self._current_pixmap.isNull():
-            return self._current_pixmap.size()
+        source = self._source()
+        if source is not None:
+            return source.size()
         return QSize(640, 360)
 
     def minimumSizeHint(self) -> QSize:
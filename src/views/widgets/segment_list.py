@@ -21,10 +21,10 @@ Important:
 
 from __future__ import annotations
 
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from PySide6.QtCore import Qt, Signal, QModelIndex
-from PySide6.QtGui import QFont, QColor, QMouseEvent
+from PySide6.QtCore import Qt, Signal, QModelIndex, QItemSelection, QItemSelectionModel
+from PySide6.QtGui import QFont, QColor, QMouseEvent, QPixmap, QPainter, QIcon
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QTableView, QHeaderView,
@@ -77,6 +77,10 @@ class SegmentListWidget(QWidget):
 
         self._building_table: bool = False
 
+        # Иконки-кружки меню выбора типа по цвету: рисуются один раз,
+        # а не заново при каждом открытии меню
+        self._color_icon_cache: Dict[str, QIcon] = {}
+
         # Модель данных
         self._model = SegmentTableModel(self)
 
@@ -257,6 +261,10 @@ class SegmentListWidget(QWidget):
         finally:
             self._building_table = False
 
+    def refresh_rows(self) -> None:
+        """Перечитать строки: маркеры изменены на месте, состав тот же."""
+        self._model.refresh_rows()
+
     def set_markers(self, markers: List[Marker]) -> None:
         """Compatibility method: set unindexed markers."""
         self.set_segments([(i, m) for i, m in enumerate(markers)])
@@ -279,6 +287,37 @@ class SegmentListWidget(QWidget):
                 indices.append(orig)
         return sorted(indices)
 
+    def select_original_indices(self, original_indices: Iterable[int]) -> None:
+        """Выделить строки по оригинальным индексам одной операцией.
+
+        Непрерывные серии строк собираются в диапазоны QItemSelection,
+        поэтому selectionChanged приходит один раз, а не на каждую строку.
+        """
+        selection_model = self.table.selectionModel()
+        if selection_model is None:
+            return
+
+        selection = QItemSelection()
+        last_col = self._model.columnCount() - 1
+        run_start = run_end = -1
+        for row in self._model.rows_for_original_indices(original_indices):
+            if row == run_end + 1 and run_start >= 0:
+                run_end = row
+                continue
+            if run_start >= 0:
+                selection.select(self._model.index(run_start, 0),
+                                 self._model.index(run_end, last_col))
+            run_start = run_end = row
+        if run_start >= 0:
+            selection.select(self._model.index(run_start, 0),
+                             self._model.index(run_end, last_col))
+
+        selection_model.select(
+            selection,
+            QItemSelectionModel.SelectionFlag.ClearAndSelect
+            | QItemSelectionModel.SelectionFlag.Rows,
+        )
+
     def get_selected_count(self) -> int:
         """Количество выделенных строк."""
         return len(self.table.selectionModel().selectedRows())
@@ -404,11 +443,10 @@ class SegmentListWidget(QWidget):
         menu.setStyleSheet(self._get_context_menu_style())
 
         for event in events:
-            color = QColor(event.color) if hasattr(event, 'color') else QColor("#ffffff")
             action = menu.addAction(f"● {event.get_localized_name()}")
             action.setData(event.name)
             # Цветной индикатор через стиль текста
-            action.setIcon(self._create_color_icon(color))
+            action.setIcon(self._color_icon(event))
 
         chosen = menu.exec(self._change_type_btn.mapToGlobal(
             self._change_type_btn.rect().bottomLeft()
@@ -418,9 +456,17 @@ class SegmentListWidget(QWidget):
             return chosen.data()
         return None
 
-    def _create_color_icon(self, color: QColor):
+    def _color_icon(self, event) -> QIcon:
+        """Иконка-кружок цвета события (из кэша по строке цвета)."""
+        icon = self._color_icon_cache.get(event.color)
+        if icon is None:
+            icon = self._create_color_icon(event.get_qcolor())
+            self._color_icon_cache[event.color] = icon
+        return icon
+
+    @staticmethod
+    def _create_color_icon(color: QColor) -> QIcon:
         """Создать маленькую иконку-кружок заданного цвета."""
-        from PySide6.QtGui import QPixmap, QPainter, QIcon
         pixmap = QPixmap(12, 12)
         pixmap.fill(Qt.transparent)
         painter = QPainter(pixmap)
@@ -573,6 +619,5 @@ class SegmentListWidget(QWidget):
 
     @staticmethod
     def _format_time(seconds: float) -> str:
-        minutes = int(seconds) // 60
-        secs = int(seconds) % 60
+        minutes, secs = divmod(int(seconds), 60)
         return f"{minutes:02d}:{secs:02d}"
\ No newline at end of file
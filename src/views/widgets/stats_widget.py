@@ -225,7 +225,7 @@ class StatsWidget(QWidget):
         for event_name, count, total_sec, avg_sec in stats:
             event = self._event_manager.get_event(event_name)
             display_name = event.get_localized_name() if event else event_name
-            color = QColor(event.color) if event else QColor("#888888")
+            color = event.get_qcolor() if event else QColor("#888888")
             ratio = count / max_count if max_count > 0 else 0
 
             bar = StatBar(
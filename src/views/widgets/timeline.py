@@ -4,7 +4,7 @@ Timeline Widget - professional timeline graphics with zoom controls.
 
 from __future__ import annotations
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGraphicsView, QGraphicsScene,
@@ -31,6 +31,44 @@ ZOOM_FACTOR = 1.3     # множитель при одном шаге колёс
 TIME_STEPS = [1, 2, 5, 10, 15, 30, 60, 120, 300, 600, 900, 1800, 3600]
 
 
+# Цвет сегмента неизвестного события — один общий экземпляр (не изменять)
+_UNKNOWN_EVENT_COLOR = QColor("#888888")
+
+
+# Шрифты отрисовки с метриками: создаются один раз на (семейство, размер,
+# жирность), а не в каждом paint(). Лениво — QFont нужен QGuiApplication.
+_FONTS: Dict[Tuple[str, int, bool], Tuple[QFont, QFontMetrics]] = {}
+
+
+def _font_with_metrics(family: str, size: int, bold: bool = False) -> Tuple[QFont, QFontMetrics]:
+    key = (family, size, bold)
+    cached = _FONTS.get(key)
+    if cached is None:
+        font = QFont(family, size, QFont.Bold) if bold else QFont(family, size)
+        cached = _FONTS[key] = (font, QFontMetrics(font))
+    return cached
+
+
+# Заливка сегмента (обычная, при наведении) по цвету события: у сотен
+# сегментов обычно лишь несколько цветов — кисти общие, а не новые в paint()
+_SEGMENT_BRUSHES: Dict[int, Tuple[QBrush, QBrush]] = {}
+
+# Рамка выделенного сегмента
+_SELECTED_SEGMENT_PEN = QPen(QColor(Qt.white), 2, Qt.SolidLine, Qt.RoundCap)
+
+
+def _segment_brushes(color: QColor) -> Tuple[QBrush, QBrush]:
+    key = color.rgba()
+    cached = _SEGMENT_BRUSHES.get(key)
+    if cached is None:
+        fill = QColor(color)
+        fill.setAlpha(200)
+        hover = color.lighter(120)
+        hover.setAlpha(200)
+        cached = _SEGMENT_BRUSHES[key] = (QBrush(fill), QBrush(hover))
+    return cached
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Helpers: view / scroll
 # ──────────────────────────────────────────────────────────────────────────────
@@ -64,7 +102,7 @@ class SegmentGraphicsItem(QGraphicsRectItem):
         self.setFlag(QGraphicsItem.ItemIsSelectable, True)
 
         event = get_custom_event_manager().get_event(marker.event_name)
-        self.event_color = QColor(event.color) if event else QColor("#888888")
+        self.event_color = event.get_qcolor() if event else _UNKNOWN_EVENT_COLOR
         self.is_hovered = False
         self.setToolTip(self._full_tooltip())
 
@@ -72,12 +110,11 @@ class SegmentGraphicsItem(QGraphicsRectItem):
         note = (self.marker.note or "").strip()
         if note:
             return note
-        event = get_custom_event_manager().get_event(self.marker.event_name)
-        return event.get_localized_name() if event else self.marker.event_name
+        # Имя кэшируется менеджером — paint() вызывается на каждую перерисовку
+        return get_custom_event_manager().get_display_name(self.marker.event_name)
 
     def _full_tooltip(self) -> str:
-        event = get_custom_event_manager().get_event(self.marker.event_name)
-        event_name = event.get_localized_name() if event else self.marker.event_name
+        event_name = get_custom_event_manager().get_display_name(self.marker.event_name)
         note = (self.marker.note or "").strip()
         return f"{note}\n({event_name})" if note else event_name
 
@@ -87,29 +124,24 @@ class SegmentGraphicsItem(QGraphicsRectItem):
         painter.save()
         painter.setClipRect(rect)
 
-        fill = QColor(self.event_color)
-        if self.is_hovered:
-            fill = fill.lighter(120)
-        fill.setAlpha(200)
+        normal_brush, hover_brush = _segment_brushes(self.event_color)
 
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(fill))
+        painter.setBrush(hover_brush if self.is_hovered else normal_brush)
         painter.drawRoundedRect(rect, 4, 4)
 
         if self.isSelected():
-            pen = QPen(QColor(Qt.white), 2, Qt.SolidLine, Qt.RoundCap)
-            painter.setPen(pen)
+            painter.setPen(_SELECTED_SEGMENT_PEN)
             painter.setBrush(Qt.NoBrush)
             painter.drawRoundedRect(rect.adjusted(1, 1, -1, -1), 3, 3)
 
         avail = rect.width() - 8
         if avail >= 12:
             painter.setPen(QPen(Qt.white))
-            font = QFont("Segoe UI", 9)
+            font, fm = _font_with_metrics("Segoe UI", 9)
             painter.setFont(font)
 
             text = self._display_text()
-            fm = QFontMetrics(font)
             if fm.horizontalAdvance(text) > avail:
                 text = fm.elidedText(text, Qt.ElideRight, int(avail))
 
@@ -459,8 +491,7 @@ class TimelineGraphicsScene(QGraphicsScene):
         end_sec = end_frame / fps
         first_sec = int(start_sec // step_seconds) * step_seconds
 
-        font = QFont("Segoe UI", 8)
-        fm = QFontMetrics(font)
+        font, fm = _font_with_metrics("Segoe UI", 8)
         painter.setFont(font)
 
         last_text_x = float("-inf")
@@ -531,8 +562,7 @@ class TimelineGraphicsScene(QGraphicsScene):
 
         track_index: Dict[str, int] = {e.name: i for i, e in enumerate(events)}
 
-        header_font = QFont("Segoe UI", 10, QFont.Bold)
-        header_fm = QFontMetrics(header_font)
+        header_font, header_fm = _font_with_metrics("Segoe UI", 10, bold=True)
         max_header_text_w = self.header_width - 20
 
         for e in events:
@@ -681,7 +711,9 @@ class TimelineWidget(QWidget):
 
         self._markers: List[Marker] = []
         self._connect_controller_signals(controller)
-        get_custom_event_manager().events_changed.connect(lambda: self.rebuild(False))
+        # Связанный метод, а не lambda: при удалении виджета Qt сам
+        # отключит слот от долгоживущего синглтона менеджера событий
+        get_custom_event_manager().events_changed.connect(self._on_events_changed)
 
         # Обновить label после первого показа
         QTimer.singleShot(100, self._update_zoom_label)
@@ -738,6 +770,9 @@ class TimelineWidget(QWidget):
             self.scene.rebuild(animate_new)
             self._update_zoom_label()
 
+    def _on_events_changed(self) -> None:
+        self.rebuild(False)
+
     def set_current_frame(self, frame: int, fps: float) -> None:
         self.scene.update_playhead(frame)
 
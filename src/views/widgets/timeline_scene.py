@@ -23,9 +23,18 @@ except ImportError:
     from ...models.domain.marker import Marker
 
 
+class _ColoredMarker(Marker):
+    """Маркер с явным цветом отображения (add_event)."""
+
+    __slots__ = ("_display_color",)
+
+
 class EventItem(QGraphicsRectItem):
     """Rectangle item representing an event on a track."""
 
+    # Общий шрифт подписи (лениво — QFont нужен QGuiApplication)
+    _label_font: Optional[QFont] = None
+
     EVENT_COLORS = {
         "Гол": QColor(255, 100, 100),
         "Бросок в створ": QColor(100, 150, 255),
@@ -78,7 +87,9 @@ class EventItem(QGraphicsRectItem):
         label_text = marker.note if marker.note else marker.event_name[:10]
         text = QGraphicsTextItem(label_text, self)
         text.setDefaultTextColor(Qt.white)
-        text.setFont(QFont("Segoe UI", 8))
+        if EventItem._label_font is None:
+            EventItem._label_font = QFont("Segoe UI", 8)
+        text.setFont(EventItem._label_font)
         text.setPos(x + 2, y + 2)
 
         text_rect = text.boundingRect()
@@ -123,15 +134,16 @@ class EventItem(QGraphicsRectItem):
             self.setPen(QPen(QColor(60, 60, 60), 1))
 
     def _get_event_color(self, marker: Marker) -> QColor:
-        if hasattr(marker, '_display_color') and marker._display_color:
-            return marker._display_color
+        display_color = getattr(marker, '_display_color', None)
+        if display_color:
+            return display_color
         try:
             from services.events.custom_event_manager import get_custom_event_manager
             event_manager = get_custom_event_manager()
             if event_manager:
                 event = event_manager.get_event(marker.event_name)
                 if event:
-                    return QColor(event.color)
+                    return event.get_qcolor()
         except ImportError:
             pass
         return self.EVENT_COLORS.get(marker.event_name, QColor(100, 100, 200))
@@ -154,6 +166,8 @@ class TimelineScene(QGraphicsScene):
         self.fps = 30.0
 
         self.tracks = []
+        # Имя дорожки -> её индекс: поиск за O(1) на каждый маркер
+        self._track_index: Dict[str, int] = {}
         self.markers = []
         self.event_items = []
 
@@ -168,6 +182,10 @@ class TimelineScene(QGraphicsScene):
 
     def set_tracks(self, track_names: List[str]):
         self.tracks = list(track_names)
+        self._track_index = {}
+        for i, name in enumerate(self.tracks):
+            # При повторах — первая дорожка, как у list.index()
+            self._track_index.setdefault(name, i)
         self._safe_rebuild()
 
     def set_markers(self, markers: List[Marker]):
@@ -178,7 +196,7 @@ class TimelineScene(QGraphicsScene):
 
     def add_event(self, track_name: str, start_sec: float, duration_sec: float,
                   label: str = "", color: QColor = None):
-        marker = Marker(
+        marker = (_ColoredMarker if color else Marker)(
             id=0,
             start_frame=int(start_sec * self.fps),
             end_frame=int((start_sec + duration_sec) * self.fps),
@@ -280,9 +298,8 @@ class TimelineScene(QGraphicsScene):
             self._draw_single_event(marker)
 
     def _draw_single_event(self, marker: Marker):
-        try:
-            track_index = self.tracks.index(marker.event_name)
-        except ValueError:
+        track_index = self._track_index.get(marker.event_name)
+        if track_index is None:
             return
 
         event_item = EventItem(marker, track_index, self.pixels_per_second,
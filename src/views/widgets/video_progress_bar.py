@@ -91,8 +91,15 @@ class VideoProgressBar(QWidget):
     def set_current_frame(self, frame: int) -> None:
         if self._is_dragging:
             return
-        self._current_frame = max(0, min(frame, self._total_frames))
-        self.update()
+        frame = max(0, min(frame, self._total_frames))
+        if frame == self._current_frame:
+            return
+        old_x = int(self._frame_to_x(self._current_frame))
+        self._current_frame = frame
+        # При воспроизведении большинство кадров не сдвигает полоску
+        # даже на пиксель — перерисовываем только при видимом изменении
+        if int(self._frame_to_x(frame)) != old_x:
+            self.update()
 
     def set_fps(self, fps: float) -> None:
         self._fps = fps if fps > 0 else 30.0
@@ -11,6 +11,7 @@ from PySide6.QtWidgets import (
     QScrollArea, QWidget, QTabWidget, QLineEdit
 )
 from PySide6.QtCore import QUrl
+from collections import Counter
 from typing import List, Dict, Optional
 import os
 
@@ -54,6 +55,9 @@ class ExportDialog(QDialog):
         self._segment_items: List[Dict] = []
         self._all_event_types: List[str] = []
         self._event_display_names: Dict[str, str] = {}
+        # Массовая смена галочек: счётчик пересчитывается один раз в конце,
+        # а не на stateChanged каждого чекбокса
+        self._bulk_update = False
 
         self._setup_ui()
 
@@ -128,6 +132,7 @@ class ExportDialog(QDialog):
         scroll.setWidgetResizable(True)
         scroll.setMaximumHeight(200)
         scroll_widget = QWidget()
+        self._checkboxes_widget = scroll_widget
         self._checkboxes_layout = QVBoxLayout()
         self._checkboxes_layout.setContentsMargins(4, 4, 4, 4)
         self._checkboxes_layout.setSpacing(2)
@@ -318,8 +323,33 @@ class ExportDialog(QDialog):
     # ══════════════════════════════════════════════════════════════════════
 
     def set_segments(self, segments_data: List[Dict]):
+        # Перерисовка и раскладка списка — один раз после перестроения,
+        # а не на каждый добавленный/удалённый чекбокс
+        self._checkboxes_widget.setUpdatesEnabled(False)
+        try:
+            self._rebuild_checkboxes(segments_data)
+        finally:
+            self._checkboxes_widget.setUpdatesEnabled(True)
+
+        event_counts = Counter(seg["event_name"] for seg in segments_data)
+
+        self.event_type_filter.blockSignals(True)
+        self.event_type_filter.clear()
+        self.event_type_filter.addItem(f"Все типы ({len(segments_data)})")
+        for et in self._all_event_types:
+            display = self._event_display_names.get(et, et)
+            self.event_type_filter.addItem(f"{display} ({event_counts[et]})")
+        self.event_type_filter.blockSignals(False)
+
+        self._update_counter()
+
+    set_filtered_segments = set_segments
+
+    def _rebuild_checkboxes(self, segments_data: List[Dict]) -> None:
         for item in self._segment_items:
-            item["checkbox"].setParent(None)
+            cb = item["checkbox"]
+            cb.setParent(None)
+            cb.deleteLater()
         self._segment_items.clear()
 
         event_types_map: Dict[str, str] = {}  # event_name → display_name
@@ -351,19 +381,6 @@ class ExportDialog(QDialog):
         self._all_event_types = sorted(event_types_map.keys())
         self._event_display_names = event_types_map
 
-        self.event_type_filter.blockSignals(True)
-        self.event_type_filter.clear()
-        self.event_type_filter.addItem(f"Все типы ({len(segments_data)})")
-        for et in self._all_event_types:
-            cnt = sum(1 for s in segments_data if s["event_name"] == et)
-            display = event_types_map.get(et, et)
-            self.event_type_filter.addItem(f"{display} ({cnt})")
-        self.event_type_filter.blockSignals(False)
-
-        self._update_counter()
-
-    set_filtered_segments = set_segments
-
     def set_export_defaults(self, defaults: Dict):
         if not defaults:
             return
@@ -492,27 +509,41 @@ class ExportDialog(QDialog):
         if type_idx > 0 and (type_idx - 1) < len(self._all_event_types):
             selected_type = self._all_event_types[type_idx - 1]
 
-        for item in self._segment_items:
-            visible = True
-            if selected_type and item["event_name"] != selected_type:
-                visible = False
-            if search and search not in item["checkbox"].text().lower():
-                visible = False
-            item["checkbox"].setVisible(visible)
+        self._checkboxes_widget.setUpdatesEnabled(False)
+        try:
+            for item in self._segment_items:
+                visible = True
+                if selected_type and item["event_name"] != selected_type:
+                    visible = False
+                if search and search not in item["checkbox"].text().lower():
+                    visible = False
+                item["checkbox"].setVisible(visible)
+        finally:
+            self._checkboxes_widget.setUpdatesEnabled(True)
 
         self._update_counter()
 
     def _select_visible(self):
-        for item in self._segment_items:
-            if item["checkbox"].isVisible():
-                item["checkbox"].setChecked(True)
+        self._set_visible_checked(True)
 
     def _deselect_visible(self):
-        for item in self._segment_items:
-            if item["checkbox"].isVisible():
-                item["checkbox"].setChecked(False)
+        self._set_visible_checked(False)
+
+    def _set_visible_checked(self, checked: bool) -> None:
+        self._bulk_update = True
+        self._checkboxes_widget.setUpdatesEnabled(False)
+        try:
+            for item in self._segment_items:
+                if item["checkbox"].isVisible():
+                    item["checkbox"].setChecked(checked)
+        finally:
+            self._checkboxes_widget.setUpdatesEnabled(True)
+            self._bulk_update = False
+        self._update_counter()
 
     def _update_counter(self):
+        if self._bulk_update:
+            return
         total = len(self._segment_items)
         visible = sum(1 for i in self._segment_items if i["checkbox"].isVisible())
         selected = sum(
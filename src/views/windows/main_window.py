@@ -2,20 +2,20 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional, Set, TYPE_CHECKING
+from typing import Optional, Set, Union, TYPE_CHECKING
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSplitter,
     QComboBox, QCheckBox, QPushButton, QMessageBox, QFrame, QTabWidget
 )
-from PySide6.QtGui import QPixmap, QKeyEvent, QCloseEvent, QDragEnterEvent, QDropEvent
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtGui import QImage, QPixmap, QKeyEvent, QCloseEvent, QDragEnterEvent, QDropEvent
+from PySide6.QtCore import Qt, Signal, QTimer
 
 from views.widgets.player_controls import PlayerControls
 from views.widgets.segment_list import SegmentListWidget
 from views.widgets.stats_widget import StatsWidget
 from views.widgets.timeline import TimelineWidget
-from views.styles import get_application_stylesheet
+from views.styles import get_application_stylesheet, set_style_sheet
 from views.widgets.event_shortcut_list_widget import EventShortcutListWidget
 from views.widgets.toast_notification import get_toast_manager, ToastManager
 from views.widgets.history_panel import HistoryPanel
@@ -50,6 +50,28 @@ class MainWindow(QMainWindow):
     # Close lifecycle
     window_closing = Signal(object)
 
+    # Период фиксации отложенных изменений config.json на диск
+    SETTINGS_COMMIT_INTERVAL_MS = 30_000
+
+    # Подсветка кнопки сброса при активных фильтрах
+    _FILTER_RESET_ACTIVE_STYLE = """
+        QPushButton {
+            background-color: #cc6600;
+            color: #ffffff;
+            border: 1px solid #ff9900;
+            border-radius: 3px;
+            font-weight: bold;
+            padding: 2px 8px;
+        }
+        QPushButton:hover {
+            background-color: #ff8800;
+            border: 1px solid #ffaa00;
+        }
+        QPushButton:pressed {
+            background-color: #aa5500;
+        }
+    """
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
 
@@ -110,6 +132,12 @@ class MainWindow(QMainWindow):
         # Восстановить геометрию окна
         self._restore_window_geometry()
 
+        # SettingsManager копит изменения в памяти — периодически сбрасываем
+        self._settings_commit_timer = QTimer(self)
+        self._settings_commit_timer.setInterval(self.SETTINGS_COMMIT_INTERVAL_MS)
+        self._settings_commit_timer.timeout.connect(self.settings_manager.commit)
+        self._settings_commit_timer.start()
+
     # ──────────────────────────────────────────────────────────────────────────
     # Toast manager (lazy property)
     # ──────────────────────────────────────────────────────────────────────────
@@ -150,13 +178,23 @@ class MainWindow(QMainWindow):
         if self._autosave:
             self._autosave.set_save_callback(callback)
 
+    def set_autosave_prepare_callback(self, callback) -> None:
+        if self._autosave:
+            self._autosave.set_prepare_callback(callback)
+
     def set_autosave_project_dir(self, directory: str) -> None:
         if self._autosave:
             self._autosave.project_dir = directory
 
     def _on_history_changed(self) -> None:
+        # state_changed приходит и на mark_saved()/clear() — помечаем
+        # проект «грязным» только при реальных изменениях, а ручное
+        # сохранение снимает отложенное авто-сохранение
         if self._autosave:
-            self._autosave.mark_dirty()
+            if self.history_manager.is_modified:
+                self._autosave.mark_dirty()
+            else:
+                self._autosave.mark_clean()
         self._update_title_modified_indicator()
 
     def _update_title_modified_indicator(self) -> None:
@@ -558,6 +596,8 @@ class MainWindow(QMainWindow):
 
         if hasattr(controller, "save_project_silent"):
             self.set_autosave_callback(controller.save_project_silent)
+        if hasattr(controller, "prepare_autosave"):
+            self.set_autosave_prepare_callback(controller.prepare_autosave)
 
     def set_timeline_controller(self, controller) -> None:
         self._timeline_controller = controller
@@ -717,16 +757,18 @@ class MainWindow(QMainWindow):
         if self._segments_header_label:
             if is_filtered:
                 self._segments_header_label.setText(f"Отрезки: {filtered} из {total}")
-                self._segments_header_label.setStyleSheet(
-                    "color: #ff9900; font-weight: bold; font-size: 12px;"
+                set_style_sheet(
+                    self._segments_header_label,
+                    "color: #ff9900; font-weight: bold; font-size: 12px;",
                 )
             else:
                 if total > 0:
                     self._segments_header_label.setText(f"Отрезки: {total}")
                 else:
                     self._segments_header_label.setText("Отрезки:")
-                self._segments_header_label.setStyleSheet(
-                    "color: #ffffff; font-weight: bold; font-size: 12px;"
+                set_style_sheet(
+                    self._segments_header_label,
+                    "color: #ffffff; font-weight: bold; font-size: 12px;",
                 )
 
         if self._filter_indicator:
@@ -743,8 +785,9 @@ class MainWindow(QMainWindow):
 
                 filter_desc = " + ".join(filter_parts)
                 self._filter_indicator.setText(f"🔍 {filter_desc}")
-                self._filter_indicator.setStyleSheet(
-                    "color: #ff9900; font-weight: bold; font-size: 11px;"
+                set_style_sheet(
+                    self._filter_indicator,
+                    "color: #ff9900; font-weight: bold; font-size: 11px;",
                 )
                 self._filter_indicator.setToolTip(
                     f"Активные фильтры: {filter_desc}\n"
@@ -756,28 +799,12 @@ class MainWindow(QMainWindow):
 
         if self._filter_reset_btn:
             if is_filtered:
-                self._filter_reset_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #cc6600;
-                        color: #ffffff;
-                        border: 1px solid #ff9900;
-                        border-radius: 3px;
-                        font-weight: bold;
-                        padding: 2px 8px;
-                    }
-                    QPushButton:hover {
-                        background-color: #ff8800;
-                        border: 1px solid #ffaa00;
-                    }
-                    QPushButton:pressed {
-                        background-color: #aa5500;
-                    }
-                """)
+                set_style_sheet(self._filter_reset_btn, self._FILTER_RESET_ACTIVE_STYLE)
                 self._filter_reset_btn.setToolTip(
                     f"Сбросить фильтры (показано {filtered} из {total})"
                 )
             else:
-                self._filter_reset_btn.setStyleSheet("")
+                set_style_sheet(self._filter_reset_btn, "")
                 self._filter_reset_btn.setToolTip("Сбросить все фильтры")
 
     # ──────────────────────────────────────────────────────────────────────────
@@ -834,8 +861,11 @@ class MainWindow(QMainWindow):
     # Public helpers
     # ──────────────────────────────────────────────────────────────────────────
 
-    def set_video_image(self, pixmap: QPixmap) -> None:
-        self.video_label.setPixmap(pixmap)
+    def set_video_image(self, image: Union[QImage, QPixmap]) -> None:
+        if isinstance(image, QImage):
+            self.video_label.set_image(image)
+        else:
+            self.video_label.setPixmap(image)
 
     def get_player_controls(self) -> PlayerControls:
         return self.player_controls
@@ -921,8 +951,9 @@ class MainWindow(QMainWindow):
         if self._autosave:
             self._autosave.stop()
 
-        # Сохранить геометрию окна
+        # Сохранить геометрию окна и записать накопленные настройки
         self._save_window_geometry()
+        self.settings_manager.commit()
 
         # Делегировать проверку несохранённых изменений контроллеру
         # (MainController._on_window_closing покажет диалог, если нужно)
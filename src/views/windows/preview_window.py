@@ -527,6 +527,7 @@ class PreviewWindow(QMainWindow):
     def _refresh_marker_list(self):
         filtered = self.ctrl.get_filtered_markers()
         self.markers_model.set_fps(self.ctrl.fps)
+        self.markers_delegate.set_fps(self.ctrl.fps)
         self.markers_model.set_filtered_segments(filtered)
 
         row = self.markers_model.find_row_by_marker_idx(self.ctrl.current_marker_idx)
@@ -556,12 +557,14 @@ class PreviewWindow(QMainWindow):
             self.ctrl.set_event_type_filter({data})
 
     def _on_reset_filters(self):
-        self.event_filter_combo.blockSignals(True)
-        self.event_filter_combo.setCurrentIndex(0)
-        self.event_filter_combo.blockSignals(False)
-        self.notes_filter_check.setChecked(False)
-        self.search_edit.clear()
-        self.ctrl.reset_filters()
+        # Сброс чекбокса и поиска тоже меняет фильтры — обновить список один раз
+        with self.ctrl.batch_filters():
+            self.event_filter_combo.blockSignals(True)
+            self.event_filter_combo.setCurrentIndex(0)
+            self.event_filter_combo.blockSignals(False)
+            self.notes_filter_check.setChecked(False)
+            self.search_edit.clear()
+            self.ctrl.reset_filters()
 
     def _on_note_changed(self, text: str):
         self.ctrl.update_note(text)